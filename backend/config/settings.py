@@ -52,6 +52,7 @@ AUTH_USER_MODEL = 'users.User'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ClientInfoMiddleware',  # request.client_ip / client_user_agent
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Static file serving
     'corsheaders.middleware.CorsMiddleware',  # CORS handling
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -93,7 +94,10 @@ if os.getenv('DATABASE_URL'):
     DATABASES = {
         'default': dj_database_url.config(
             default=os.getenv('DATABASE_URL'),
-            conn_max_age=600
+            conn_max_age=600,
+            # Check persistent connections once per request so a connection
+            # dropped by the server is replaced instead of failing a query
+            conn_health_checks=True
         )
     }
 else:
@@ -106,6 +110,43 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# Use Redis when configured, so all workers share the token blacklist and
+# export caches; otherwise each process keeps a local-memory cache.
+# Rendered exports (up to 1 MB each) go to the separate 'exports' alias,
+# which in local memory keeps only a few entries per worker
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        },
+        'exports': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+            'KEY_PREFIX': 'exports',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        'exports': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'exports',
+            'OPTIONS': {'MAX_ENTRIES': 10},
+        },
+    }
+
+# Seconds a "not blacklisted" token lookup is cached, so refreshes with a
+# valid token skip the database. Only safe with a cache shared by every
+# worker, where logout overwrites the entry; off for local-memory caches
+BLACKLIST_NEGATIVE_CACHE_TIMEOUT = 300 if os.getenv('REDIS_URL') else 0
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -124,6 +165,16 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Argon2id first: new passwords use it and older PBKDF2 hashes are upgraded
+# on the next successful login
+PASSWORD_HASHERS = [
+    'core.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -163,6 +214,31 @@ STORAGES = {
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Also store uploaded datasets column-wise in DatasetColumn
+DATASET_COLUMNAR_STORAGE = os.getenv('DATASET_COLUMNAR_STORAGE', 'False') == 'True'
+
+# Parsed rows read and inserted per batch when importing uploads
+DATA_RECORD_BATCH_SIZE = int(os.getenv('DATA_RECORD_BATCH_SIZE', '1000'))
+
+
+# Queue successful-event authentication audit logs and insert them in
+# batches from a background thread instead of one INSERT per request.
+# Rows still queued are lost if the worker is killed or recycled (atexit
+# does not run then), so this stays off unless that loss is acceptable;
+# failed logins are always written at once
+AUTH_LOG_BACKGROUND_WRITES = os.getenv('AUTH_LOG_BACKGROUND_WRITES', 'False') == 'True'
+
+# Take the client IP for audit logs from X-Forwarded-For. Off by default:
+# only enable behind a proxy that sets the header (Railway does), otherwise
+# clients can forge it
+TRUST_PROXY_HEADERS = os.getenv('TRUST_PROXY_HEADERS', 'False') == 'True'
+
+# Proxies in front of the app that append to X-Forwarded-For. The client IP
+# is the entry this many places from the right; entries further left are
+# whatever the client sent
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', '1'))
+
+
 # CORS settings
 # https://github.com/adamchainz/django-cors-headers
 
@@ -188,7 +264,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',  # orjson-encoded JSON
     ],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
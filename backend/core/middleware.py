@@ -0,0 +1,47 @@
+# @SPEC:AUTH-001
+# @TAG: @CODE:CLIENT-INFO-MIDDLEWARE
+"""
+Request middleware for the application.
+"""
+import ipaddress
+
+from django.conf import settings
+
+
+class ClientInfoMiddleware:
+    """
+    Resolve the client IP address and user agent once per request.
+
+    Sets request.client_ip and request.client_user_agent, which DRF views
+    read through their Request wrapper. X-Forwarded-For is the single place
+    proxy headers are trusted. Each proxy appends the address it received
+    the request from, so with TRUST_PROXY_HEADERS on the client is the entry
+    TRUSTED_PROXY_COUNT places from the right; anything left of it came from
+    the client. REMOTE_ADDR is used when the header is not trusted, the
+    chain is shorter than that or the entry is not a valid IP address.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        meta = request.META
+        client_ip = meta.get('REMOTE_ADDR', '0.0.0.0')
+
+        x_forwarded_for = meta.get('HTTP_X_FORWARDED_FOR')
+        proxy_count = settings.TRUSTED_PROXY_COUNT
+        if x_forwarded_for and settings.TRUST_PROXY_HEADERS and proxy_count > 0:
+            forwarded_ips = x_forwarded_for.split(',')
+            if len(forwarded_ips) >= proxy_count:
+                forwarded_ip = forwarded_ips[-proxy_count].strip()
+                try:
+                    ipaddress.ip_address(forwarded_ip)
+                except ValueError:
+                    pass
+                else:
+                    client_ip = forwarded_ip
+
+        request.client_ip = client_ip
+        request.client_user_agent = meta.get('HTTP_USER_AGENT', '')
+
+        return self.get_response(request)
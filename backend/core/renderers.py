@@ -0,0 +1,63 @@
+# @SPEC:AUTH-001
+# @TAG: @CODE:API-RENDERER
+"""
+Response renderers for the API.
+"""
+import math
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+def _has_non_finite_float(value) -> bool:
+    """Return True if value contains NaN or an infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    orjson encodes dicts, lists, strings and numbers in C instead of going
+    through json.JSONEncoder, and also encodes dataclasses directly. Types
+    it does not know (Decimal, lazy translations, querysets) and datetimes
+    are handed to DRF's encoder. JSONRenderer renders instead when the
+    output would differ:
+    - indented output is requested ('application/json; indent=4', the
+      browsable API)
+    - the data holds integers wider than 64 bits, which orjson rejects
+    - the data holds NaN or infinite floats, which orjson writes as null;
+      with STRICT_JSON JSONRenderer raises ValueError for them
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Non-finite floats only ever show up as null, so the data is only
+        # searched for them when the output has one
+        if b'null' in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028 and U+2029 like JSONRenderer, keeping the output a
+        # strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
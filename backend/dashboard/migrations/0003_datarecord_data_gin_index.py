@@ -0,0 +1,31 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+# GIN indexes only exist on PostgreSQL; SQLite (local development and
+# tests) stores JSONField as text and skips this migration.
+DATA_GIN_INDEX = GinIndex(fields=['data'], name='dashboard_datarecord_data_gin')
+
+
+def add_data_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    DataRecord = apps.get_model('dashboard', 'DataRecord')
+    schema_editor.add_index(DataRecord, DATA_GIN_INDEX)
+
+
+def remove_data_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    DataRecord = apps.get_model('dashboard', 'DataRecord')
+    schema_editor.remove_index(DataRecord, DATA_GIN_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_data_gin_index, remove_data_gin_index),
+    ]
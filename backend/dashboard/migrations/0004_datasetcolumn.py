@@ -0,0 +1,31 @@
+# Generated by Django 5.0.7 on 2026-10-15 23:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_datarecord_data_gin_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetColumn',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Column header', max_length=255)),
+                ('position', models.PositiveIntegerField(help_text='Zero-based column index')),
+                ('values', models.JSONField(default=list, help_text='Column values in record order')),
+                ('dataset', models.ForeignKey(help_text='Parent dataset', on_delete=django.db.models.deletion.CASCADE, related_name='columns', to='dashboard.dataset')),
+            ],
+            options={
+                'ordering': ['dataset', 'position'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='datasetcolumn',
+            constraint=models.UniqueConstraint(fields=('dataset', 'position'), name='unique_dataset_column_position'),
+        ),
+    ]
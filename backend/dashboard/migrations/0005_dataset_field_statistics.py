@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-15 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0004_datasetcolumn'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataset',
+            name='field_statistics',
+            field=models.JSONField(blank=True, help_text='Cached numeric field statistics (None when stale)', null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.7 on 2026-10-15 23:36
+
+import dashboard.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_dataset_field_statistics'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='datarecord',
+            name='data',
+            field=dashboard.fields.FastJSONField(help_text='JSON object containing data fields'),
+        ),
+        migrations.AlterField(
+            model_name='datasetcolumn',
+            name='values',
+            field=dashboard.fields.FastJSONField(default=list, help_text='Column values in record order'),
+        ),
+    ]
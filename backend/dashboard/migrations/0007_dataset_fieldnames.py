@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-15 23:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0006_datarecord_fast_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataset',
+            name='fieldnames',
+            field=models.JSONField(blank=True, default=list, help_text='Column headers stored at import time'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+# Drop the GIN index added by 0003. No query filters records by JSON
+# containment or key existence, so it only added write cost to every
+# record insert and COPY.
+DATA_GIN_INDEX = GinIndex(fields=['data'], name='dashboard_datarecord_data_gin')
+
+
+def remove_data_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    DataRecord = apps.get_model('dashboard', 'DataRecord')
+    schema_editor.remove_index(DataRecord, DATA_GIN_INDEX)
+
+
+def add_data_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    DataRecord = apps.get_model('dashboard', 'DataRecord')
+    schema_editor.add_index(DataRecord, DATA_GIN_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0007_dataset_fieldnames'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_data_gin_index, add_data_gin_index),
+    ]
@@ -4,11 +4,30 @@ Dashboard models for University Data Visualization Dashboard.
 Models:
 - Dataset: Represents uploaded Excel files with metadata
 - DataRecord: Stores individual records from datasets with flexible JSON schema
+- DatasetColumn: Optional column-wise copy of a dataset's values
 """
 
-from django.db import models
+import csv
+from io import StringIO
+
+from django.db import models, connections
+from django.db.models.fields.json import compile_json_path
 from django.conf import settings
 from django.core.validators import FileExtensionValidator
+from django.utils import timezone
+
+from .fields import FastJSONField, dumps_json
+
+
+# Top-level record values COPY ... (FORMAT csv) writes differently from
+# csv.writer: objects and arrays, strings with a carriage return, the
+# end-of-data marker \. and numbers of magnitude 1e16 or more, which Python
+# writes in exponent notation when they are floats
+COPY_CSV_MISMATCH_PATH = (
+    r'strict $.* ? (@.type() == "object" || @.type() == "array" '
+    r'|| @ like_regex "\r" || @ == "\\." '
+    r'|| (@.type() == "number" && (@ >= 1e16 || @ <= -1e16)))'
+)
 
 
 class Dataset(models.Model):
@@ -24,6 +43,10 @@ class Dataset(models.Model):
         record_count: Number of data records in this dataset
         category: Category/type of data (e.g., 'enrollment', 'grades', 'faculty')
         uploaded_by: Reference to the User who uploaded this dataset
+        fieldnames: Column headers of the uploaded sheet, in sheet order
+            (empty for datasets created without a file)
+        field_statistics: Cached numeric field statistics used by the Excel
+            export, or None until computed and whenever records change
     """
 
     title = models.CharField(
@@ -60,6 +83,16 @@ class Dataset(models.Model):
         related_name='datasets',
         help_text="User who uploaded this dataset"
     )
+    fieldnames = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Column headers stored at import time"
+    )
+    field_statistics = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Cached numeric field statistics (None when stale)"
+    )
 
     class Meta:
         ordering = ['-upload_date']
@@ -73,11 +106,150 @@ class Dataset(models.Model):
         return f"{self.title} ({self.record_count} records)"
 
 
+class DataRecordManager(models.Manager):
+    """
+    Manager for DataRecord with PostgreSQL bulk load and export paths.
+    """
+
+    def supports_copy(self) -> bool:
+        """Return True if the database can load records with COPY."""
+        return connections[self.db].vendor == 'postgresql'
+
+    def bulk_copy(self, dataset, records) -> int:
+        """
+        Insert records for dataset with COPY ... FROM STDIN.
+
+        Skips per-row INSERT construction in the ORM. Only available on
+        PostgreSQL (see supports_copy); no model instances are returned.
+
+        Args:
+            dataset: Parent Dataset
+            records: Iterable of record dicts
+
+        Returns:
+            Number of records copied
+        """
+        connection = connections[self.db]
+        now = timezone.now()
+
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        count = 0
+        for record in records:
+            writer.writerow([dataset.pk, dumps_json(record), now.isoformat(), now.isoformat()])
+            count += 1
+
+        if not count:
+            return 0
+
+        buffer.seek(0)
+        opts = self.model._meta
+        table = connection.ops.quote_name(opts.db_table)
+        columns = ', '.join(
+            connection.ops.quote_name(opts.get_field(name).column)
+            for name in ('dataset', 'data', 'created_at', 'updated_at')
+        )
+
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)',
+                buffer
+            )
+
+        return count
+
+    def copy_csv_matches(self, dataset) -> bool:
+        """
+        Return True if copy_csv writes dataset's records as the csv module would.
+
+        COPY writes nested objects and arrays as JSON rather than Python
+        reprs, writes numbers of magnitude 1e16 or more in full where
+        Python uses exponent notation, and quotes strings holding a
+        carriage return or equal to the end-of-data marker \\. where the
+        csv module does not. Only
+        available on PostgreSQL (see supports_copy).
+        """
+        connection = connections[self.db]
+        opts = self.model._meta
+        table = connection.ops.quote_name(opts.db_table)
+        data = connection.ops.quote_name(opts.get_field('data').column)
+        dataset_column = connection.ops.quote_name(opts.get_field('dataset').column)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM {table} WHERE {dataset_column} = %s '
+                f"AND jsonb_path_exists({data}, %s::jsonpath, '{{}}', true))",
+                [dataset.pk, COPY_CSV_MISMATCH_PATH]
+            )
+            return not cursor.fetchone()[0]
+
+    def copy_csv(self, dataset, fieldnames, file) -> None:
+        """
+        Write the records of dataset as CSV rows with COPY ... TO STDOUT.
+
+        PostgreSQL extracts the fields and formats the CSV itself, so no
+        JSON is decoded in Python. Rows follow record order and columns
+        follow fieldnames; no header is written. Values are written the way
+        csv.writer writes the decoded records, as long as copy_csv_matches
+        holds for the dataset. Only available on PostgreSQL (see
+        supports_copy).
+
+        Args:
+            dataset: Parent Dataset
+            fieldnames: Keys of data to write, one column each
+            file: Binary file object the CSV rows are written to
+        """
+        connection = connections[self.db]
+        opts = self.model._meta
+        table = connection.ops.quote_name(opts.db_table)
+        data = connection.ops.quote_name(opts.get_field('data').column)
+        dataset_column = connection.ops.quote_name(opts.get_field('dataset').column)
+        pk = connection.ops.quote_name(opts.pk.column)
+
+        values = ', '.join(f'{data} -> %s AS v{i}' for i in range(len(fieldnames)))
+        columns = []
+        for i in range(len(fieldnames)):
+            value = f'fields.v{i}'
+            # Booleans are written as True/False and numbers as Python's
+            # repr of the decoded float: below 1e-4 that is exponent
+            # notation, which float8 output (shortest digits, PostgreSQL
+            # 12+) matches, while numeric output does not. Empty strings
+            # become NULL, which COPY writes unquoted like csv.writer
+            column = (
+                f"CASE jsonb_typeof({value}) "
+                f"WHEN 'boolean' THEN initcap({value} #>> '{{}}') "
+                f"WHEN 'number' THEN CASE WHEN {value}::numeric <> 0 "
+                f"AND abs({value}::numeric) < 0.0001 THEN {value}::float8::text "
+                f"ELSE {value} #>> '{{}}' END "
+                f"ELSE NULLIF({value} #>> '{{}}', '') END"
+            )
+            # csv.writer quotes the empty field of a one-column row, which
+            # COPY does for empty strings but not for NULL
+            if len(fieldnames) == 1:
+                column = f"COALESCE({column}, '')"
+            columns.append(column)
+
+        # COPY does not accept query parameters, so they are bound up front
+        query = connection.ops.compose_sql(
+            f'SELECT {", ".join(columns)} FROM {table} '
+            f'CROSS JOIN LATERAL (SELECT {values}) AS fields '
+            f'WHERE {dataset_column} = %s ORDER BY {pk}',
+            list(fieldnames) + [dataset.pk]
+        )
+
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f'COPY ({query}) TO STDOUT WITH (FORMAT csv)', file)
+
+
 class DataRecord(models.Model):
     """
     Stores individual data records from uploaded datasets.
 
-    Uses JSONField for flexible schema to accommodate varying Excel structures.
+    Uses JSONField for flexible schema to accommodate varying Excel structures,
+    encoded and decoded with orjson (FastJSONField) since every row goes
+    through it on import and export.
+    On PostgreSQL the column is jsonb with a GIN index on data (migration
+    0003), so key lookups are served by the index.
 
     Attributes:
         dataset: Foreign key to parent Dataset
@@ -92,7 +264,7 @@ class DataRecord(models.Model):
         related_name='records',
         help_text="Parent dataset"
     )
-    data = models.JSONField(
+    data = FastJSONField(
         help_text="JSON object containing data fields"
     )
     created_at = models.DateTimeField(
@@ -104,6 +276,8 @@ class DataRecord(models.Model):
         help_text="Last update timestamp"
     )
 
+    objects = DataRecordManager()
+
     class Meta:
         ordering = ['id']
         indexes = [
@@ -112,3 +286,104 @@ class DataRecord(models.Model):
 
     def __str__(self):
         return f"Record {self.id} from {self.dataset.title}"
+
+
+class DatasetColumnManager(models.Manager):
+    """
+    Manager for DatasetColumn that builds columns from stored records.
+    """
+
+    def create_from_records(self, dataset) -> None:
+        """
+        Store each of dataset's fieldnames as a DatasetColumn.
+
+        Every column array is built by the database with one aggregate
+        query over the records, in record order, so no values are loaded
+        into Python. Records without the key get null in that column.
+        The SQLite branch needs SQLite 3.38+ for the -> operator.
+
+        Args:
+            dataset: Dataset whose records are already stored
+        """
+        connection = connections[self.db]
+        quote_name = connection.ops.quote_name
+        record_opts = DataRecord._meta
+        records = quote_name(record_opts.db_table)
+        data = quote_name(record_opts.get_field('data').column)
+        record_dataset = quote_name(record_opts.get_field('dataset').column)
+        pk = quote_name(record_opts.pk.column)
+
+        opts = self.model._meta
+        table = quote_name(opts.db_table)
+        columns = ', '.join(
+            quote_name(opts.get_field(name).column)
+            for name in ('dataset', 'name', 'position', 'values')
+        )
+
+        if connection.vendor == 'postgresql':
+            values = (
+                f"SELECT COALESCE(jsonb_agg({data} -> %s ORDER BY {pk}), '[]') "
+                f'FROM {records} WHERE {record_dataset} = %s'
+            )
+        else:
+            values = (
+                f'SELECT json_group_array(json(value)) FROM ('
+                f'SELECT {data} -> %s AS value FROM {records} '
+                f'WHERE {record_dataset} = %s ORDER BY {pk})'
+            )
+
+        with connection.cursor() as cursor:
+            for position, name in enumerate(dataset.fieldnames):
+                key = name if connection.vendor == 'postgresql' else compile_json_path([name])
+                cursor.execute(
+                    f'INSERT INTO {table} ({columns}) VALUES (%s, %s, %s, ({values}))',
+                    [dataset.pk, name[:255], position, key, dataset.pk]
+                )
+
+
+class DatasetColumn(models.Model):
+    """
+    Stores one column of an uploaded dataset as a single JSON array.
+
+    Written alongside DataRecord when DATASET_COLUMNAR_STORAGE is enabled,
+    so each header is stored once per dataset rather than once per row and
+    column scans read one row instead of every record.
+
+    Attributes:
+        dataset: Foreign key to parent Dataset
+        name: Column header
+        position: Zero-based column index in the uploaded sheet
+        values: JSON array with one value per record, in record order
+    """
+
+    dataset = models.ForeignKey(
+        Dataset,
+        on_delete=models.CASCADE,
+        related_name='columns',
+        help_text="Parent dataset"
+    )
+    name = models.CharField(
+        max_length=255,
+        help_text="Column header"
+    )
+    position = models.PositiveIntegerField(
+        help_text="Zero-based column index"
+    )
+    values = FastJSONField(
+        default=list,
+        help_text="Column values in record order"
+    )
+
+    objects = DatasetColumnManager()
+
+    class Meta:
+        ordering = ['dataset', 'position']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dataset', 'position'],
+                name='unique_dataset_column_position'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} from {self.dataset.title}"
@@ -0,0 +1,132 @@
+"""
+Dataset Import Service
+
+@SPEC:DASH-001
+@CODE:DATASET-IMPORT
+
+Turns an uploaded Excel file into a Dataset with its DataRecords.
+
+The import only needs the file and the upload fields, not the request, so
+it can run inline in the upload view or be handed to a background worker.
+"""
+
+from itertools import islice
+from typing import Any, BinaryIO, Dict
+
+from django.conf import settings
+from django.db import transaction
+
+from ..models import Dataset, DataRecord, DatasetColumn
+from .excel_parser import ExcelParseError, ExcelParserService
+
+
+# Rows already inserted before later batches switch to COPY on PostgreSQL
+COPY_MIN_ROWS = 10_000
+
+
+class DatasetImportService:
+    """
+    Service for importing Excel uploads as datasets.
+
+    @CODE:DATASET-IMPORT-SERVICE
+
+    Methods:
+        import_file(file, **fields): Parse file and store it as a new Dataset
+    """
+
+    def __init__(self, parser: ExcelParserService = None):
+        self.parser = parser or ExcelParserService()
+
+    def import_file(
+        self,
+        file: BinaryIO,
+        *,
+        title: str,
+        filename: str,
+        file_size: int,
+        uploaded_by,
+        description: str = '',
+        category: str = ''
+    ) -> Dict[str, Any]:
+        """
+        Parse an Excel file and create a Dataset with its records.
+
+        @CODE:DATASET-IMPORT-001
+
+        Args:
+            file: Binary file object positioned at the start of the workbook
+            title: Dataset title
+            filename: Original upload filename
+            file_size: Upload size in bytes
+            uploaded_by: User who uploaded the file
+            description: Optional dataset description
+            category: Optional dataset category
+
+        Returns:
+            Dict with structure:
+            - success (bool): Whether the import succeeded
+            - dataset (Dataset): Created dataset, if successful
+            - error (str, optional): Parser error message if failed
+
+        Business Rules:
+        - Nothing is written when the file cannot be parsed
+        - Dataset and records are created in one transaction
+        - The header row is stored as Dataset.fieldnames for the exports
+        - Columns are also stored when DATASET_COLUMNAR_STORAGE is enabled
+        - On PostgreSQL, rows past COPY_MIN_ROWS are loaded with COPY
+        """
+        parse_result = self.parser.stream_records(file)
+
+        if not parse_result['success']:
+            return {'success': False, 'error': parse_result['error']}
+
+        records = parse_result['records']
+
+        try:
+            with transaction.atomic():
+                dataset = Dataset.objects.create(
+                    title=title,
+                    description=description,
+                    category=category,
+                    filename=filename,
+                    file_size=file_size,
+                    uploaded_by=uploaded_by,
+                    # Record keys are the stringified headers; repeated
+                    # headers collapse into one key
+                    fieldnames=list(dict.fromkeys(str(header) for header in parse_result['headers']))
+                )
+
+                # Insert records one batch at a time so only
+                # DATA_RECORD_BATCH_SIZE parsed rows and model instances are
+                # alive at once, and no INSERT grows past that many rows
+                batch_size = settings.DATA_RECORD_BATCH_SIZE
+                use_copy = DataRecord.objects.supports_copy()
+                record_count = 0
+                while True:
+                    batch = list(islice(records, batch_size))
+                    if not batch:
+                        break
+
+                    # Large uploads finish with COPY once they pass the threshold
+                    if use_copy and record_count >= COPY_MIN_ROWS:
+                        DataRecord.objects.bulk_copy(dataset, batch)
+                    else:
+                        DataRecord.objects.bulk_create(
+                            [DataRecord(dataset=dataset, data=record) for record in batch],
+                            batch_size=batch_size
+                        )
+                    record_count += len(batch)
+
+                # The count is only known once the sheet has been read
+                Dataset.objects.filter(pk=dataset.pk).update(record_count=record_count)
+                dataset.record_count = record_count
+
+                # Columns are built from the stored records, so no batch
+                # outlives its insert
+                if settings.DATASET_COLUMNAR_STORAGE and record_count:
+                    DatasetColumn.objects.create_from_records(dataset)
+
+        except ExcelParseError as e:
+            return {'success': False, 'error': str(e)}
+
+        return {'success': True, 'dataset': dataset}
@@ -0,0 +1,347 @@
+"""
+Excel Export Service
+
+@SPEC:EXPORT-001
+@CODE:EXCEL-EXPORT
+
+Renders a Dataset as a styled multi-sheet Excel workbook with openpyxl.
+
+Rendering only needs the dataset and an output file object, not the
+request, so it can run inline in the export view or in a background
+worker that stores the result.
+"""
+
+from decimal import Decimal
+from itertools import chain, islice
+from typing import Any, BinaryIO, Dict, List
+
+from django.db.models import Avg, Field, Func, Max, Min
+from django.db.models.fields.json import compile_json_path
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
+
+from ..models import Dataset
+
+
+# Number of records fetched per database round trip while rendering
+RECORD_CHUNK_SIZE = 2000
+
+# Leading rows that size the data sheet's columns. Widths must be set
+# before the first row of a write-only sheet, so these rows are held back
+# until then; every later row is written as soon as it is read
+COLUMN_WIDTH_SAMPLE_ROWS = 1000
+
+# Styles shared by every export. openpyxl stores each distinct style once
+# per workbook, so reusing instances only saves the per-export construction
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=12)
+HEADER_FILL = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+EVEN_ROW_FILL = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+BOLD_FONT = Font(bold=True)
+SECTION_FONT = Font(bold=True, size=11)
+TITLE_FONT = Font(bold=True, size=14, color='4472C4')
+
+
+class NumericKey(Func):
+    """
+    Value of a key of a JSON column where it is a JSON number, else NULL.
+
+    Strings, booleans and other types are left out instead of being cast,
+    which fails on PostgreSQL and reads as 0 on SQLite. Values are not
+    converted: SQLite returns int or float, PostgreSQL returns Decimal
+    with the number's own scale.
+    """
+
+    # A plain Field, so Django applies no int/float conversion to results
+    output_field = Field()
+
+    def __init__(self, key_name, expression='data'):
+        super().__init__(expression)
+        self.key_name = key_name
+
+    def as_sql(self, compiler, connection, **extra_context):
+        data_sql, params = compiler.compile(self.source_expressions[0])
+        path = compile_json_path([self.key_name])
+        return (
+            f"CASE WHEN json_type({data_sql}, %s) IN ('integer', 'real') "
+            f"THEN json_extract({data_sql}, %s) END",
+            (*params, path, *params, path)
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        data_sql, params = compiler.compile(self.source_expressions[0])
+        return (
+            f"CASE WHEN jsonb_typeof({data_sql} -> %s) = 'number' "
+            f"THEN ({data_sql} ->> %s)::numeric END",
+            (*params, self.key_name, *params, self.key_name)
+        )
+
+
+class ExcelExportService:
+    """
+    Service for rendering datasets as Excel workbooks.
+
+    @CODE:EXCEL-EXPORT-SERVICE
+
+    Methods:
+        render(dataset, output): Write the Excel workbook for dataset to output
+    """
+
+    def render(self, dataset: Dataset, output: BinaryIO) -> None:
+        """
+        Write the Excel workbook for a dataset.
+
+        @SPEC:REQ-EXPORT-003
+        @SPEC:REQ-EXPORT-004
+
+        Args:
+            dataset: Dataset to export
+            output: Writable binary file object receiving the .xlsx file
+
+        Workbook layout:
+        - 데이터 (Data): styled records table
+        - 요약 통계 (Summary Statistics): dataset info and numeric field statistics
+        """
+        # Create write-only workbook (rows are streamed to the sheet XML
+        # as they are appended instead of being kept as Cell objects)
+        workbook = Workbook(write_only=True)
+
+        # Sheet 1: 데이터 (Data)
+        self._create_data_sheet(workbook, dataset)
+
+        # Sheet 2: 요약 통계 (Summary Statistics)
+        self._create_statistics_sheet(workbook, dataset)
+
+        workbook.save(output)
+
+    def _create_data_sheet(self, workbook: Workbook, dataset: Dataset) -> None:
+        """
+        Create data sheet with all records.
+
+        @SPEC:REQ-EXPORT-003
+
+        Features:
+        - Header row with styling (bold, blue background, white text)
+        - Auto-width columns
+        - Zebra striping (alternating row colors)
+
+        The workbook is write-only, so column widths have to be set before
+        the first row is appended. They are computed from the first
+        COLUMN_WIDTH_SAMPLE_ROWS rows; the remaining rows go from the
+        database cursor straight to the sheet.
+        """
+        # Create sheet
+        data_sheet = workbook.create_sheet(title='데이터')
+
+        # Get record payloads as plain dicts, streamed from the cursor in chunks
+        records = dataset.records.values_list('data', flat=True).iterator(
+            chunk_size=RECORD_CHUNK_SIZE
+        )
+        first_record = next(records, None)
+
+        if first_record is None:
+            # Empty dataset - just add a note
+            data_sheet.append(['데이터 없음'])
+            return
+
+        # Use the header stored at import, or the first record's keys for
+        # datasets created without a file
+        fieldnames = dataset.fieldnames or list(first_record.keys())
+
+        # Register zebra striping as a named style, so striped cells are
+        # assigned one style reference instead of each resolving the fill.
+        # Named styles bind to their workbook, so one is created per export
+        workbook.add_named_style(NamedStyle(name='even_row', fill=EVEN_ROW_FILL))
+
+        rows = (
+            self._row_values(data, fieldnames)
+            for data in chain([first_record], records)
+        )
+
+        # Track the widest value per column over the leading rows
+        sample = list(islice(rows, COLUMN_WIDTH_SAMPLE_ROWS))
+        max_lengths = [len(str(field_name)) for field_name in fieldnames]
+        for row in sample:
+            for col_idx, value in enumerate(row):
+                if value:
+                    max_lengths[col_idx] = max(max_lengths[col_idx], len(str(value)))
+
+        # Auto-adjust column widths (must be set before rows are written)
+        for col_idx, max_length in enumerate(max_lengths, start=1):
+            column_letter = get_column_letter(col_idx)
+            adjusted_width = min(max_length + 2, 50)  # Cap at 50
+            data_sheet.column_dimensions[column_letter].width = adjusted_width
+
+        # Write header row
+        header_cells = []
+        for field_name in fieldnames:
+            cell = WriteOnlyCell(data_sheet, value=field_name)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
+            header_cells.append(cell)
+        data_sheet.append(header_cells)
+
+        # Write the sampled rows, then the rest as they are read
+        for row_idx, row in enumerate(chain(sample, rows), start=2):
+            # Apply zebra striping to even rows
+            if row_idx % 2 == 0:
+                striped_cells = []
+                for value in row:
+                    cell = WriteOnlyCell(data_sheet, value=value)
+                    cell.style = 'even_row'
+                    striped_cells.append(cell)
+                data_sheet.append(striped_cells)
+            else:
+                data_sheet.append(row)
+
+    def _row_values(self, data: Dict[str, Any], fieldnames: List[str]) -> List[Any]:
+        """
+        Return a record's cell values in fieldnames order.
+
+        Missing keys and nulls become empty cells and booleans are written
+        as text.
+        """
+        row = []
+        for field_name in fieldnames:
+            value = data.get(field_name)
+
+            # Convert value to appropriate type
+            if value is None:
+                value = ''
+            elif isinstance(value, bool):
+                value = str(value)
+
+            row.append(value)
+        return row
+
+    def _create_statistics_sheet(self, workbook: Workbook, dataset: Dataset) -> None:
+        """
+        Create statistics sheet with aggregated data.
+
+        @SPEC:REQ-EXPORT-004
+
+        Includes:
+        - Total record count
+        - Category breakdown
+        - Numeric field statistics (avg, min, max)
+        """
+        # Create sheet
+        stats_sheet = workbook.create_sheet(title='요약 통계')
+
+        # Auto-adjust column widths (must be set before rows are written)
+        for col in ['A', 'B', 'C', 'D']:
+            stats_sheet.column_dimensions[col].width = 20
+
+        # Title
+        title_cell = WriteOnlyCell(stats_sheet, value=f'{dataset.title} - 요약 통계')
+        title_cell.font = TITLE_FONT
+        stats_sheet.append([title_cell])
+        stats_sheet.merged_cells.add('A1:B1')
+        stats_sheet.append([])
+
+        # Dataset info
+        info_cell = WriteOnlyCell(stats_sheet, value='데이터셋 정보')
+        info_cell.font = SECTION_FONT
+        stats_sheet.append([info_cell])
+
+        stats_sheet.append(['총 레코드 수', dataset.record_count])
+        stats_sheet.append(['파일 크기', f'{dataset.file_size / 1024:.2f} KB'])
+        stats_sheet.append(['업로드 날짜', dataset.upload_date.strftime('%Y-%m-%d %H:%M')])
+        stats_sheet.append([])
+
+        # Numeric field statistics, computed once and cached on the dataset
+        field_statistics = self._field_statistics(dataset)
+        if field_statistics['has_records']:
+            stats_cell = WriteOnlyCell(stats_sheet, value='필드 통계')
+            stats_cell.font = SECTION_FONT
+            stats_sheet.append([stats_cell])
+
+            if field_statistics['numeric_fields']:
+                # Header row for statistics
+                column_header_cells = []
+                for label in ['필드', '평균', '최소', '최대']:
+                    cell = WriteOnlyCell(stats_sheet, value=label)
+                    cell.font = BOLD_FONT
+                    column_header_cells.append(cell)
+                stats_sheet.append(column_header_cells)
+
+                for row in field_statistics['rows']:
+                    stats_sheet.append(row)
+
+    def _field_statistics(self, dataset: Dataset) -> Dict[str, Any]:
+        """
+        Return the numeric field statistics of a dataset.
+
+        The result is stored in dataset.field_statistics, so repeated
+        exports skip the aggregate query until a record change resets it
+        to None.
+
+        Args:
+            dataset: Dataset to summarize
+
+        Returns:
+            Dict with structure:
+            - has_records (bool): Whether the dataset has any records
+            - numeric_fields (List[str]): Numeric fields of the first record
+            - rows (List[List]): [field, avg, min, max] per field with values
+        """
+        if dataset.field_statistics is not None:
+            return dataset.field_statistics
+
+        field_statistics = {'has_records': False, 'numeric_fields': [], 'rows': []}
+
+        first_data = dataset.records.values_list('data', flat=True).first()
+        if first_data is not None:
+            field_statistics['has_records'] = True
+
+            # Get numeric fields from first record (booleans are not numbers
+            # to the database, even though Python treats them as ints)
+            numeric_fields = [
+                field_name
+                for field_name, value in first_data.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            ]
+            field_statistics['numeric_fields'] = numeric_fields
+
+            # Calculate statistics for numeric fields
+            if numeric_fields:
+                # Aggregate every numeric field in the database with a single
+                # query; missing keys, JSON nulls and values of other types
+                # are NULL and skipped
+                aggregates = {}
+                for index, field_name in enumerate(numeric_fields):
+                    value = NumericKey(field_name)
+                    aggregates[f'avg_{index}'] = Avg(value)
+                    aggregates[f'min_{index}'] = Min(value)
+                    aggregates[f'max_{index}'] = Max(value)
+
+                field_stats = dataset.records.aggregate(**aggregates)
+
+                for index, field_name in enumerate(numeric_fields):
+                    avg_val = field_stats[f'avg_{index}']
+                    if avg_val is not None:
+                        min_val = self._number(field_stats[f'min_{index}'])
+                        max_val = self._number(field_stats[f'max_{index}'])
+
+                        field_statistics['rows'].append(
+                            [field_name, round(float(avg_val), 2), min_val, max_val]
+                        )
+
+        Dataset.objects.filter(pk=dataset.pk).update(field_statistics=field_statistics)
+        dataset.field_statistics = field_statistics
+
+        return field_statistics
+
+    def _number(self, value):
+        """
+        Return a database number as int or float.
+
+        PostgreSQL returns Decimal; one without a fractional part was
+        written as an integer and stays one, the way SQLite returns it.
+        """
+        if isinstance(value, Decimal):
+            return int(value) if value.as_tuple().exponent >= 0 else float(value)
+        return value
@@ -5,12 +5,64 @@ Excel Parser Service
 @CODE:EXCEL-PARSER
 
 Parses Excel files (.xlsx, .xls) and extracts data into structured records.
+
+Worksheet data is read by streaming the sheet XML straight out of the
+.xlsx archive with ElementTree.iterparse, so rows are decoded by expat
+without building openpyxl Cell objects.
 """
 
-from typing import Dict, List, Any, BinaryIO
+import posixpath
+import re
+import zipfile
+from contextlib import ExitStack, contextmanager
+from typing import Dict, List, Any, BinaryIO, Iterator, Optional, Set, Tuple, Union
 from datetime import datetime
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
+from itertools import chain
+from xml.etree import ElementTree
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils import column_index_from_string
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_excel,
+    from_ISO8601,
+)
+
+
+# SpreadsheetML namespaces
+SHEET_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+DOC_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+ROW_TAG = f'{{{SHEET_NS}}}row'
+CELL_TAG = f'{{{SHEET_NS}}}c'
+VALUE_TAG = f'{{{SHEET_NS}}}v'
+INLINE_STRING_TAG = f'{{{SHEET_NS}}}is'
+TEXT_TAG = f'{{{SHEET_NS}}}t'
+RUN_TAG = f'{{{SHEET_NS}}}r'
+SHARED_STRING_TAG = f'{{{SHEET_NS}}}si'
+DIMENSION_TAG = f'{{{SHEET_NS}}}dimension'
+
+WORKBOOK_PATH = 'xl/workbook.xml'
+WORKBOOK_RELS_PATH = 'xl/_rels/workbook.xml.rels'
+
+ROW_NUMBER_DIGITS = '0123456789'
+
+# <dimension ref="A1:C3"/> is written before <sheetData>, so it is found in
+# the first few KB of the sheet XML without decompressing the rows
+DIMENSION_PATTERN = re.compile(rb'<(?:\w+:)?dimension\b[^>]*?\bref="([^"]+)"')
+SHEET_HEAD_SIZE = 8192
+
+# ZIP local file header signature; every .xlsx archive starts with it
+XLSX_SIGNATURE = b'PK\x03\x04'
+
+
+class ExcelParseError(ValueError):
+    """
+    Raised by stream_records() iterators when the sheet cannot be read.
+
+    The message matches the 'error' value parse() would return.
+    """
 
 
 class ExcelParserService:
@@ -24,14 +76,21 @@ class ExcelParserService:
         get_metadata(file): Get file metadata (sheet count, dimensions)
     """
 
-    def parse(self, file: BinaryIO, has_header: bool = True) -> Dict[str, Any]:
+    def __init__(self):
+        # Workbook-level parts of the last file opened by this instance, so
+        # parse() and get_metadata() on the same upload only read them once
+        self._workbook_source = None
+        self._workbook = None
+
+    def parse(self, file: Union[BinaryIO, zipfile.ZipFile], has_header: bool = True) -> Dict[str, Any]:
         """
         Parse an Excel file and extract records.
 
         @CODE:EXCEL-PARSER-001
 
         Args:
-            file: Binary file object (BytesIO or file handle)
+            file: Binary file object (BytesIO or file handle), or an already
+                open ZipFile shared with get_metadata()
             has_header: If True, treat first row as headers
 
         Returns:
@@ -46,103 +105,169 @@ class ExcelParserService:
         - Convert all data types to Python native types
         - Handle empty cells as None
         - Validate file is not empty
+        - Reject non-ZIP input from its first bytes, before opening an archive
         """
+        result = self.stream_records(file, has_header)
+
+        if not result['success']:
+            return result
+
         try:
-            # Load workbook
-            wb = load_workbook(file, read_only=True, data_only=True)
-            ws = wb.active
+            records = list(result['records'])
+        except ExcelParseError as e:
+            return {'success': False, 'error': str(e)}
 
-            if ws is None:
-                return {'success': False, 'error': 'Workbook has no active sheet'}
+        return {
+            'success': True,
+            'records': records,
+            'headers': result['headers']
+        }
 
-            # Get all rows as list
-            rows = list(ws.rows)
+    def stream_records(self, file: Union[BinaryIO, zipfile.ZipFile], has_header: bool = True) -> Dict[str, Any]:
+        """
+        Open an Excel file and return its records as a lazy iterator.
 
-            if not rows:
-                return {'success': False, 'error': 'Excel file is empty'}
+        @CODE:EXCEL-PARSER-011
 
-            headers = []
-            data_rows = []
+        Same checks and record format as parse(), but rows are only read
+        from the sheet XML as 'records' is consumed, so callers can process
+        large files without holding every record in memory. The archive is
+        closed once the iterator is exhausted or closed.
 
-            if has_header:
-                # First row is headers
-                header_row = rows[0]
-                headers = [self._cell_to_value(cell) for cell in header_row]
+        Args:
+            file: Binary file object (BytesIO or file handle), or an already
+                open ZipFile
+            has_header: If True, treat first row as headers
 
-                # Remaining rows are data
-                data_rows = rows[1:]
+        Returns:
+            Dict with structure:
+            - success (bool): Whether the file could be opened
+            - records (Iterator[Dict]): Data records, read on demand
+            - headers (List[str]): Column headers
+            - error (str, optional): Error message if failed
 
-            else:
-                # No headers - use column indices
-                if rows:
-                    num_cols = len(rows[0])
-                    headers = [f'col_{i}' for i in range(num_cols)]
-                    data_rows = rows
+        Errors found while iterating (e.g. a truncated sheet) are raised
+        from the iterator as ExcelParseError.
+        """
+        archive_stack = ExitStack()
 
-            # Convert rows to dictionaries
-            records = []
-            for row in data_rows:
-                # Skip completely empty rows
-                values = [self._cell_to_value(cell) for cell in row]
-                if all(v is None for v in values):
-                    continue
+        try:
+            # Reject non-ZIP payloads before attempting to open an archive
+            if not isinstance(file, zipfile.ZipFile):
+                position = file.tell()
+                signature = file.read(len(XLSX_SIGNATURE))
+                file.seek(position)
 
-                # Create record dict
-                record = {}
-                for header, value in zip(headers, values):
-                    record[str(header)] = value
+                if signature != XLSX_SIGNATURE:
+                    return {'success': False, 'error': 'Invalid Excel file format'}
 
-                records.append(record)
+            archive = archive_stack.enter_context(self._open_archive(file))
+            workbook = self._load_workbook(file, archive)
 
-            wb.close()
+            if workbook['sheet_path'] is None:
+                archive_stack.close()
+                return {'success': False, 'error': 'Workbook has no active sheet'}
 
-            return {
-                'success': True,
-                'records': records,
-                'headers': headers
-            }
+            # Stream rows as plain value tuples
+            rows = self._iter_sheet_rows(archive, workbook)
+            first_row = next(rows, None)
 
-        except InvalidFileException:
-            return {'success': False, 'error': 'Invalid Excel file format'}
+            if first_row is None:
+                archive_stack.close()
+                return {'success': False, 'error': 'Excel file is empty'}
 
         except Exception as e:
-            return {'success': False, 'error': f'Failed to parse Excel file: {str(e)}'}
+            archive_stack.close()
+            return self._error_result(e)
+
+        if has_header:
+            # First row is headers, remaining rows are data
+            headers = list(first_row)
+            data_rows = rows
+
+        else:
+            # No headers - use column indices
+            headers = [f'col_{i}' for i in range(len(first_row))]
+            data_rows = chain([first_row], rows)
+
+        return {
+            'success': True,
+            'records': self._iter_records(data_rows, headers, archive_stack),
+            'headers': headers
+        }
+
+    def _iter_records(
+        self,
+        data_rows: Iterator[Tuple[Any, ...]],
+        headers: List[Any],
+        archive_stack: ExitStack
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Convert streamed rows to record dicts, closing the archive at the end.
+
+        @CODE:EXCEL-PARSER-012
+        """
+        # Record keys are fixed per file, so convert them once
+        keys = tuple(str(header) for header in headers)
+
+        with archive_stack:
+            try:
+                for row in data_rows:
+                    # Skip completely empty rows
+                    if all(v is None for v in row):
+                        continue
+
+                    # Sheets without a <dimension> (e.g. openpyxl write-only
+                    # output) omit trailing empty cells, so pad short rows
+                    if len(row) < len(keys):
+                        row = row + (None,) * (len(keys) - len(row))
+
+                    yield dict(zip(keys, row))
+
+            except Exception as e:
+                raise ExcelParseError(self._error_result(e)['error']) from e
 
-    def get_metadata(self, file: BinaryIO) -> Dict[str, Any]:
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """
+        Map an exception raised while reading a workbook to an error result.
+        """
+        if isinstance(error, (zipfile.BadZipFile, KeyError, ElementTree.ParseError)):
+            return {'success': False, 'error': 'Invalid Excel file format'}
+
+        return {'success': False, 'error': f'Failed to parse Excel file: {str(error)}'}
+
+    def get_metadata(self, file: Union[BinaryIO, zipfile.ZipFile]) -> Dict[str, Any]:
         """
         Get metadata about an Excel file.
 
         @CODE:EXCEL-PARSER-002
 
         Args:
-            file: Binary file object
+            file: Binary file object, or an already open ZipFile
 
         Returns:
             Dict with metadata:
             - sheet_count: Number of sheets
-            - row_count: Number of rows in active sheet
-            - column_count: Number of columns in active sheet
+            - row_count: Number of rows in first sheet
+            - column_count: Number of columns in first sheet
             - sheet_names: List of sheet names
         """
         try:
-            wb = load_workbook(file, read_only=True)
-            ws = wb.active
+            with self._open_archive(file) as archive:
+                workbook = self._load_workbook(file, archive)
 
-            # Get dimensions
-            row_count = ws.max_row
-            column_count = ws.max_column
+                if workbook['sheet_path'] is None:
+                    row_count, column_count = 0, 0
+                else:
+                    row_count, column_count = self._read_dimensions(archive, workbook)
 
-            metadata = {
-                'sheet_count': len(wb.sheetnames),
+            return {
+                'sheet_count': len(workbook['sheet_names']),
                 'row_count': row_count,
                 'column_count': column_count,
-                'sheet_names': wb.sheetnames
+                'sheet_names': workbook['sheet_names']
             }
 
-            wb.close()
-
-            return metadata
-
         except Exception as e:
             return {
                 'sheet_count': 0,
@@ -151,20 +276,329 @@ class ExcelParserService:
                 'error': str(e)
             }
 
-    def _cell_to_value(self, cell) -> Any:
+    @contextmanager
+    def _open_archive(self, file: Union[BinaryIO, zipfile.ZipFile]) -> Iterator[zipfile.ZipFile]:
+        """
+        Yield a ZipFile for file.
+
+        An already open ZipFile is used as-is and left open for the caller,
+        so parse() and get_metadata() can share one central directory read.
+        """
+        if isinstance(file, zipfile.ZipFile):
+            yield file
+            return
+
+        with zipfile.ZipFile(file) as archive:
+            yield archive
+
+    def _load_workbook(self, file: Union[BinaryIO, zipfile.ZipFile], archive: zipfile.ZipFile) -> Dict[str, Any]:
+        """
+        Return the workbook parts for file, reading them on first use.
+
+        @CODE:EXCEL-PARSER-009
+
+        Args:
+            file: Binary file object or ZipFile the archive was opened from
+            archive: Open .xlsx archive
+
+        Returns:
+            Workbook parts dict (see _read_workbook_parts)
         """
-        Convert an Excel cell to a Python value.
+        if self._workbook is None or self._workbook_source is not file:
+            self._workbook = self._read_workbook_parts(archive)
+            self._workbook_source = file
+
+        return self._workbook
+
+    def _read_workbook_parts(self, archive: zipfile.ZipFile) -> Dict[str, Any]:
+        """
+        Locate the workbook parts needed to read the first worksheet.
+
+        @CODE:EXCEL-PARSER-004
+
+        Args:
+            archive: Open .xlsx archive
+
+        Returns:
+            Dict with:
+            - sheet_path: Path of the first worksheet XML (None if no sheets)
+            - sheet_names: List of sheet names
+            - shared_strings_path: Path of the shared string table (or None)
+            - styles_path: Path of the stylesheet (or None)
+            - epoch: Workbook date epoch (1900 or 1904 date system)
+
+            The shared string table and date styles are added lazily by
+            _iter_sheet_rows the first time cell values are decoded.
+        """
+        workbook = ElementTree.fromstring(archive.read(WORKBOOK_PATH))
+        rels = ElementTree.fromstring(archive.read(WORKBOOK_RELS_PATH))
+
+        targets_by_id = {}
+        targets_by_type = {}
+        for rel in rels.iter(f'{{{PKG_REL_NS}}}Relationship'):
+            target = rel.get('Target', '')
+            # Targets are either absolute ('/xl/...') or relative to xl/
+            if target.startswith('/'):
+                path = target.lstrip('/')
+            else:
+                path = posixpath.normpath(posixpath.join('xl', target))
+            targets_by_id[rel.get('Id')] = path
+            targets_by_type[rel.get('Type', '').rsplit('/', 1)[-1]] = path
+
+        sheets = workbook.findall(f'{{{SHEET_NS}}}sheets/{{{SHEET_NS}}}sheet')
+        sheet_path = None
+        if sheets:
+            sheet_path = targets_by_id.get(sheets[0].get(f'{{{DOC_REL_NS}}}id'))
+
+        properties = workbook.find(f'{{{SHEET_NS}}}workbookPr')
+        if properties is not None and properties.get('date1904') in ('1', 'true'):
+            epoch = CALENDAR_MAC_1904
+        else:
+            epoch = CALENDAR_WINDOWS_1900
+
+        return {
+            'sheet_path': sheet_path,
+            'sheet_names': [sheet.get('name') for sheet in sheets],
+            'shared_strings_path': targets_by_type.get('sharedStrings'),
+            'styles_path': targets_by_type.get('styles'),
+            'epoch': epoch,
+        }
+
+    def _read_dimensions(self, archive: zipfile.ZipFile, workbook: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Get (row_count, column_count) of the first worksheet.
+
+        @CODE:EXCEL-PARSER-010
+
+        Reads only the head of the sheet XML for its <dimension> element and
+        scans the rows when the writer left it out.
+        """
+        with archive.open(workbook['sheet_path']) as sheet_xml:
+            head = sheet_xml.read(SHEET_HEAD_SIZE)
+
+        match = DIMENSION_PATTERN.search(head)
+        if match:
+            return self._parse_dimension_ref(match.group(1).decode('ascii'))
+
+        # Dimension missing: count rows and the widest row
+        row_count, column_count = 0, 0
+        for row in self._iter_sheet_rows(archive, workbook):
+            row_count += 1
+            column_count = max(column_count, len(row))
+
+        return row_count, column_count
+
+    def _parse_dimension_ref(self, ref: str) -> Tuple[int, int]:
+        """
+        Convert a dimension ref ('A1' or 'A1:C3') to (max_row, max_column).
+        """
+        last_cell = ref.split(':')[-1]
+        letters = last_cell.rstrip(ROW_NUMBER_DIGITS)
+        digits = last_cell[len(letters):]
+
+        if not letters or not digits:
+            return 0, 0
+
+        return int(digits), column_index_from_string(letters)
+
+    def _iter_sheet_rows(self, archive: zipfile.ZipFile, workbook: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Stream worksheet rows as tuples of raw cell values.
+
+        @CODE:EXCEL-PARSER-005
+
+        Rows are padded to the sheet width so missing trailing cells come
+        back as None, and skipped row numbers are yielded as empty rows.
+
+        Args:
+            archive: Open .xlsx archive
+            workbook: Workbook parts from _load_workbook
+
+        Yields:
+            Tuple of cell values per row
+        """
+        if 'shared_strings' not in workbook:
+            workbook['shared_strings'] = self._read_shared_strings(
+                archive, workbook['shared_strings_path']
+            )
+            workbook['date_styles'], workbook['timedelta_styles'] = self._read_date_styles(
+                archive, workbook['styles_path']
+            )
+
+        shared_strings = workbook['shared_strings']
+        date_styles = workbook['date_styles']
+        timedelta_styles = workbook['timedelta_styles']
+        epoch = workbook['epoch']
+
+        width = 0
+        expected_row = 1
+
+        with archive.open(workbook['sheet_path']) as sheet_xml:
+            for _, element in ElementTree.iterparse(sheet_xml, events=('end',)):
+                tag = element.tag
+
+                if tag == DIMENSION_TAG:
+                    _, width = self._parse_dimension_ref(element.get('ref', ''))
+
+                elif tag == ROW_TAG:
+                    row_number = int(element.get('r', expected_row))
+
+                    # Yield empty rows for gaps in the row numbering
+                    while expected_row < row_number:
+                        yield (None,) * width
+                        expected_row += 1
+
+                    values = []
+                    for cell in element.iter(CELL_TAG):
+                        ref = cell.get('r')
+                        if ref:
+                            column = column_index_from_string(ref.rstrip(ROW_NUMBER_DIGITS))
+                            if column > len(values) + 1:
+                                values.extend([None] * (column - len(values) - 1))
+
+                        values.append(self._read_cell(
+                            cell, shared_strings, date_styles, timedelta_styles, epoch
+                        ))
+
+                    if len(values) < width:
+                        values.extend([None] * (width - len(values)))
+
+                    yield tuple(values)
+                    expected_row = row_number + 1
+
+                    # Release parsed cells to keep memory flat
+                    element.clear()
+
+    def _read_cell(
+        self,
+        cell: ElementTree.Element,
+        shared_strings: List[str],
+        date_styles: Set[int],
+        timedelta_styles: Set[int],
+        epoch: datetime
+    ) -> Any:
+        """
+        Decode a single <c> element into a Python value.
+
+        @CODE:EXCEL-PARSER-006
+
+        Mirrors openpyxl's data_only reading: cached formula results,
+        shared/inline strings, booleans and date-formatted serials.
+        Dates are converted with _cell_to_value here, so rows come back
+        ready for the record dicts without a second pass over the cells.
+        """
+        data_type = cell.get('t', 'n')
+
+        if data_type == 'inlineStr':
+            inline = cell.find(INLINE_STRING_TAG)
+            return self._string_item_text(inline) if inline is not None else None
+
+        value = cell.findtext(VALUE_TAG)
+        if not value:
+            return None
+
+        if data_type == 'n':
+            number = float(value) if ('.' in value or 'E' in value or 'e' in value) else int(value)
+            style_id = int(cell.get('s', 0))
+            if style_id in date_styles:
+                try:
+                    return self._cell_to_value(
+                        from_excel(number, epoch, timedelta=style_id in timedelta_styles)
+                    )
+                except (OverflowError, ValueError):
+                    return number
+            return number
+
+        if data_type == 's':
+            return shared_strings[int(value)]
+
+        if data_type == 'b':
+            return bool(int(value))
+
+        if data_type == 'd':
+            return self._cell_to_value(from_ISO8601(value))
+
+        # 'str' (formula string) and 'e' (error) are returned as text
+        return value
+
+    def _read_shared_strings(self, archive: zipfile.ZipFile, path: Optional[str]) -> List[str]:
+        """
+        Load the shared string table, indexed by position.
+
+        @CODE:EXCEL-PARSER-007
+        """
+        if path is None:
+            return []
+
+        strings = []
+        with archive.open(path) as strings_xml:
+            for _, element in ElementTree.iterparse(strings_xml, events=('end',)):
+                if element.tag == SHARED_STRING_TAG:
+                    strings.append(self._string_item_text(element))
+                    element.clear()
+
+        return strings
+
+    def _string_item_text(self, item: ElementTree.Element) -> str:
+        """
+        Extract plain text from a string item (<si> or <is>).
+
+        Rich text runs are concatenated; phonetic runs (<rPh>) are ignored.
+        """
+        text = item.find(TEXT_TAG)
+        if text is not None:
+            return text.text or ''
+
+        return ''.join(run.findtext(TEXT_TAG, '') for run in item.iter(RUN_TAG))
+
+    def _read_date_styles(self, archive: zipfile.ZipFile, path: Optional[str]) -> Tuple[Set[int], Set[int]]:
+        """
+        Find cell style indexes whose number format is a date or duration.
+
+        @CODE:EXCEL-PARSER-008
+
+        Returns:
+            Tuple of (date style ids, timedelta style ids)
+        """
+        date_styles = set()
+        timedelta_styles = set()
+
+        if path is None:
+            return date_styles, timedelta_styles
+
+        styles = ElementTree.fromstring(archive.read(path))
+
+        custom_formats = {
+            int(fmt.get('numFmtId')): fmt.get('formatCode')
+            for fmt in styles.iter(f'{{{SHEET_NS}}}numFmt')
+        }
+
+        cell_xfs = styles.find(f'{{{SHEET_NS}}}cellXfs')
+        if cell_xfs is None:
+            return date_styles, timedelta_styles
+
+        for style_id, xf in enumerate(cell_xfs.iter(f'{{{SHEET_NS}}}xf')):
+            fmt_id = int(xf.get('numFmtId', 0))
+            fmt = custom_formats.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+            if is_date_format(fmt):
+                date_styles.add(style_id)
+                if is_timedelta_format(fmt):
+                    timedelta_styles.add(style_id)
+
+        return date_styles, timedelta_styles
+
+    def _cell_to_value(self, value: Any) -> Any:
+        """
+        Convert an Excel cell value to a Python value.
 
         @CODE:EXCEL-PARSER-003
 
         Args:
-            cell: openpyxl Cell object
+            value: Raw cell value read from the sheet XML
 
         Returns:
             Python native type (str, int, float, datetime, None)
         """
-        value = cell.value
-
         if value is None:
             return None
 
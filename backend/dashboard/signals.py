@@ -0,0 +1,37 @@
+"""
+Dashboard signal handlers
+
+@SPEC:DASH-001
+@CODE:DASH-SIGNALS
+
+Keeps cached dashboard data in step with Dataset changes.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Dataset
+
+
+# Cache key of the statistics overview response
+STATISTICS_CACHE_KEY = 'dashboard:stats:v1'
+
+
+def invalidate_statistics_cache():
+    """
+    Drop the cached statistics overview.
+
+    The key is deleted right away and again once the current transaction
+    commits, so a request that read the old rows in between cannot leave
+    them cached.
+    """
+    cache.delete(STATISTICS_CACHE_KEY)
+    transaction.on_commit(lambda: cache.delete(STATISTICS_CACHE_KEY))
+
+
+@receiver([post_save, post_delete], sender=Dataset)
+def dataset_changed(sender, **kwargs):
+    """Invalidate cached statistics when a dataset is saved or deleted."""
+    invalidate_statistics_cache()
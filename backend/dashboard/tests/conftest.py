@@ -11,6 +11,11 @@ import pytest
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
+from django.conf import settings  # noqa: E402
+
+# PBKDF2 dominates create_user() cost; tests don't need a slow hasher
+settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 @pytest.fixture(scope='session', autouse=True)
 def disable_throttling(django_db_setup, django_db_blocker):
@@ -20,15 +25,36 @@ def disable_throttling(django_db_setup, django_db_blocker):
     Rate limiting interferes with integration tests.
     """
     from django.conf import settings
+    from rest_framework.views import APIView
 
     with django_db_blocker.unblock():
         # Store original settings
         original_throttle_classes = settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_CLASSES', [])
+        original_view_throttles = APIView.throttle_classes
 
-        # Disable throttling
+        # Disable throttling. APIView reads the default throttle classes when
+        # rest_framework.views is first imported, which may already have
+        # happened while collecting test modules, so reset it as well.
         settings.REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = []
+        APIView.throttle_classes = []
 
         yield
 
         # Restore original settings
         settings.REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = original_throttle_classes
+        APIView.throttle_classes = original_view_throttles
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty cache.
+
+    The local-memory cache outlives each test's database rollback, so
+    cached responses such as the statistics overview would otherwise leak
+    between tests.
+    """
+    from django.core.cache import caches
+
+    for cache in caches.all():
+        cache.clear()
@@ -211,6 +211,53 @@ class TestAnalyticsAPI:
             assert 'upload_date' in upload
             assert 'uploaded_by' in upload
 
+    def test_overview_recent_uploads_query_count(
+        self, authenticated_client, sample_datasets_with_records, django_assert_max_num_queries
+    ):
+        """
+        @TEST:ANALYTICS-003
+        Recent uploads are serialized without a query per uploader
+        """
+        url = '/api/statistics/overview/'
+
+        # User lookup for auth + categories (with totals) + recent uploads
+        with django_assert_max_num_queries(3):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['recent_uploads']) == 5
+
+    def test_overview_statistics_are_cached_until_datasets_change(
+        self, authenticated_client, sample_datasets_with_records, test_user, django_assert_max_num_queries
+    ):
+        """
+        @TEST:ANALYTICS-003
+        Repeated overview requests are served from the cache; saving a dataset invalidates it
+        """
+        url = '/api/statistics/overview/'
+
+        first = authenticated_client.get(url)
+
+        # Only the user lookup for auth
+        with django_assert_max_num_queries(1):
+            second = authenticated_client.get(url)
+
+        assert second.data == first.data
+
+        Dataset.objects.create(
+            title='New Dataset',
+            filename='new.xlsx',
+            file_size=1000,
+            record_count=4,
+            category='grades',
+            uploaded_by=test_user
+        )
+
+        response = authenticated_client.get(url)
+
+        assert response.data['total_datasets'] == first.data['total_datasets'] + 1
+        assert response.data['total_records'] == first.data['total_records'] + 4
+
     def test_overview_statistics_without_authentication(self, api_client, sample_datasets_with_records):
         """
         @TEST:ANALYTICS-004
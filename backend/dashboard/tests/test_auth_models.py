@@ -9,6 +9,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
+from io import StringIO
 from rest_framework_simplejwt.tokens import RefreshToken
 
 
@@ -133,13 +134,14 @@ class TestBlacklistedTokenModel:
         expires_at = timezone.now() + timedelta(days=7)
 
         blacklisted = BlacklistedToken.objects.create(
-            token=token_string,
+            token_hash=BlacklistedToken.hash_token(token_string),
             user=user,
             reason='logout',
             expires_at=expires_at
         )
 
-        assert blacklisted.token == token_string
+        assert blacklisted.token_hash == BlacklistedToken.hash_token(token_string)
+        assert len(blacklisted.token_hash) == 64
         assert blacklisted.user == user
         assert blacklisted.reason == 'logout'
         assert blacklisted.created_at is not None  # AbstractTimestampModel provides created_at
@@ -155,11 +157,11 @@ class TestBlacklistedTokenModel:
         refresh = RefreshToken.for_user(user)
         token_string = str(refresh)
 
-        BlacklistedToken.objects.create(token=token_string, user=user, expires_at=timezone.now() + timedelta(days=7))
+        BlacklistedToken.objects.create(token_hash=BlacklistedToken.hash_token(token_string), user=user, expires_at=timezone.now() + timedelta(days=7))
 
         # Attempting to create duplicate should raise IntegrityError
         with pytest.raises(Exception):  # IntegrityError
-            BlacklistedToken.objects.create(token=token_string, user=user, expires_at=timezone.now() + timedelta(days=7))
+            BlacklistedToken.objects.create(token_hash=BlacklistedToken.hash_token(token_string), user=user, expires_at=timezone.now() + timedelta(days=7))
 
     def test_blacklisted_token_query_by_token(self):
         """
@@ -172,12 +174,34 @@ class TestBlacklistedTokenModel:
         refresh = RefreshToken.for_user(user)
         token_string = str(refresh)
 
-        BlacklistedToken.objects.create(token=token_string, user=user, expires_at=timezone.now() + timedelta(days=7))
+        BlacklistedToken.objects.create(token_hash=BlacklistedToken.hash_token(token_string), user=user, expires_at=timezone.now() + timedelta(days=7))
 
         # Should be able to quickly check if token is blacklisted
-        exists = BlacklistedToken.objects.filter(token=token_string).exists()
+        exists = BlacklistedToken.objects.filter(
+            token_hash=BlacklistedToken.hash_token(token_string)
+        ).exists()
         assert exists is True
 
+    def test_delete_expired_tokens_command(self):
+        """
+        @TEST:AUTH-002.4 - Cleanup command removes only expired tokens, in batches
+        """
+        from django.core.management import call_command
+        from users.models import BlacklistedToken
+
+        user = User.objects.create_user(username='testuser', password='test')
+        now = timezone.now()
+
+        for i in range(5):
+            BlacklistedToken.objects.create(token_hash=BlacklistedToken.hash_token(f'expired-{i}'), user=user, expires_at=now - timedelta(hours=1))
+        BlacklistedToken.objects.create(token_hash=BlacklistedToken.hash_token('active'), user=user, expires_at=now + timedelta(days=7))
+
+        call_command('delete_expired_tokens', batch_size=2, stdout=StringIO())
+
+        assert list(BlacklistedToken.objects.values_list('token_hash', flat=True)) == [
+            BlacklistedToken.hash_token('active')
+        ]
+
 
 @pytest.mark.django_db
 @pytest.mark.unit
@@ -288,3 +312,63 @@ class TestAuthLogModel:
 
         assert log.details['required_role'] == 'admin'
         assert log.details['current_role'] == 'viewer'
+
+    def test_auth_log_partition_months(self):
+        """
+        @TEST:AUTH-003.5 - Monthly partition bounds and names are computed in UTC
+        """
+        from datetime import datetime, timezone as dt_timezone
+        from users.partitions import add_months, month_start, partition_name
+
+        value = datetime(2024, 12, 31, 23, 30, tzinfo=dt_timezone(timedelta(hours=-5)))
+        month = month_start(value)
+
+        assert month == datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+        assert add_months(month, 11) == datetime(2025, 12, 1, tzinfo=dt_timezone.utc)
+        assert add_months(month, -1) == datetime(2024, 12, 1, tzinfo=dt_timezone.utc)
+        assert partition_name(month) == 'auth_logs_y2025m01'
+
+    def test_manage_partitions_command_skips_unpartitioned_database(self):
+        """
+        @TEST:AUTH-003.6 - Partition maintenance is a no-op outside PostgreSQL
+        """
+        from django.core.management import call_command
+        from django.db import connection
+
+        if connection.vendor == 'postgresql':
+            pytest.skip('auth_logs is partitioned on PostgreSQL')
+
+        out = StringIO()
+        call_command('manage_auth_log_partitions', stdout=out)
+
+        assert 'nothing to do' in out.getvalue()
+
+    def test_partition_takes_rows_from_default_partition(self):
+        """
+        @TEST:AUTH-003.7 - Creating a month's partition moves its rows out of the default partition
+        """
+        from datetime import datetime, timezone as dt_timezone
+        from django.db import connection
+        from users.models import AuthLog
+        from users.partitions import create_monthly_partitions
+
+        if connection.vendor != 'postgresql':
+            pytest.skip('auth_logs is only partitioned on PostgreSQL')
+
+        month = datetime(2099, 1, 15, tzinfo=dt_timezone.utc)
+        log = AuthLog.objects.create(
+            username_attempted='future',
+            event_type='login_failed',
+            ip_address='192.168.1.1',
+            user_agent='Test',
+            success=False
+        )
+        AuthLog.objects.filter(pk=log.pk).update(created_at=month)
+
+        create_monthly_partitions(month, month)
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT tableoid::regclass::text FROM auth_logs WHERE id = %s', [log.pk])
+            assert cursor.fetchone()[0] == 'auth_logs_y2099m01'
+            cursor.execute('SELECT count(*) FROM auth_logs_default')
+            assert cursor.fetchone()[0] == 0
@@ -144,6 +144,30 @@ class TestLoginSerializer:
         assert serializer.is_valid() is False
         assert 'password' in serializer.errors
 
+    def test_client_info_from_context(self):
+        """
+        @TEST:AUTH-SERIALIZER-014
+        Client info in the context fills omitted fields and is validated like input
+        """
+        from users.presentation.serializers import LoginSerializer
+
+        context = {'ip_address': '10.0.0.1', 'user_agent': 'Mozilla/5.0'}
+
+        serializer = LoginSerializer(
+            data={'username': 'validuser', 'password': 'ValidPass123!', 'ip_address': '192.168.1.1'},
+            context=context
+        )
+        assert serializer.is_valid() is True
+        assert serializer.validated_data['ip_address'] == '192.168.1.1'
+        assert serializer.validated_data['user_agent'] == 'Mozilla/5.0'
+
+        serializer = LoginSerializer(
+            data={'username': 'validuser', 'password': 'ValidPass123!'},
+            context={'ip_address': 'not-an-ip', 'user_agent': ''}
+        )
+        assert serializer.is_valid() is False
+        assert 'ip_address' in serializer.errors
+
 
 @pytest.mark.django_db
 @pytest.mark.unit
@@ -13,6 +13,7 @@ BR-007: Account lock check
 BR-009: 5-failure account lock (15 min)
 """
 import pytest
+from unittest import mock
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
@@ -57,6 +58,36 @@ class TestLoginUseCase:
         assert result['user']['username'] == 'testuser'
         assert result['user']['role'] == 'manager'
 
+    def test_login_tokens_carry_user_claims(self):
+        """
+        @TEST:AUTH-SERVICE-016 - Issued tokens identify the user without outstanding-token rows
+        BR-005: JWT token generation
+        """
+        from users.application.auth_service import LoginUseCase
+        from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+        from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='ValidPassword123!',
+            role='manager'
+        )
+
+        result = LoginUseCase().login(
+            username='testuser',
+            password='ValidPassword123!',
+            ip_address='192.168.1.1',
+            user_agent='Mozilla/5.0'
+        )
+
+        assert result['success'] is True
+        for token in (AccessToken(result['access_token']), RefreshToken(result['refresh_token'])):
+            assert token['user_id'] == str(user.id)
+            assert token['role'] == 'manager'
+            assert token['username'] == 'testuser'
+
+        assert not OutstandingToken.objects.exists()
+
     def test_login_with_wrong_password_fails(self):
         """
         @TEST:AUTH-SERVICE-002 - Login with wrong password fails
@@ -107,6 +138,27 @@ class TestLoginUseCase:
         assert result['error_code'] == 'AUTH-001'
         assert 'Invalid credentials' in result['message']
 
+    def test_login_with_nonexistent_user_hashes_password(self):
+        """
+        @TEST:AUTH-SERVICE-015 - Unknown usernames still run a password hash
+        Rejecting them must not be measurably faster than a wrong password
+        """
+        from users.application import auth_service
+
+        with mock.patch.object(
+            auth_service, 'check_password', wraps=auth_service.check_password
+        ) as check_password:
+            result = auth_service.LoginUseCase().login(
+                username='nonexistent',
+                password='Password123!',
+                ip_address='192.168.1.1',
+                user_agent='Test'
+            )
+
+        assert result['success'] is False
+        check_password.assert_called_once()
+        assert check_password.call_args.args[0] == 'Password123!'
+
     def test_login_with_locked_account_fails(self):
         """
         @TEST:AUTH-SERVICE-004 - Login with locked account fails
@@ -207,6 +259,38 @@ class TestLoginUseCase:
         assert result['success'] is False
         assert result['error_code'] == 'AUTH-003'
 
+    def test_expired_lockout_starts_new_failure_count(self, django_assert_num_queries):
+        """
+        @TEST:AUTH-SERVICE-017 - An expired lockout is not written on check
+        BR-009: The next failure after a lockout starts counting from one
+        """
+        from users.application.auth_service import LoginUseCase
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+        user.failed_login_attempts = 5
+        user.account_locked_until = timezone.now() - timedelta(minutes=1)
+        user.save()
+
+        with django_assert_num_queries(0):
+            assert user.is_account_locked() is False
+
+        result = LoginUseCase().login(
+            username='testuser',
+            password='WrongPassword123!',
+            ip_address='192.168.1.1',
+            user_agent='Test'
+        )
+
+        assert result['error_code'] == 'AUTH-001'
+
+        user.refresh_from_db()
+        assert user.failed_login_attempts == 1
+        assert user.account_locked_until is None
+
     def test_inactive_user_cannot_login(self):
         """
         @TEST:AUTH-SERVICE-007 - Inactive users cannot login
@@ -267,6 +351,93 @@ class TestLoginUseCase:
         assert log.ip_address == '192.168.1.100'
         assert log.success is True
 
+    def test_failed_login_log_is_written_immediately(self, settings):
+        """
+        @TEST:AUTH-SERVICE-014 - Failed login logs bypass the queue even with AUTH_LOG_BACKGROUND_WRITES
+        """
+        from users.application.auth_service import LoginUseCase
+        from users.application.auth_log_writer import AuthLogWriter
+        from users.models import AuthLog
+
+        settings.AUTH_LOG_BACKGROUND_WRITES = True
+
+        User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        with mock.patch.object(AuthLogWriter, 'write') as write:
+            result = LoginUseCase().login(
+                username='testuser',
+                password='WrongPassword123!',
+                ip_address='192.168.1.1',
+                user_agent='Test'
+            )
+
+        assert result['success'] is False
+        write.assert_not_called()
+
+        log = AuthLog.objects.get()
+        assert log.event_type == 'login_failed'
+        assert log.failure_reason == 'Invalid password'
+
+    def test_successful_login_log_is_written_in_background(self, settings, django_assert_num_queries):
+        """
+        @TEST:AUTH-SERVICE-025 - Successful logins only run the user UPDATE when logs are queued
+        """
+        from users.application.auth_service import LoginUseCase
+        from users.application.auth_log_writer import AuthLogWriter, auth_log_writer
+        from users.models import AuthLog
+
+        settings.AUTH_LOG_BACKGROUND_WRITES = True
+
+        User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        with mock.patch.object(AuthLogWriter, '_start'):
+            # User lookup and the login UPDATE
+            with django_assert_num_queries(2):
+                result = LoginUseCase().login(
+                    username='testuser',
+                    password='Password123!',
+                    ip_address='192.168.1.1',
+                    user_agent='Test'
+                )
+
+            assert result['success'] is True
+            assert not AuthLog.objects.exists()
+
+            queued_at = timezone.now()
+            auth_log_writer.flush()
+
+        log = AuthLog.objects.get()
+        assert log.event_type == 'login_success'
+        # created_at is the time of the event, not of the insert
+        assert log.created_at < queued_at
+
+    def test_auth_log_writer_retries_failed_batch_per_row(self):
+        """
+        @TEST:AUTH-SERVICE-026 - A failed batch INSERT falls back to one INSERT per row
+        """
+        from users.application.auth_log_writer import AuthLogWriter
+        from users.models import AuthLog
+
+        logs = [
+            AuthLog(username_attempted=f'user{index}', event_type='logout', ip_address='192.168.1.1')
+            for index in range(3)
+        ]
+
+        with mock.patch.object(AuthLog.objects, 'bulk_create', side_effect=RuntimeError('batch failed')):
+            AuthLogWriter()._insert(logs)
+
+        assert sorted(AuthLog.objects.values_list('username_attempted', flat=True)) == [
+            'user0', 'user1', 'user2'
+        ]
+
 
 @pytest.mark.django_db
 @pytest.mark.unit
@@ -301,7 +472,9 @@ class TestLogoutUseCase:
         assert result['success'] is True
 
         # Check token is blacklisted
-        assert BlacklistedToken.objects.filter(token=refresh_token).exists()
+        assert BlacklistedToken.objects.filter(
+            token_hash=BlacklistedToken.hash_token(refresh_token)
+        ).exists()
 
     def test_logout_creates_auth_log(self):
         """
@@ -333,3 +506,269 @@ class TestLogoutUseCase:
         log = AuthLog.objects.latest('created_at')
         assert log.event_type == 'logout'
         assert log.user == user
+
+    def test_logged_out_token_is_rejected_from_cache(self, django_assert_num_queries):
+        """
+        @TEST:AUTH-SERVICE-011 - Blacklist checks after logout are served by the cache
+        BR-006: Token blacklisting
+        """
+        from users.application.auth_service import LoginUseCase, AuthErrorCodes
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+
+        use_case = LoginUseCase()
+        assert use_case.logout(user=user, refresh_token=refresh_token)['success'] is True
+
+        with django_assert_num_queries(0):
+            result = use_case.refresh_access_token(refresh_token)
+
+        assert result['success'] is False
+        assert result['error_code'] == AuthErrorCodes.TOKEN_REVOKED
+
+    def test_blacklisted_token_is_cached_after_database_lookup(self, django_assert_num_queries):
+        """
+        @TEST:AUTH-SERVICE-012 - A blacklist row found in the database is cached
+        """
+        from users.models import BlacklistedToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+        BlacklistedToken.objects.create(
+            token_hash=BlacklistedToken.hash_token(refresh_token),
+            user=user,
+            expires_at=timezone.now() + timedelta(days=1)
+        )
+
+        with django_assert_num_queries(1):
+            assert BlacklistedToken.is_blacklisted(refresh_token) is True
+
+        with django_assert_num_queries(0):
+            assert BlacklistedToken.is_blacklisted(refresh_token) is True
+
+    def test_expired_blacklist_entry_is_ignored(self):
+        """
+        @TEST:AUTH-SERVICE-013 - Expired blacklist rows no longer block a token
+        """
+        from users.models import BlacklistedToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        BlacklistedToken.objects.create(
+            token_hash=BlacklistedToken.hash_token('expired-token'),
+            user=user,
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        assert BlacklistedToken.is_blacklisted('expired-token') is False
+
+    def test_filter_blacklisted_checks_tokens_in_one_query(self, django_assert_num_queries):
+        """
+        @TEST:AUTH-SERVICE-019 - Batch blacklist checks use one query for cache misses
+        """
+        from users.models import BlacklistedToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        for token in ('revoked-1', 'revoked-2'):
+            BlacklistedToken.objects.create(
+                token_hash=BlacklistedToken.hash_token(token),
+                user=user,
+                expires_at=timezone.now() + timedelta(days=1)
+            )
+        BlacklistedToken.objects.create(
+            token_hash=BlacklistedToken.hash_token('expired'),
+            user=user,
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        tokens = ['revoked-1', 'revoked-2', 'expired', 'active']
+
+        with django_assert_num_queries(1):
+            assert BlacklistedToken.filter_blacklisted(tokens) == {'revoked-1', 'revoked-2'}
+
+        # Found rows were cached; only the unknown tokens are queried again
+        with django_assert_num_queries(1):
+            assert BlacklistedToken.filter_blacklisted(tokens) == {'revoked-1', 'revoked-2'}
+
+        with django_assert_num_queries(0):
+            assert BlacklistedToken.filter_blacklisted(['revoked-1', 'revoked-2']) == {'revoked-1', 'revoked-2'}
+            assert BlacklistedToken.filter_blacklisted([]) == set()
+
+    def test_concurrent_refreshes_share_one_access_token(self):
+        """
+        @TEST:AUTH-SERVICE-020 - Sibling refreshes with one token return the same access token
+        """
+        from users.application.auth_service import LoginUseCase, AuthErrorCodes
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+        use_case = LoginUseCase()
+
+        first = use_case.refresh_access_token(refresh_token)
+        second = use_case.refresh_access_token(refresh_token)
+
+        assert first['success'] is True
+        assert second['access_token'] == first['access_token']
+
+        # The reused access token is not handed out once the token is revoked
+        assert use_case.logout(user=user, refresh_token=refresh_token)['success'] is True
+        result = use_case.refresh_access_token(refresh_token)
+        assert result['error_code'] == AuthErrorCodes.TOKEN_REVOKED
+
+    def test_refresh_waits_for_lock_then_proceeds(self):
+        """
+        @TEST:AUTH-SERVICE-021 - A refresh blocked by a stale lock still succeeds after the timeout
+        """
+        from django.core.cache import cache
+        from users.application import refresh_lock
+        from users.application.auth_service import LoginUseCase
+        from users.models import BlacklistedToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+        key = refresh_lock.REFRESH_LOCK_PREFIX + BlacklistedToken.hash_token(refresh_token)
+        cache.set(key, 'other-request', refresh_lock.REFRESH_LOCK_TTL)
+
+        with mock.patch.object(refresh_lock, 'REFRESH_LOCK_BLOCKING_TIMEOUT', 0.1):
+            result = LoginUseCase().refresh_access_token(refresh_token)
+
+        assert result['success'] is True
+        # The lock taken by the other request is left in place
+        assert cache.get(key) == 'other-request'
+
+    def test_tokens_issued_in_same_second_are_distinct(self):
+        """
+        @TEST:AUTH-SERVICE-022 - Each issued token carries its own jti
+        Two logins within one second must not produce the same refresh token
+        """
+        from users.application.auth_service import LoginUseCase
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        use_case = LoginUseCase()
+        issued_at = timezone.now()
+        with mock.patch('rest_framework_simplejwt.tokens.aware_utcnow', return_value=issued_at):
+            first = use_case.login(username='testuser', password='Password123!', ip_address='127.0.0.1', user_agent='')
+            second = use_case.login(username='testuser', password='Password123!', ip_address='127.0.0.1', user_agent='')
+
+        assert first['refresh_token'] != second['refresh_token']
+        assert RefreshToken(first['refresh_token'], verify=False)['jti'] != RefreshToken(second['refresh_token'], verify=False)['jti']
+
+    def test_repeated_logout_is_idempotent(self):
+        """
+        @TEST:AUTH-SERVICE-023 - Logging out twice with one token succeeds and stores one row
+        """
+        from users.application.auth_service import LoginUseCase
+        from users.models import BlacklistedToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+        use_case = LoginUseCase()
+
+        assert use_case.logout(user=user, refresh_token=refresh_token)['success'] is True
+        assert use_case.logout(user=user, refresh_token=refresh_token)['success'] is True
+        assert BlacklistedToken.objects.count() == 1
+
+    def test_valid_token_lookup_is_cached_with_shared_cache(self, settings, django_assert_num_queries):
+        """
+        @TEST:AUTH-SERVICE-024 - "Not blacklisted" answers are cached, and logout overrides them
+        """
+        from users.application.auth_service import LoginUseCase
+        from users.models import BlacklistedToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        settings.BLACKLIST_NEGATIVE_CACHE_TIMEOUT = 300
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+
+        with django_assert_num_queries(1):
+            assert BlacklistedToken.is_blacklisted(refresh_token) is False
+        with django_assert_num_queries(0):
+            assert BlacklistedToken.is_blacklisted(refresh_token) is False
+            assert BlacklistedToken.filter_blacklisted([refresh_token]) == set()
+
+        assert LoginUseCase().logout(user=user, refresh_token=refresh_token)['success'] is True
+
+        with django_assert_num_queries(0):
+            assert BlacklistedToken.is_blacklisted(refresh_token) is True
+
+    def test_raw_refresh_token_never_reaches_the_database(self):
+        """
+        @TEST:AUTH-SERVICE-018 - Blacklist writes and lookups use the token digest only
+        Comparisons then run on SHA-256 digests, never on the secret token
+        """
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from users.application.auth_service import LoginUseCase
+        from users.models import BlacklistedToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        user = User.objects.create_user(
+            username='testuser',
+            password='Password123!',
+            role='viewer'
+        )
+
+        refresh_token = str(RefreshToken.for_user(user))
+
+        with CaptureQueriesContext(connection) as queries:
+            assert LoginUseCase().logout(user=user, refresh_token=refresh_token)['success'] is True
+
+            # Force the database path of the blacklist check
+            cache.clear()
+            assert BlacklistedToken.is_blacklisted(refresh_token) is True
+
+        token_hash = BlacklistedToken.hash_token(refresh_token)
+        assert any(token_hash in query['sql'] for query in queries.captured_queries)
+        assert not any(refresh_token in query['sql'] for query in queries.captured_queries)
@@ -75,6 +75,68 @@ class TestLoginView:
         assert response.data['user']['username'] == 'testuser'
         assert response.data['user']['role'] == 'viewer'
 
+    def test_login_records_forwarded_client_ip(self, api_client, test_user, settings):
+        """
+        @TEST:AUTH-VIEW-017
+        The audit log takes the X-Forwarded-For entry appended by the trusted
+        proxy, ignoring client-supplied entries to its left, and REMOTE_ADDR
+        when the header is not trusted or the entry is malformed
+        """
+        from users.models import AuthLog
+
+        url = '/api/auth/login/'
+        data = {'username': 'testuser', 'password': 'TestPass123!'}
+
+        cases = [
+            (True, '203.0.113.7', '203.0.113.7'),
+            (True, '198.51.100.66, 203.0.113.7', '203.0.113.7'),
+            (True, '203.0.113.7, not-an-ip', '127.0.0.1'),
+            (False, '203.0.113.7', '127.0.0.1'),
+        ]
+        for trusted, forwarded_for, expected in cases:
+            settings.TRUST_PROXY_HEADERS = trusted
+            response = api_client.post(url, data, format='json', HTTP_X_FORWARDED_FOR=forwarded_for)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert AuthLog.objects.filter(event_type='login_success').latest('id').ip_address == expected
+
+    def test_client_info_middleware_sets_request_attributes(self, rf, settings):
+        """
+        @TEST:AUTH-VIEW-019
+        ClientInfoMiddleware exposes the resolved client IP and user agent
+        """
+        from core.middleware import ClientInfoMiddleware
+
+        settings.TRUST_PROXY_HEADERS = True
+        settings.TRUSTED_PROXY_COUNT = 2
+        request = rf.get(
+            '/', HTTP_X_FORWARDED_FOR='198.51.100.66, 2001:db8::1, 10.0.0.1', HTTP_USER_AGENT='Mozilla/5.0'
+        )
+        ClientInfoMiddleware(lambda request: None)(request)
+
+        assert request.client_ip == '2001:db8::1'
+        assert request.client_user_agent == 'Mozilla/5.0'
+
+        # A chain shorter than the proxy count cannot hold the client entry
+        request = rf.get('/', HTTP_X_FORWARDED_FOR='2001:db8::1')
+        ClientInfoMiddleware(lambda request: None)(request)
+
+        assert request.client_ip == '127.0.0.1'
+
+    def test_auth_responses_are_not_cached(self, api_client, test_user):
+        """
+        @TEST:AUTH-VIEW-021
+        Token-bearing auth responses must tell caches not to store them
+        """
+        response = api_client.post('/api/auth/login/', {'username': 'testuser', 'password': 'TestPass123!'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert 'no-store' in response['Cache-Control']
+        assert 'ETag' not in response
+
+        response = api_client.post('/api/auth/refresh/', {'refresh_token': response.data['refresh_token']}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert 'no-store' in response['Cache-Control']
+
     def test_login_with_invalid_credentials(self, api_client, test_user):
         """
         @TEST:AUTH-VIEW-002
@@ -267,6 +329,37 @@ class TestTokenRefreshView:
         assert 'access_token' in response.data
         assert response.data['success'] is True
 
+    def test_token_refresh_returns_current_access_token(self, api_client, test_user, admin_user):
+        """
+        @TEST:AUTH-VIEW-020
+        A fresh access token of the same user is returned instead of a new one
+        """
+        from unittest import mock
+        from users.application import auth_service
+
+        refresh = RefreshToken.for_user(test_user)
+        access_token = str(refresh.access_token)
+        url = '/api/auth/refresh/'
+        data = {'refresh_token': str(refresh)}
+
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = api_client.post(url, data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['access_token'] == access_token
+
+        # Too little time left: a new token is issued
+        with mock.patch.object(auth_service, 'ACCESS_TOKEN_MIN_REMAINING', 10 ** 9):
+            response = api_client.post(url, data, format='json')
+        assert response.data['access_token'] != access_token
+
+        # Another user's access token is never handed back
+        other_access_token = str(RefreshToken.for_user(admin_user).access_token)
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {other_access_token}')
+        response = api_client.post(url, data, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['access_token'] != other_access_token
+
     def test_token_refresh_with_blacklisted_token(self, api_client, test_user):
         """
         @TEST:AUTH-VIEW-011
@@ -282,7 +375,7 @@ class TestTokenRefreshView:
         # Blacklist the token
         expires_at = timezone.now() + timedelta(days=7)
         BlacklistedToken.objects.create(
-            token=refresh_token,
+            token_hash=BlacklistedToken.hash_token(refresh_token),
             user=test_user,
             reason='logout',
             expires_at=expires_at
@@ -321,3 +414,87 @@ class TestTokenRefreshView:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'refresh_token' in response.data
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestUserViewSet:
+    """
+    @TEST:AUTH-VIEW-004
+    Tests for GET /api/users/
+    """
+
+    def test_admin_user_list_query_count_is_constant(self, api_client, admin_user, test_user, django_assert_num_queries):
+        """
+        @TEST:AUTH-VIEW-014
+        Role checks read the loaded request user, so listing takes the same
+        queries however many users there are
+        """
+        for i in range(5):
+            User.objects.create_user(username=f'user{i}', password='TestPass123!')
+
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(admin_user).access_token}')
+
+        # Authenticated user, page count, page rows
+        with django_assert_num_queries(3):
+            response = api_client.get('/api/users/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 7
+
+    def test_non_admin_user_list_contains_only_self(self, api_client, admin_user, test_user):
+        """
+        @TEST:AUTH-VIEW-015
+        Non-admin users should only see themselves
+        """
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(test_user).access_token}')
+
+        response = api_client.get('/api/users/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [user['username'] for user in response.data['results']] == ['testuser']
+
+    def test_user_list_is_paginated_without_password_column(self, api_client, admin_user):
+        """
+        @TEST:AUTH-VIEW-016
+        The listing pages 50 users at a time and never selects password hashes
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        User.objects.bulk_create([
+            User(username=f'user{i:02d}', password='!') for i in range(60)
+        ])
+
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(admin_user).access_token}')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get('/api/users/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 61
+        assert len(response.data['results']) == 50
+        assert 'role' in response.data['results'][0]
+        # The last query loads the page
+        assert '"password"' not in queries.captured_queries[-1]['sql']
+
+    def test_user_list_matches_user_serializer(self, api_client, admin_user, test_user):
+        """
+        @TEST:AUTH-VIEW-018
+        Rows built from values() should equal UserSerializer output
+        """
+        from django.utils import timezone
+        from users.presentation.serializers import UserSerializer
+
+        User.objects.filter(pk=test_user.pk).update(
+            last_login=timezone.now(),
+            full_name='홍길동',
+            department='Engineering'
+        )
+
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(admin_user).access_token}')
+
+        response = api_client.get('/api/users/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['results'] == UserSerializer(User.objects.order_by('username'), many=True).data
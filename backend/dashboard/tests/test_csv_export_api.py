@@ -14,10 +14,13 @@ Test Coverage:
 import pytest
 import csv
 import io
+from unittest import mock
+from django.db import connection
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 from dashboard.models import Dataset, DataRecord
+from dashboard.views import DatasetViewSet
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -94,6 +97,10 @@ class TestCSVExportAPI:
             ),
         ]
 
+    def get_csv_content(self, response):
+        """Helper: Collect and decode the streamed CSV body of an export response."""
+        return b''.join(response.streaming_content).decode('utf-8-sig')
+
     def test_csv_export_requires_authentication(self):
         """
         @SPEC:REQ-EXPORT-001
@@ -161,7 +168,7 @@ class TestCSVExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Check UTF-8 BOM at start of content
-        content = response.content.decode('utf-8-sig')
+        content = self.get_csv_content(response)
         assert content.startswith('name,age,score,enrolled') or 'name' in content[:100]
 
         # Check Korean characters are properly encoded
@@ -181,7 +188,7 @@ class TestCSVExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Parse CSV content
-        content = response.content.decode('utf-8-sig')
+        content = self.get_csv_content(response)
         csv_reader = csv.DictReader(io.StringIO(content))
 
         # Check headers
@@ -205,7 +212,7 @@ class TestCSVExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Parse CSV content
-        content = response.content.decode('utf-8-sig')
+        content = self.get_csv_content(response)
         csv_reader = csv.DictReader(io.StringIO(content))
         rows = list(csv_reader)
 
@@ -232,7 +239,7 @@ class TestCSVExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Parse CSV content
-        content = response.content.decode('utf-8-sig')
+        content = self.get_csv_content(response)
         csv_reader = csv.DictReader(io.StringIO(content))
         rows = list(csv_reader)
 
@@ -281,10 +288,32 @@ class TestCSVExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Should still have headers even if no data
-        content = response.content.decode('utf-8-sig')
+        content = self.get_csv_content(response)
         lines = content.strip().split('\n')
         assert len(lines) >= 1  # At least header row
 
+    def test_csv_export_empty_dataset_with_fieldnames(self):
+        """
+        Test CSV export for an imported dataset without records.
+
+        Expected: 200 OK with the stored header row
+        """
+        empty_dataset = Dataset.objects.create(
+            title='Empty Dataset',
+            filename='empty.xlsx',
+            file_size=512,
+            record_count=0,
+            fieldnames=['name', 'age'],
+            uploaded_by=self.admin_user
+        )
+
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-csv', kwargs={'pk': empty_dataset.pk})
+        response = self.client.post(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.get_csv_content(response) == 'name,age\n'
+
     def test_csv_export_nonexistent_dataset(self):
         """
         Test CSV export for non-existent dataset.
@@ -347,7 +376,7 @@ class TestCSVExportAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
-        content = response.content.decode('utf-8-sig')
+        content = self.get_csv_content(response)
         csv_reader = csv.DictReader(io.StringIO(content))
         rows = list(csv_reader)
 
@@ -356,3 +385,82 @@ class TestCSVExportAPI:
 
         # Null values should be empty strings or "None"
         assert test_row['age'] in ['', 'None', 'null']
+
+    def test_csv_export_streams_in_chunks(self):
+        """
+        Test that CSV export streams rows across several chunks.
+
+        Expected: BOM first, then every record split over multiple chunks
+        """
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-csv', kwargs={'pk': self.dataset.pk})
+
+        with mock.patch('dashboard.views.EXPORT_CHUNK_SIZE', 1):
+            response = self.client.post(url)
+            chunks = list(response.streaming_content)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert chunks[0] == '\ufeff'.encode('utf-8')
+        assert len(chunks) > 2
+
+        rows = list(csv.DictReader(io.StringIO(b''.join(chunks).decode('utf-8-sig'))))
+        assert [row['name'] for row in rows] == ['홍길동', 'Jane Smith', 'Test, "User"']
+
+    def test_csv_export_copy_matches_csv_writer(self):
+        """
+        Test that the PostgreSQL COPY export writes the same bytes as csv.writer.
+
+        Expected: Identical output for empty strings, nulls, missing keys,
+        booleans, integers and floats, including one-column datasets
+        """
+        if connection.vendor != 'postgresql':
+            pytest.skip('COPY export is only used on PostgreSQL')
+
+        for data in [
+            {'name': '', 'age': None, 'score': 1.0, 'enrolled': False},
+            {'name': 'Line\nbreak', 'score': 1e-05, 'enrolled': True},
+            {'name': ' padded', 'age': 2 ** 53 + 1, 'score': -1.5e-07},
+            {'name': 'Large', 'age': 0, 'score': 9.5e15},
+            {'name': 'Zero', 'age': -3, 'score': 0.0},
+        ]:
+            DataRecord.objects.create(dataset=self.dataset, data=data)
+
+        one_column = Dataset.objects.create(
+            title='One column',
+            filename='one.xlsx',
+            file_size=1,
+            uploaded_by=self.admin_user,
+            fieldnames=['name']
+        )
+        for name in ['', None, 'x']:
+            DataRecord.objects.create(dataset=one_column, data={'name': name})
+
+        view = DatasetViewSet()
+        for dataset, fieldnames in [
+            (self.dataset, ['name', 'age', 'score', 'enrolled']),
+            (one_column, ['name']),
+        ]:
+            dataset.fieldnames = fieldnames
+            assert DataRecord.objects.copy_csv_matches(dataset)
+
+            records = dataset.records.values_list('data', flat=True)
+            expected = ''.join(view._iter_csv_chunks(fieldnames, iter(records))).encode('utf-8')
+
+            assert b''.join(view._iter_copied_csv_chunks(dataset)) == expected
+
+    def test_csv_export_copy_skips_nested_values(self):
+        """
+        Test that datasets COPY cannot write like csv.writer are detected.
+
+        Expected: copy_csv_matches is False for nested values, carriage
+        returns and numbers from 1e16 on
+        """
+        if connection.vendor != 'postgresql':
+            pytest.skip('COPY export is only used on PostgreSQL')
+
+        assert DataRecord.objects.copy_csv_matches(self.dataset)
+
+        for data in [{'name': ['a', 'b']}, {'name': 'a\rb'}, {'score': 1e16}, {'score': -1.5e300}]:
+            record = DataRecord.objects.create(dataset=self.dataset, data=data)
+            assert not DataRecord.objects.copy_csv_matches(self.dataset)
+            record.delete()
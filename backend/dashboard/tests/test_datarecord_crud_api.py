@@ -369,3 +369,29 @@ class TestDataRecordCRUD:
 
         # Verify all records were created
         assert DataRecord.objects.filter(dataset=sample_dataset).count() >= 10
+
+    def test_record_data_round_trip(self, authenticated_client, sample_dataset):
+        """
+        @TEST:DATARECORD-CRUD-015
+        Verify record payloads are stored and read back unchanged
+        """
+        payload = {
+            'name': '홍길동',
+            'gpa': 3.85,
+            'enrolled': True,
+            'note': None,
+            'tags': ['a', 'b'],
+            # Not representable as a float: checks integer precision
+            'big': 2 ** 70 + 1
+        }
+        record = DataRecord.objects.create(dataset=sample_dataset, data=payload)
+
+        record.refresh_from_db()
+        assert record.data == payload
+
+        # Key lookups still work on the stored JSON
+        assert DataRecord.objects.filter(data__name='홍길동').get() == record
+
+        response = authenticated_client.get(f'/api/records/{record.id}/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['data'] == payload
@@ -9,13 +9,23 @@ Tests the Dataset CRUD endpoints.
 
 import pytest
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 from rest_framework import status
 
 from dashboard.models import Dataset, DataRecord
+from dashboard.views import DatasetViewSet
 
 User = get_user_model()
 
+# Detail view called directly by the factory-based tests below, skipping
+# URL resolution and the middleware stack
+dataset_detail_view = DatasetViewSet.as_view({
+    'get': 'retrieve',
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+
 
 @pytest.fixture
 def api_client():
@@ -23,6 +33,12 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture
+def api_factory():
+    """Fixture for DRF request factory"""
+    return APIRequestFactory()
+
+
 @pytest.fixture
 def test_user(db):
     """Fixture for creating a test user"""
@@ -115,14 +131,16 @@ class TestDatasetCRUD:
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_retrieve_dataset(self, authenticated_client, sample_dataset):
+    def test_retrieve_dataset(self, api_factory, test_user, sample_dataset):
         """
         @TEST:DATASET-CRUD-003
         Retrieve a specific dataset by ID
         """
         url = f'/api/datasets/{sample_dataset.id}/'
 
-        response = authenticated_client.get(url)
+        request = api_factory.get(url)
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=sample_dataset.id)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['id'] == sample_dataset.id
@@ -135,18 +153,20 @@ class TestDatasetCRUD:
         assert 'records' in response.data
         assert len(response.data['records']) == 3
 
-    def test_retrieve_nonexistent_dataset(self, authenticated_client):
+    def test_retrieve_nonexistent_dataset(self, api_factory, test_user):
         """
         @TEST:DATASET-CRUD-004
         Retrieve nonexistent dataset should return 404
         """
         url = '/api/datasets/99999/'
 
-        response = authenticated_client.get(url)
+        request = api_factory.get(url)
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=99999)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_update_dataset_put(self, authenticated_client, sample_dataset):
+    def test_update_dataset_put(self, api_factory, test_user, sample_dataset):
         """
         @TEST:DATASET-CRUD-005
         Update dataset using PUT (full update)
@@ -159,7 +179,9 @@ class TestDatasetCRUD:
             'category': 'updated_category',
         }
 
-        response = authenticated_client.put(url, data)
+        request = api_factory.put(url, data, format='json')
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=sample_dataset.id)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['title'] == 'Updated Dataset Title'
@@ -171,7 +193,7 @@ class TestDatasetCRUD:
         assert sample_dataset.title == 'Updated Dataset Title'
         assert sample_dataset.description == 'Updated description'
 
-    def test_update_dataset_patch(self, authenticated_client, sample_dataset):
+    def test_update_dataset_patch(self, api_factory, test_user, sample_dataset):
         """
         @TEST:DATASET-CRUD-006
         Update dataset using PATCH (partial update)
@@ -182,7 +204,9 @@ class TestDatasetCRUD:
             'title': 'Partially Updated Title',
         }
 
-        response = authenticated_client.patch(url, data)
+        request = api_factory.patch(url, data, format='json')
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=sample_dataset.id)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['title'] == 'Partially Updated Title'
@@ -194,7 +218,7 @@ class TestDatasetCRUD:
         assert sample_dataset.title == 'Partially Updated Title'
         assert sample_dataset.description == 'Test data for students'
 
-    def test_update_dataset_readonly_fields(self, authenticated_client, sample_dataset):
+    def test_update_dataset_readonly_fields(self, api_factory, test_user, sample_dataset):
         """
         @TEST:DATASET-CRUD-007
         Verify read-only fields cannot be updated
@@ -212,7 +236,9 @@ class TestDatasetCRUD:
             'upload_date': '2023-01-01T00:00:00Z',  # Try to change read-only field
         }
 
-        response = authenticated_client.patch(url, data)
+        request = api_factory.patch(url, data, format='json')
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=sample_dataset.id)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['title'] == 'Updated Title'
@@ -223,7 +249,7 @@ class TestDatasetCRUD:
         assert sample_dataset.record_count == original_record_count
         assert sample_dataset.upload_date == original_upload_date
 
-    def test_delete_dataset(self, authenticated_client, sample_dataset):
+    def test_delete_dataset(self, api_factory, test_user, sample_dataset):
         """
         @TEST:DATASET-CRUD-008
         Delete a dataset
@@ -231,7 +257,9 @@ class TestDatasetCRUD:
         url = f'/api/datasets/{sample_dataset.id}/'
         dataset_id = sample_dataset.id
 
-        response = authenticated_client.delete(url)
+        request = api_factory.delete(url)
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=sample_dataset.id)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
@@ -241,14 +269,16 @@ class TestDatasetCRUD:
         # Verify related records are also deleted (CASCADE)
         assert not DataRecord.objects.filter(dataset_id=dataset_id).exists()
 
-    def test_delete_nonexistent_dataset(self, authenticated_client):
+    def test_delete_nonexistent_dataset(self, api_factory, test_user):
         """
         @TEST:DATASET-CRUD-009
         Delete nonexistent dataset should return 404
         """
         url = '/api/datasets/99999/'
 
-        response = authenticated_client.delete(url)
+        request = api_factory.delete(url)
+        force_authenticate(request, user=test_user)
+        response = dataset_detail_view(request, pk=99999)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -34,8 +34,8 @@ class TestExcelParserService:
         Returns:
             BytesIO object containing Excel file
         """
-        wb = Workbook()
-        ws = wb.active
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
 
         for row in data_rows:
             ws.append(row)
@@ -183,6 +183,9 @@ class TestExcelParserService:
         """
         @TEST:EXCEL-PARSER-007
         Reject invalid files (not Excel format)
+
+        The ZIP signature check fails on the first bytes, so no archive
+        is opened for this input.
         """
         from dashboard.services.excel_parser import ExcelParserService
 
@@ -201,11 +204,10 @@ class TestExcelParserService:
         """
         from dashboard.services.excel_parser import ExcelParserService
 
-        wb = Workbook()
+        wb = Workbook(write_only=True)
 
         # Sheet 1 (should be parsed)
-        ws1 = wb.active
-        ws1.title = "Students"
+        ws1 = wb.create_sheet("Students")
         ws1.append(['Name', 'Age'])
         ws1.append(['Alice', 25])
 
@@ -247,3 +249,55 @@ class TestExcelParserService:
         assert metadata['sheet_count'] >= 1
         assert metadata['row_count'] == 3  # header + 2 data rows
         assert metadata['column_count'] == 3
+
+    def test_parse_and_metadata_share_open_zipfile(self):
+        """
+        @TEST:EXCEL-PARSER-010
+        parse() and get_metadata() accept one already open ZipFile
+        """
+        import zipfile
+        from dashboard.services.excel_parser import ExcelParserService
+
+        data = [
+            ['Name', 'Age'],
+            ['Alice', 25],
+        ]
+
+        excel_file = self.create_sample_excel(data)
+
+        parser = ExcelParserService()
+        with zipfile.ZipFile(excel_file) as archive:
+            result = parser.parse(archive)
+            metadata = parser.get_metadata(archive)
+
+            # The caller keeps ownership of the archive
+            assert archive.fp is not None
+
+        assert result['success'] is True
+        assert result['records'] == [{'Name': 'Alice', 'Age': 25}]
+        assert metadata['row_count'] == 2
+        assert metadata['column_count'] == 2
+
+    def test_stream_records_yields_records_lazily(self):
+        """
+        @TEST:EXCEL-PARSER-011
+        stream_records() returns headers up front and records on demand
+        """
+        from dashboard.services.excel_parser import ExcelParserService
+
+        data = [
+            ['Name', 'Age'],
+            ['Alice', 25],
+            ['Bob', 30],
+        ]
+
+        excel_file = self.create_sample_excel(data)
+
+        parser = ExcelParserService()
+        result = parser.stream_records(excel_file)
+
+        assert result['success'] is True
+        assert result['headers'] == ['Name', 'Age']
+        assert not isinstance(result['records'], list)
+        assert next(result['records']) == {'Name': 'Alice', 'Age': 25}
+        assert list(result['records']) == [{'Name': 'Bob', 'Age': 30}]
@@ -9,12 +9,15 @@ Tests the Excel file upload endpoint.
 
 import pytest
 from io import BytesIO
+from unittest import mock
 from django.contrib.auth import get_user_model
+from django.db import connection
 from rest_framework.test import APIClient
 from rest_framework import status
 from openpyxl import Workbook
 
-from dashboard.models import Dataset, DataRecord
+from dashboard.models import Dataset, DataRecord, DatasetColumn
+from dashboard.services import dataset_import
 
 User = get_user_model()
 
@@ -45,10 +48,10 @@ def authenticated_client(api_client, test_user):
     return api_client
 
 
-def create_sample_excel():
-    """Helper: Create a sample Excel file in memory"""
-    wb = Workbook()
-    ws = wb.active
+def build_sample_excel_bytes():
+    """Helper: Serialize the sample student workbook to bytes"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
 
     # Add headers
     ws.append(['Student ID', 'Name', 'GPA', 'Department'])
@@ -60,7 +63,17 @@ def create_sample_excel():
 
     excel_file = BytesIO()
     wb.save(excel_file)
-    excel_file.seek(0)
+
+    return excel_file.getvalue()
+
+
+# The sample workbook never changes, so it is built once per module
+SAMPLE_EXCEL_BYTES = build_sample_excel_bytes()
+
+
+def create_sample_excel():
+    """Helper: Create a sample Excel file in memory"""
+    excel_file = BytesIO(SAMPLE_EXCEL_BYTES)
     excel_file.name = 'students.xlsx'
 
     return excel_file
@@ -156,6 +169,8 @@ class TestFileUploadAPI:
         """
         @TEST:FILE-UPLOAD-004
         Upload non-Excel file should return 400
+
+        Rejected by extension in the view before the parser is called.
         """
         url = '/api/datasets/upload/'
 
@@ -202,8 +217,8 @@ class TestFileUploadAPI:
         url = '/api/datasets/upload/'
 
         # Create empty Excel file
-        wb = Workbook()
-        ws = wb.active
+        wb = Workbook(write_only=True)
+        wb.create_sheet()
 
         excel_file = BytesIO()
         wb.save(excel_file)
@@ -289,3 +304,101 @@ class TestFileUploadAPI:
         assert dataset.record_count == 3
         assert dataset.uploaded_by == test_user
         assert dataset.upload_date is not None
+
+    def test_upload_stores_columns_when_enabled(self, authenticated_client, settings):
+        """
+        @TEST:FILE-UPLOAD-010
+        Columnar storage writes one DatasetColumn per header, across batches
+        """
+        settings.DATASET_COLUMNAR_STORAGE = True
+        settings.DATA_RECORD_BATCH_SIZE = 2
+        url = '/api/datasets/upload/'
+
+        data = {
+            'file': create_sample_excel(),
+            'title': 'Columnar Data'
+        }
+
+        response = authenticated_client.post(url, data, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+        columns = DatasetColumn.objects.filter(dataset_id=response.data['id'])
+        assert [column.name for column in columns] == ['Student ID', 'Name', 'GPA', 'Department']
+        assert columns[0].values == [1001, 1002, 1003]
+        assert columns[1].values == ['Alice', 'Bob', 'Charlie']
+        assert columns[2].values == [3.8, 3.5, 3.9]
+
+        # Row storage is still written for existing readers
+        assert DataRecord.objects.filter(dataset_id=response.data['id']).count() == 3
+
+    def test_upload_inserts_records_in_batches(self, authenticated_client, settings):
+        """
+        @TEST:FILE-UPLOAD-011
+        Records spanning several DATA_RECORD_BATCH_SIZE batches are all stored in order
+        """
+        settings.DATA_RECORD_BATCH_SIZE = 2
+        url = '/api/datasets/upload/'
+
+        data = {
+            'file': create_sample_excel(),
+            'title': 'Batched Data'
+        }
+
+        response = authenticated_client.post(url, data, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['record_count'] == 3
+
+        records = DataRecord.objects.filter(dataset_id=response.data['id'])
+        assert [record.data['Name'] for record in records] == ['Alice', 'Bob', 'Charlie']
+
+    def test_upload_stores_fieldnames(self, authenticated_client):
+        """
+        @TEST:FILE-UPLOAD-012
+        The header row is stored on the dataset for the exports
+        """
+        url = '/api/datasets/upload/'
+
+        data = {
+            'file': create_sample_excel(),
+            'title': 'Header Data'
+        }
+
+        response = authenticated_client.post(url, data, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+        dataset = Dataset.objects.get(id=response.data['id'])
+        assert dataset.fieldnames == ['Student ID', 'Name', 'GPA', 'Department']
+
+    def test_upload_copy_matches_orm_insert(self, authenticated_client, settings):
+        """
+        @TEST:FILE-UPLOAD-013
+        Rows loaded with COPY past COPY_MIN_ROWS are stored like bulk_create stores them
+        """
+        if connection.vendor != 'postgresql':
+            pytest.skip('COPY import is only used on PostgreSQL')
+
+        settings.DATA_RECORD_BATCH_SIZE = 1
+        url = '/api/datasets/upload/'
+
+        stored = {}
+        for title, supports_copy in [('ORM Data', False), ('COPY Data', True)]:
+            with mock.patch.object(dataset_import, 'COPY_MIN_ROWS', 1), \
+                    mock.patch.object(DataRecord.objects, 'supports_copy', return_value=supports_copy), \
+                    mock.patch.object(DataRecord.objects, 'bulk_copy', wraps=DataRecord.objects.bulk_copy) as bulk_copy:
+                response = authenticated_client.post(
+                    url, {'file': create_sample_excel(), 'title': title}, format='multipart'
+                )
+
+            assert response.status_code == status.HTTP_201_CREATED
+            assert response.data['record_count'] == 3
+            # The first batch goes through the ORM, the rest through COPY
+            assert bulk_copy.call_count == (2 if supports_copy else 0)
+
+            records = DataRecord.objects.filter(dataset_id=response.data['id'])
+            assert all(record.created_at and record.updated_at for record in records)
+            stored[supports_copy] = [record.data for record in records]
+
+        assert stored[True] == stored[False]
@@ -50,7 +50,8 @@ class TestDatasetModel:
 
     def test_dataset_ordering(self):
         """Test datasets are ordered by upload_date descending."""
-        import time
+        from datetime import timedelta
+        from django.utils import timezone
         user = User.objects.create_user(username='testuser', password='testpass')
 
         dataset1 = Dataset.objects.create(
@@ -59,10 +60,6 @@ class TestDatasetModel:
             file_size=1024,
             uploaded_by=user
         )
-
-        # Small delay to ensure different timestamps
-        time.sleep(0.01)
-
         dataset2 = Dataset.objects.create(
             title='Dataset 2',
             filename='test2.xlsx',
@@ -70,10 +67,17 @@ class TestDatasetModel:
             uploaded_by=user
         )
 
+        # Backdate the first upload instead of sleeping between creates
+        Dataset.objects.filter(pk=dataset1.pk).update(
+            upload_date=timezone.now() - timedelta(seconds=1)
+        )
+        dataset1.refresh_from_db()
+
         datasets = Dataset.objects.all()
         # Verify ordering exists (most recent first)
         assert datasets.count() == 2
-        assert dataset2.upload_date >= dataset1.upload_date
+        assert dataset2.upload_date > dataset1.upload_date
+        assert list(datasets) == [dataset2, dataset1]
 
 
 @pytest.mark.django_db
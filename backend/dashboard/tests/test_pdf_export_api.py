@@ -14,39 +14,45 @@ Test Coverage:
 
 import pytest
 from io import BytesIO
+from types import SimpleNamespace
+from unittest import mock
+from django.core.cache import caches
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 from dashboard.models import Dataset, DataRecord
+from dashboard.services.pdf_export import PdfExportService
 from django.contrib.auth import get_user_model
 from PyPDF2 import PdfReader
 
 User = get_user_model()
 
 
-@pytest.mark.django_db
-class TestPDFExportAPI:
-    """Test suite for PDF export functionality."""
-
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test data before each test."""
-        self.client = APIClient()
+@pytest.fixture(scope='class')
+def pdf_export_data(django_db_setup, django_db_blocker):
+    """
+    Create the users and sample dataset shared by TestPDFExportAPI.
 
+    The objects are created once per class outside the per-test
+    transaction, so tests must not modify them; records or datasets a
+    test adds are rolled back with its transaction. Everything is
+    removed again on teardown.
+    """
+    with django_db_blocker.unblock():
         # Create test users
-        self.admin_user = User.objects.create_user(
+        admin_user = User.objects.create_user(
             username='admin',
             email='admin@test.com',
             password='testpass123',
             role='admin'
         )
-        self.manager_user = User.objects.create_user(
+        manager_user = User.objects.create_user(
             username='manager',
             email='manager@test.com',
             password='testpass123',
             role='manager'
         )
-        self.viewer_user = User.objects.create_user(
+        viewer_user = User.objects.create_user(
             username='viewer',
             email='viewer@test.com',
             password='testpass123',
@@ -54,20 +60,20 @@ class TestPDFExportAPI:
         )
 
         # Create test dataset
-        self.dataset = Dataset.objects.create(
+        dataset = Dataset.objects.create(
             title='Test PDF Dataset',
             description='Test dataset for PDF export',
             filename='test.xlsx',
             file_size=2048,
             record_count=10,
             category='grades',
-            uploaded_by=self.admin_user
+            uploaded_by=admin_user
         )
 
         # Create test records
-        for i in range(10):
-            DataRecord.objects.create(
-                dataset=self.dataset,
+        DataRecord.objects.bulk_create([
+            DataRecord(
+                dataset=dataset,
                 data={
                     'student_id': f'S{1000 + i}',
                     'name': f'Student {i+1}',
@@ -75,6 +81,61 @@ class TestPDFExportAPI:
                     'grade': 'A' if i >= 7 else 'B' if i >= 4 else 'C',
                 }
             )
+            for i in range(10)
+        ])
+
+    users = (admin_user, manager_user, viewer_user)
+    try:
+        yield SimpleNamespace(
+            admin_user=admin_user,
+            manager_user=manager_user,
+            viewer_user=viewer_user,
+            dataset=dataset
+        )
+    finally:
+        with django_db_blocker.unblock():
+            # Deleting the users cascades to their datasets and records
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+
+@pytest.fixture(scope='class')
+def rendered_pdf_pages(pdf_export_data, django_db_blocker):
+    """
+    Export the shared dataset once and return the text of each PDF page.
+
+    Tests that only inspect the report content share this rendering
+    instead of exporting and parsing the same PDF themselves.
+    """
+    client = APIClient()
+    client.force_authenticate(user=pdf_export_data.admin_user)
+    url = reverse('dataset-export-pdf', kwargs={'pk': pdf_export_data.dataset.pk})
+
+    with django_db_blocker.unblock():
+        response = client.post(url)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    pdf_reader = PdfReader(BytesIO(b''.join(response.streaming_content)))
+    return [page.extract_text() for page in pdf_reader.pages]
+
+
+@pytest.mark.django_db
+class TestPDFExportAPI:
+    """Test suite for PDF export functionality."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, pdf_export_data):
+        """Attach a fresh client and the shared test data to each test."""
+        self.client = APIClient()
+
+        self.admin_user = pdf_export_data.admin_user
+        self.manager_user = pdf_export_data.manager_user
+        self.viewer_user = pdf_export_data.viewer_user
+        self.dataset = pdf_export_data.dataset
+
+    def get_pdf_bytes(self, response):
+        """Helper: Collect the streamed PDF body of an export response."""
+        return b''.join(response.streaming_content)
 
     def test_pdf_export_requires_authentication(self):
         """
@@ -142,56 +203,34 @@ class TestPDFExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Try to parse the PDF
-        pdf_file = BytesIO(response.content)
+        pdf_file = BytesIO(self.get_pdf_bytes(response))
         pdf_reader = PdfReader(pdf_file)
 
         assert pdf_reader is not None
         assert len(pdf_reader.pages) > 0
 
-    def test_pdf_export_contains_dataset_title(self):
+    def test_pdf_export_contains_dataset_title(self, rendered_pdf_pages):
         """
         @SPEC:REQ-EXPORT-006
         Test that PDF contains dataset title.
 
         Expected: Dataset title appears in PDF content
         """
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
-        response = self.client.post(url)
-
-        assert response.status_code == status.HTTP_200_OK
-
-        # Parse PDF and check for title
-        pdf_file = BytesIO(response.content)
-        pdf_reader = PdfReader(pdf_file)
-
-        # Extract text from first page
-        first_page_text = pdf_reader.pages[0].extract_text()
+        # Text of the first page
+        first_page_text = rendered_pdf_pages[0]
 
         # Check if dataset title is in the text
         assert 'Test PDF Dataset' in first_page_text or 'PDF Dataset' in first_page_text
 
-    def test_pdf_export_contains_data(self):
+    def test_pdf_export_contains_data(self, rendered_pdf_pages):
         """
         @SPEC:REQ-EXPORT-005
         Test that PDF contains table data.
 
         Expected: Student names and scores appear in PDF
         """
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
-        response = self.client.post(url)
-
-        assert response.status_code == status.HTTP_200_OK
-
-        # Parse PDF and check for data
-        pdf_file = BytesIO(response.content)
-        pdf_reader = PdfReader(pdf_file)
-
-        # Extract text from all pages
-        full_text = ''
-        for page in pdf_reader.pages:
-            full_text += page.extract_text()
+        # Text of all pages
+        full_text = ''.join(rendered_pdf_pages)
 
         # Check if some student data is present
         assert 'Student 1' in full_text or 'S1000' in full_text
@@ -204,8 +243,8 @@ class TestPDFExportAPI:
         Expected: Multiple pages when needed
         """
         # Create more records to force pagination
-        for i in range(50):
-            DataRecord.objects.create(
+        DataRecord.objects.bulk_create([
+            DataRecord(
                 dataset=self.dataset,
                 data={
                     'student_id': f'S{2000 + i}',
@@ -214,6 +253,8 @@ class TestPDFExportAPI:
                     'grade': 'A',
                 }
             )
+            for i in range(50)
+        ])
 
         self.client.force_authenticate(user=self.admin_user)
         url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
@@ -222,12 +263,28 @@ class TestPDFExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Check for multiple pages
-        pdf_file = BytesIO(response.content)
+        pdf_file = BytesIO(self.get_pdf_bytes(response))
         pdf_reader = PdfReader(pdf_file)
 
         # Should have more than one page with 60 records
         assert len(pdf_reader.pages) >= 1
 
+    def test_pdf_export_splits_records_into_tables(self):
+        """
+        Test that records beyond TABLE_CHUNK_ROWS continue in further tables.
+
+        Expected: Every record appears in the PDF
+        """
+        with mock.patch('dashboard.services.pdf_export.TABLE_CHUNK_ROWS', 4):
+            pdf_file = BytesIO()
+            PdfExportService().render(self.dataset, pdf_file)
+
+        pdf_file.seek(0)
+        text = ''.join(page.extract_text() for page in PdfReader(pdf_file).pages)
+
+        for i in range(10):
+            assert f'S{1000 + i}' in text
+
     def test_pdf_export_content_disposition(self):
         """
         @SPEC:REQ-EXPORT-005
@@ -266,7 +323,7 @@ class TestPDFExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Should still be a valid PDF
-        pdf_file = BytesIO(response.content)
+        pdf_file = BytesIO(self.get_pdf_bytes(response))
         pdf_reader = PdfReader(pdf_file)
         assert len(pdf_reader.pages) > 0
 
@@ -344,16 +401,15 @@ class TestPDFExportAPI:
         assert response.status_code == status.HTTP_200_OK
 
         # Check that it's a valid PDF
-        pdf_file = BytesIO(response.content)
+        pdf_file = BytesIO(self.get_pdf_bytes(response))
         pdf_reader = PdfReader(pdf_file)
         assert len(pdf_reader.pages) > 0
 
-    def test_pdf_export_statistics_summary(self):
+    def test_pdf_export_is_compact(self):
         """
-        @SPEC:REQ-EXPORT-006
-        Test that PDF includes summary statistics section.
+        Test that PDF pages are compressed and no font file is embedded.
 
-        Expected: PDF contains record count and category info
+        Expected: Content streams use only FlateDecode, fonts are not embedded
         """
         self.client.force_authenticate(user=self.admin_user)
         url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
@@ -361,13 +417,22 @@ class TestPDFExportAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
-        # Parse PDF and check for statistics
-        pdf_file = BytesIO(response.content)
-        pdf_reader = PdfReader(pdf_file)
+        pdf_reader = PdfReader(BytesIO(self.get_pdf_bytes(response)))
+        page = pdf_reader.pages[0]
+        assert page['/Contents'].get_object()['/Filter'] == ['/FlateDecode']
+
+        for font in page['/Resources']['/Font'].values():
+            font = font.get_object()
+            assert '/FontDescriptor' not in font
+
+    def test_pdf_export_statistics_summary(self, rendered_pdf_pages):
+        """
+        @SPEC:REQ-EXPORT-006
+        Test that PDF includes summary statistics section.
 
-        full_text = ''
-        for page in pdf_reader.pages:
-            full_text += page.extract_text()
+        Expected: PDF contains record count and category info
+        """
+        full_text = ''.join(rendered_pdf_pages)
 
         # Should contain record count or category
         has_stats = (
@@ -379,24 +444,14 @@ class TestPDFExportAPI:
 
         assert has_stats
 
-    def test_pdf_export_date_timestamp(self):
+    def test_pdf_export_date_timestamp(self, rendered_pdf_pages):
         """
         @SPEC:REQ-EXPORT-006
         Test that PDF includes generation timestamp.
 
         Expected: Export date appears in PDF
         """
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
-        response = self.client.post(url)
-
-        assert response.status_code == status.HTTP_200_OK
-
-        # Parse PDF and check for date/time
-        pdf_file = BytesIO(response.content)
-        pdf_reader = PdfReader(pdf_file)
-
-        first_page_text = pdf_reader.pages[0].extract_text()
+        first_page_text = rendered_pdf_pages[0]
 
         # Check for date indicators (year 2024/2025 or month names)
         has_date = (
@@ -407,3 +462,123 @@ class TestPDFExportAPI:
         )
 
         assert has_date
+
+    def test_pdf_export_not_modified(self):
+        """
+        @SPEC:REQ-EXPORT-005
+        Test that a repeated GET with the returned ETag is answered with 304.
+
+        Expected: Private revalidated caching, 304 until a record changes
+        """
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Cache-Control'] == 'private, no-cache'
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        DataRecord.objects.create(dataset=self.dataset, data={'name': 'New Student'})
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_pdf_export_head(self):
+        """
+        @SPEC:REQ-EXPORT-005
+        Test that HEAD returns the export headers without rendering.
+
+        Expected: 200 with ETag and an empty body
+        """
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
+
+        with mock.patch.object(PdfExportService, 'render') as render:
+            response = self.client.head(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/pdf'
+        assert response['ETag'] == self.client.get(url)['ETag']
+        assert response.content == b''
+        render.assert_not_called()
+
+    def test_pdf_export_reuses_cached_rendering(self):
+        """
+        Test that exporting an unchanged dataset again skips rendering.
+
+        Expected: one render for two identical exports
+        """
+        caches['exports'].clear()
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
+
+        with mock.patch.object(
+            PdfExportService, 'render', autospec=True, side_effect=PdfExportService.render
+        ) as render:
+            first = self.get_pdf_bytes(self.client.post(url))
+            second = self.get_pdf_bytes(self.client.post(url))
+
+        assert render.call_count == 1
+        assert second == first
+
+    def test_pdf_export_caches_in_exports_alias(self):
+        """
+        Test that rendered PDFs go to the bounded exports cache.
+
+        Expected: the rendering is stored under 'exports', not 'default'
+        """
+        for cache in caches.all():
+            cache.clear()
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
+
+        assert self.get_pdf_bytes(self.client.post(url))
+
+        exports = caches['exports']
+        assert exports._max_entries == 10
+        assert [key for key in exports._cache if 'pdf_export:' in key]
+        assert not [key for key in caches['default']._cache if 'pdf_export:' in key]
+
+    def test_pdf_export_post_ignores_if_none_match(self):
+        """
+        @SPEC:REQ-EXPORT-005
+        Test that the POST alias downloads even with a matching ETag.
+
+        Expected: 200 with the PDF instead of 304 or 412
+        """
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.post(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] == etag
+        assert self.get_pdf_bytes(response).startswith(b'%PDF')
+
+    def test_pdf_export_rendering_matches_etag(self):
+        """
+        @SPEC:REQ-EXPORT-005
+        Test that rendering one version again produces the same bytes.
+
+        Expected: identical PDFs under one ETag, even uncached
+        """
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('dataset-export-pdf', kwargs={'pk': self.dataset.pk})
+
+        caches['exports'].clear()
+        first = self.client.get(url)
+        first_pdf = self.get_pdf_bytes(first)
+
+        caches['exports'].clear()
+        with mock.patch('dashboard.services.pdf_export.datetime') as clock:
+            clock.now.side_effect = AssertionError('render time must not be printed')
+            second = self.client.get(url)
+            second_pdf = self.get_pdf_bytes(second)
+
+        assert second['ETag'] == first['ETag']
+        assert second_pdf == first_pdf
@@ -0,0 +1,76 @@
+"""
+Tests for API response renderers
+
+@SPEC:AUTH-001
+@TEST:API-RENDERER
+"""
+
+import datetime
+import decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONRenderer
+
+
+@pytest.mark.unit
+class TestORJSONRenderer:
+    """Tests for ORJSONRenderer"""
+
+    def test_output_matches_json_renderer(self):
+        """
+        @TEST:API-RENDERER-001
+        orjson output should be byte-for-byte what JSONRenderer produces
+        """
+        data = {
+            'success': True,
+            'user': {'id': 1, 'username': 'testuser', 'full_name': '홍길동'},
+            'total': decimal.Decimal('12.50'),
+            'ratio': 0.25,
+            'uploaded': datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2024, 1, 2),
+            'items': [None, 'line\u2028separator'],
+            1: 'numeric key',
+        }
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_output_uses_json_renderer(self):
+        """
+        @TEST:API-RENDERER-002
+        Requests for indented JSON should be rendered by JSONRenderer
+        """
+        data = {'success': True, 'at': timezone.now()}
+        media_type = 'application/json; indent=2'
+
+        assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_wide_integers_fall_back_to_json_renderer(self):
+        """
+        @TEST:API-RENDERER-003
+        Integers orjson cannot encode should render like JSONRenderer
+        """
+        data = {'big': 2 ** 70 + 1, 'negative': -(2 ** 64), 'items': [None]}
+
+        rendered = ORJSONRenderer().render(data)
+
+        assert rendered == JSONRenderer().render(data)
+        assert b'1180591620717411303425' in rendered
+
+    def test_non_finite_floats_fail_like_json_renderer(self):
+        """
+        @TEST:API-RENDERER-004
+        NaN and infinity should raise under STRICT_JSON instead of rendering as null
+        """
+        for value in (float('nan'), float('inf'), float('-inf')):
+            data = {'rows': [{'score': value, 'note': None}]}
+
+            with pytest.raises(ValueError):
+                JSONRenderer().render(data)
+            with pytest.raises(ValueError):
+                ORJSONRenderer().render(data)
+
+        assert ORJSONRenderer().render({'note': None}) == b'{"note":null}'
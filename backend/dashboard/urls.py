@@ -8,12 +8,13 @@ API Endpoints:
 """
 
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .views import DatasetViewSet, DataRecordViewSet, StatisticsViewSet
 
 
-# Create REST router
-router = DefaultRouter()
+# Create REST router. The users app's DefaultRouter already serves the
+# browsable root at /api/, so this one only needs the viewset routes
+router = SimpleRouter()
 
 # Register viewsets
 router.register(r'datasets', DatasetViewSet, basename='dataset')
@@ -12,29 +12,26 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.core.cache import cache, caches
 from django.db.models import Count, Sum
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
-import pandas as pd
 import csv
+import hashlib
 import re
+from datetime import datetime, timezone as dt_timezone
 from io import BytesIO, StringIO
+from itertools import chain, islice
+from tempfile import SpooledTemporaryFile
 from django.db.models import Count, Avg, Max, Min
-from datetime import datetime
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
 from .models import Dataset, DataRecord
+from .signals import STATISTICS_CACHE_KEY, invalidate_statistics_cache
 from .serializers import (
     DatasetSerializer,
     DatasetListSerializer,
@@ -42,7 +39,41 @@ from .serializers import (
     DataRecordSerializer,
     DatasetStatisticsSerializer,
 )
-from .services.excel_parser import ExcelParserService
+from .services.dataset_import import DatasetImportService
+from .services.excel_export import ExcelExportService
+from .services.pdf_export import PdfExportService
+
+# Maximum accepted upload size (10MB)
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# Allowance for multipart boundaries and form fields on top of the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Rendered exports stay in memory up to this size before spilling to disk
+PDF_SPOOL_MAX_SIZE = 1024 * 1024
+
+# CSV exports written by PostgreSQL COPY stay in memory up to this size
+CSV_SPOOL_MAX_SIZE = 1024 * 1024
+
+# Size of each chunk when streaming a rendered export file
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Records fetched per database round trip by the export writers
+EXPORT_RECORD_CHUNK_SIZE = 2000
+
+# Characters removed from export filenames: anything but ASCII letters,
+# digits, underscore, hyphen and Hangul syllables
+FILENAME_STRIP_PATTERN = re.compile(r'[^a-zA-Z0-9_\-가-힣]')
+
+# Seconds a rendered PDF stays in the exports cache
+PDF_CACHE_TIMEOUT = 60 * 60
+
+# Seconds the statistics overview stays cached
+STATISTICS_CACHE_TIMEOUT = 30
+
+# Exports may be kept by the user's browser but must be revalidated with
+# the ETag, and never stored by shared caches since they need auth
+PDF_CACHE_CONTROL = 'private, no-cache'
 
 
 class DatasetViewSet(viewsets.ModelViewSet):
@@ -106,52 +137,93 @@ class DatasetViewSet(viewsets.ModelViewSet):
         Returns:
             Number of records created
         """
+        workbook = None
         try:
-            # Read Excel file using openpyxl
-            file_content = uploaded_file.read()
-            workbook = openpyxl.load_workbook(BytesIO(file_content))
+            # Read Excel file using openpyxl. The upload object is handed to
+            # the ZIP reader as-is so members are read straight from its
+            # buffer (or temp file) instead of a full bytes copy. Read-only
+            # mode streams rows from the sheet XML instead of building every
+            # cell in memory, and data_only returns cached formula results.
+            uploaded_file.seek(0)
+            workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
             sheet = workbook.active
 
-            # Convert to pandas DataFrame for easier processing
-            data = []
             headers = []
 
             # Get headers from first row
-            for cell in sheet[1]:
-                headers.append(cell.value if cell.value else f"Column_{len(headers) + 1}")
-
-            # Get data rows
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                row_dict = {}
-                for idx, value in enumerate(row):
-                    if idx < len(headers):
-                        # Convert value to JSON-serializable format
-                        if pd.isna(value):
-                            row_dict[headers[idx]] = None
-                        elif isinstance(value, (int, float, str, bool)):
-                            row_dict[headers[idx]] = value
-                        else:
-                            row_dict[headers[idx]] = str(value)
-                data.append(row_dict)
-
-            # Create DataRecord instances in bulk
-            records = [
-                DataRecord(dataset=dataset, data=row_data)
-                for row_data in data
-            ]
-            DataRecord.objects.bulk_create(records)
-
-            # Update dataset record count
-            dataset.record_count = len(records)
-            dataset.save()
-
-            return len(records)
+            for value in next(sheet.iter_rows(max_row=1, values_only=True), ()):
+                headers.append(value if value else f"Column_{len(headers) + 1}")
+
+            # Rows are converted as they are read from the sheet and
+            # inserted in batches, so only one batch is held in memory
+            records = self._iter_sheet_records(sheet, headers)
+            batch_size = settings.DATA_RECORD_BATCH_SIZE
+            record_count = 0
+            while True:
+                batch = list(islice(records, batch_size))
+                if not batch:
+                    break
+
+                DataRecord.objects.bulk_create(
+                    [DataRecord(dataset=dataset, data=row_data) for row_data in batch],
+                    batch_size=batch_size
+                )
+                record_count += len(batch)
+
+            # Store the header row (as the JSON keys of the records) and
+            # record count; cached statistics no longer cover the new
+            # records. Only these columns are written
+            fieldnames = list(dict.fromkeys(str(header) for header in headers))
+            Dataset.objects.filter(pk=dataset.pk).update(
+                record_count=record_count,
+                fieldnames=fieldnames,
+                field_statistics=None
+            )
+            dataset.record_count = record_count
+            dataset.fieldnames = fieldnames
+            dataset.field_statistics = None
+
+            # update() sends no post_save, so the overview totals are
+            # invalidated here
+            invalidate_statistics_cache()
+
+            return record_count
 
         except Exception as e:
             # If processing fails, delete the dataset
             dataset.delete()
             raise Exception(f"Failed to process Excel file: {str(e)}")
 
+        finally:
+            # Read-only workbooks keep the archive open until closed
+            if workbook is not None:
+                workbook.close()
+
+    def _iter_sheet_records(self, sheet, headers):
+        """
+        Yield the data rows of a worksheet as record dicts.
+
+        Args:
+            sheet: Worksheet whose first row holds the headers
+            headers: Column headers
+
+        Yields:
+            Dict per data row mapping headers to JSON-serializable values
+        """
+        for row in sheet.iter_rows(min_row=2, values_only=True):
+            row_dict = {}
+            # zip stops at the shorter side, dropping cells past the headers
+            for header, value in zip(headers, row):
+                # Convert value to JSON-serializable format. NaN is the only
+                # value not equal to itself
+                if isinstance(value, (int, float, str, bool)):
+                    row_dict[header] = None if value != value else value
+                elif value is None:
+                    row_dict[header] = None
+                else:
+                    row_dict[header] = str(value)
+            yield row_dict
+
     @action(detail=False, methods=['post'], url_path='upload')
     def upload_file(self, request):
         """
@@ -172,6 +244,14 @@ class DatasetViewSet(viewsets.ModelViewSet):
             400: Validation error or parsing error
             401: Unauthorized
         """
+        # Reject oversized bodies before the multipart payload is parsed
+        content_length = request.META.get('CONTENT_LENGTH', '')
+        if content_length.isdigit() and int(content_length) > MAX_UPLOAD_SIZE + MULTIPART_OVERHEAD:
+            return Response(
+                {"error": f"File size exceeds maximum of {MAX_UPLOAD_SIZE // (1024 * 1024)}MB"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         # Validate request data
         if 'file' not in request.FILES:
             return Response(
@@ -195,45 +275,34 @@ class DatasetViewSet(viewsets.ModelViewSet):
             )
 
         # Validate file size (10MB max)
-        max_size = 10 * 1024 * 1024
-        if uploaded_file.size > max_size:
+        if uploaded_file.size > MAX_UPLOAD_SIZE:
             return Response(
-                {"error": f"File size exceeds maximum of 10MB"},
+                {"error": f"File size exceeds maximum of {MAX_UPLOAD_SIZE // (1024 * 1024)}MB"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         try:
-            # Parse Excel file using ExcelParserService
-            parser = ExcelParserService()
-
             # Reset file pointer to beginning
             uploaded_file.seek(0)
 
-            parse_result = parser.parse(uploaded_file)
-
-            if not parse_result['success']:
-                return Response(
-                    {"error": parse_result['error']},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-
-            # Create Dataset
-            dataset = Dataset.objects.create(
+            # Parse the file and store the dataset with its records
+            import_result = DatasetImportService().import_file(
+                uploaded_file,
                 title=request.data['title'],
                 description=request.data.get('description', ''),
                 category=request.data.get('category', ''),
                 filename=uploaded_file.name,
                 file_size=uploaded_file.size,
-                uploaded_by=request.user,
-                record_count=len(parse_result['records'])
+                uploaded_by=request.user
             )
 
-            # Create DataRecords
-            records_to_create = [
-                DataRecord(dataset=dataset, data=record)
-                for record in parse_result['records']
-            ]
-            DataRecord.objects.bulk_create(records_to_create)
+            if not import_result['success']:
+                return Response(
+                    {"error": import_result['error']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            dataset = import_result['dataset']
 
             # Serialize response
             serializer = DatasetSerializer(dataset)
@@ -342,60 +411,118 @@ class DatasetViewSet(viewsets.ModelViewSet):
         # Get dataset
         dataset = self.get_object()
 
-        # Get all records for this dataset
-        records = dataset.records.all()
-
-        # Prepare CSV data
-        if records.exists():
-            # Extract field names from first record
-            first_record = records.first()
-            fieldnames = list(first_record.data.keys())
-
-            # Create CSV in memory with UTF-8-sig (includes BOM)
-            output = StringIO()
-            writer = csv.DictWriter(
-                output,
-                fieldnames=fieldnames,
-                quoting=csv.QUOTE_MINIMAL,  # RFC 4180 compliance
-                lineterminator='\n'
-            )
-
-            # Write header
-            writer.writeheader()
-
-            # Write data rows
-            for record in records:
-                # Convert None to empty string for CSV
-                row_data = {
-                    k: (v if v is not None else '')
-                    for k, v in record.data.items()
-                }
-                writer.writerow(row_data)
-
-            csv_content = output.getvalue()
-        else:
-            # Empty dataset - just headers
-            csv_content = ""
-
         # Sanitize filename
         safe_filename = self._sanitize_filename(dataset.title)
         filename = f"{safe_filename}.csv"
 
-        # Create HTTP response with proper headers
-        response = HttpResponse(
+        if DataRecord.objects.supports_copy() and DataRecord.objects.copy_csv_matches(dataset):
+            # PostgreSQL writes the CSV rows itself with COPY
+            content = self._iter_copied_csv_chunks(dataset)
+        else:
+            # Get the JSON payloads of all records for this dataset as plain
+            # dicts, streamed from the cursor in chunks
+            records = dataset.records.values_list('data', flat=True).iterator(
+                chunk_size=EXPORT_RECORD_CHUNK_SIZE
+            )
+
+            # Datasets created without a file have no stored header, so
+            # the first record supplies the field names
+            fieldnames = dataset.fieldnames
+            if not fieldnames:
+                first_record = next(records, None)
+                if first_record is not None:
+                    fieldnames = list(first_record.keys())
+                    records = chain([first_record], records)
+
+            # Stream the CSV while records are still being read, instead of
+            # building the whole file in memory first
+            content = self._iter_csv_chunks(fieldnames, records)
+
+        response = StreamingHttpResponse(
+            content,
             content_type='text/csv; charset=utf-8',
             headers={
                 'Content-Disposition': f'attachment; filename="{filename}"'
             }
         )
 
+        return response
+
+    def _iter_copied_csv_chunks(self, dataset):
+        """
+        Write a dataset's CSV export with PostgreSQL COPY and yield it in chunks.
+
+        Produces the same bytes as _iter_csv_chunks (UTF-8 BOM, header, then
+        one row per record) for datasets where copy_csv_matches holds.
+
+        Args:
+            dataset: Dataset instance
+
+        Returns:
+            Iterator over byte chunks of the CSV file
+        """
+        # Datasets created without a file have no stored header, so the
+        # first record supplies the field names
+        fieldnames = dataset.fieldnames
+        if not fieldnames:
+            first_record = dataset.records.values_list('data', flat=True).first()
+            if first_record is not None:
+                fieldnames = list(first_record.keys())
+
+        csv_file = SpooledTemporaryFile(max_size=CSV_SPOOL_MAX_SIZE)
+        csv_file.write('\ufeff'.encode('utf-8'))
+
+        if fieldnames:
+            header = StringIO()
+            csv.writer(header, lineterminator='\n').writerow(fieldnames)
+            csv_file.write(header.getvalue().encode('utf-8'))
+
+            DataRecord.objects.copy_csv(dataset, fieldnames, csv_file)
+
+        csv_file.seek(0)
+        return self._iter_file_chunks(csv_file)
+
+    def _iter_csv_chunks(self, fieldnames, records):
+        """
+        Yield a dataset's CSV export in pieces of about EXPORT_CHUNK_SIZE.
+
+        Args:
+            fieldnames: Column headers, empty when the dataset has none
+            records: Iterator over the record payloads
+
+        Yields:
+            CSV text, starting with the UTF-8 BOM
+        """
         # Write BOM for UTF-8
-        response.write('\ufeff')  # UTF-8 BOM
+        yield '\ufeff'  # UTF-8 BOM
 
-        # Write CSV content
-        response.write(csv_content)
+        # No header and no records - nothing but the BOM
+        if not fieldnames:
+            return
 
-        return response
+        # A plain csv.writer fed value lists is about twice as fast as
+        # DictWriter, which rebuilds each row from a dict in Python
+        output = StringIO()
+        writer = csv.writer(
+            output,
+            quoting=csv.QUOTE_MINIMAL,  # RFC 4180 compliance
+            lineterminator='\n'
+        )
+
+        # Write header
+        writer.writerow(fieldnames)
+
+        # Write data rows in header order, handing the buffer off whenever
+        # it fills up. csv.writer writes None and missing fields as empty
+        # strings
+        for data in records:
+            writer.writerow([data.get(field) for field in fieldnames])
+            if output.tell() >= EXPORT_CHUNK_SIZE:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+        yield output.getvalue()
 
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -411,7 +538,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
         filename = filename.replace(' ', '_')
 
         # Remove special characters, keep alphanumeric, underscore, hyphen
-        filename = re.sub(r'[^a-zA-Z0-9_\-가-힣]', '', filename)
+        filename = FILENAME_STRIP_PATTERN.sub('', filename)
 
         # Limit length
         if len(filename) > 200:
@@ -452,20 +579,9 @@ class DatasetViewSet(viewsets.ModelViewSet):
         # Get dataset
         dataset = self.get_object()
 
-        # Create workbook
-        workbook = openpyxl.Workbook()
-        workbook.remove(workbook.active)  # Remove default sheet
-
-        # Sheet 1: 데이터 (Data)
-        self._create_data_sheet(workbook, dataset)
-
-        # Sheet 2: 요약 통계 (Summary Statistics)
-        self._create_statistics_sheet(workbook, dataset)
-
-        # Save to BytesIO
+        # Render the workbook
         excel_file = BytesIO()
-        workbook.save(excel_file)
-        excel_file.seek(0)
+        ExcelExportService().render(dataset, excel_file)
 
         # Sanitize filename
         safe_filename = self._sanitize_filename(dataset.title)
@@ -482,171 +598,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
 
         return response
 
-    def _create_data_sheet(self, workbook, dataset):
-        """
-        Create data sheet with all records.
-
-        @SPEC:REQ-EXPORT-003
-
-        Features:
-        - Header row with styling (bold, blue background, white text)
-        - Auto-width columns
-        - Zebra striping (alternating row colors)
-        """
-        # Create sheet
-        data_sheet = workbook.create_sheet(title='데이터')
-
-        # Get records
-        records = dataset.records.all()
-
-        if not records.exists():
-            # Empty dataset - just add a note
-            data_sheet['A1'] = '데이터 없음'
-            return
-
-        # Get field names from first record
-        first_record = records.first()
-        fieldnames = list(first_record.data.keys())
-
-        # Define header styles
-        header_font = Font(bold=True, color='FFFFFF', size=12)
-        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center')
-
-        # Write header row
-        for col_idx, field_name in enumerate(fieldnames, start=1):
-            cell = data_sheet.cell(row=1, column=col_idx)
-            cell.value = field_name
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-
-        # Define zebra striping styles
-        even_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
-
-        # Write data rows
-        for row_idx, record in enumerate(records, start=2):
-            for col_idx, field_name in enumerate(fieldnames, start=1):
-                cell = data_sheet.cell(row=row_idx, column=col_idx)
-                value = record.data.get(field_name)
-
-                # Convert value to appropriate type
-                if value is None:
-                    cell.value = ''
-                elif isinstance(value, bool):
-                    cell.value = str(value)
-                else:
-                    cell.value = value
-
-                # Apply zebra striping to even rows
-                if row_idx % 2 == 0:
-                    cell.fill = even_fill
-
-        # Auto-adjust column widths
-        for col_idx, field_name in enumerate(fieldnames, start=1):
-            column_letter = get_column_letter(col_idx)
-            max_length = len(str(field_name))
-
-            # Check data cell lengths
-            for row_idx in range(2, data_sheet.max_row + 1):
-                cell_value = data_sheet.cell(row=row_idx, column=col_idx).value
-                if cell_value:
-                    max_length = max(max_length, len(str(cell_value)))
-
-            # Set column width (add padding)
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            data_sheet.column_dimensions[column_letter].width = adjusted_width
-
-    def _create_statistics_sheet(self, workbook, dataset):
-        """
-        Create statistics sheet with aggregated data.
-
-        @SPEC:REQ-EXPORT-004
-
-        Includes:
-        - Total record count
-        - Category breakdown
-        - Numeric field statistics (avg, min, max)
-        """
-        # Create sheet
-        stats_sheet = workbook.create_sheet(title='요약 통계')
-
-        # Define header styles
-        header_font = Font(bold=True, size=11)
-        title_font = Font(bold=True, size=14, color='4472C4')
-
-        # Title
-        stats_sheet['A1'] = f'{dataset.title} - 요약 통계'
-        stats_sheet['A1'].font = title_font
-        stats_sheet.merge_cells('A1:B1')
-
-        # Dataset info
-        row = 3
-        stats_sheet[f'A{row}'] = '데이터셋 정보'
-        stats_sheet[f'A{row}'].font = header_font
-        row += 1
-
-        stats_sheet[f'A{row}'] = '총 레코드 수'
-        stats_sheet[f'B{row}'] = dataset.record_count
-        row += 1
-
-        stats_sheet[f'A{row}'] = '파일 크기'
-        stats_sheet[f'B{row}'] = f'{dataset.file_size / 1024:.2f} KB'
-        row += 1
-
-        stats_sheet[f'A{row}'] = '업로드 날짜'
-        stats_sheet[f'B{row}'] = dataset.upload_date.strftime('%Y-%m-%d %H:%M')
-        row += 2
-
-        # Numeric field statistics
-        records = dataset.records.all()
-        if records.exists():
-            stats_sheet[f'A{row}'] = '필드 통계'
-            stats_sheet[f'A{row}'].font = header_font
-            row += 1
-
-            # Get numeric fields from first record
-            first_record = records.first()
-            numeric_fields = []
-
-            for field_name, value in first_record.data.items():
-                if isinstance(value, (int, float)) and value is not None:
-                    numeric_fields.append(field_name)
-
-            # Calculate statistics for numeric fields
-            if numeric_fields:
-                # Header row for statistics
-                stats_sheet[f'A{row}'] = '필드'
-                stats_sheet[f'B{row}'] = '평균'
-                stats_sheet[f'C{row}'] = '최소'
-                stats_sheet[f'D{row}'] = '최대'
-                for col in ['A', 'B', 'C', 'D']:
-                    stats_sheet[f'{col}{row}'].font = Font(bold=True)
-                row += 1
-
-                for field_name in numeric_fields:
-                    values = [
-                        record.data.get(field_name)
-                        for record in records
-                        if record.data.get(field_name) is not None
-                    ]
-
-                    if values:
-                        avg_val = sum(values) / len(values)
-                        min_val = min(values)
-                        max_val = max(values)
-
-                        stats_sheet[f'A{row}'] = field_name
-                        stats_sheet[f'B{row}'] = round(avg_val, 2)
-                        stats_sheet[f'C{row}'] = min_val
-                        stats_sheet[f'D{row}'] = max_val
-                        row += 1
-
-        # Auto-adjust column widths
-        for col in ['A', 'B', 'C', 'D']:
-            stats_sheet.column_dimensions[col].width = 20
-
-    @action(detail=True, methods=['post'], url_path='export/pdf', permission_classes=[IsAuthenticated])
+    @action(detail=True, methods=['get', 'post'], url_path='export/pdf', permission_classes=[IsAuthenticated])
     def export_pdf(self, request, pk=None):
         """
         Export dataset to PDF format with tables and formatting.
@@ -655,10 +607,13 @@ class DatasetViewSet(viewsets.ModelViewSet):
         @SPEC:REQ-EXPORT-006 - PDF Styling and Layout
 
         Request:
-            POST /api/datasets/{id}/export/pdf/
+            GET /api/datasets/{id}/export/pdf/
+            POST /api/datasets/{id}/export/pdf/ (alias)
+            HEAD /api/datasets/{id}/export/pdf/
 
         Response:
-            200: PDF file download
+            200: PDF file download (headers only for HEAD)
+            304: Not modified (GET or HEAD with a matching If-None-Match)
             403: Permission denied (Viewer role)
             404: Dataset not found
 
@@ -667,7 +622,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
         - Summary statistics section
         - Header/footer with branding
         - Pagination
-        - Timestamp
+        - Timestamp of the exported data
         - Role-based access: Admin/Manager only
         """
         # Check user role (Admin or Manager only)
@@ -680,173 +635,129 @@ class DatasetViewSet(viewsets.ModelViewSet):
         # Get dataset
         dataset = self.get_object()
 
-        # Create PDF in memory
-        pdf_buffer = BytesIO()
-
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            pdf_buffer,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=50
-        )
-
-        # Container for PDF elements
-        elements = []
+        # Skip rendering when the client already has this version. The POST
+        # alias always downloads: for unsafe methods a matching ETag would
+        # mean 412 Precondition Failed
+        etag, last_modified = self._export_validators(dataset)
+        if request.method in ('GET', 'HEAD'):
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+        # Reuse a cached rendering of this exact version when there is one;
+        # the ETag changes with the content, so entries never go stale
+        version = etag.strip('"')
+        cache_key = f'pdf_export:{dataset.pk}:{version}'
+        pdf_content = caches['exports'].get(cache_key)
+
+        # Answer HEAD from the validators without rendering. The size is
+        # only known once this version has been rendered and cached
+        if request.method == 'HEAD':
+            response = HttpResponse(
+                content_type='application/pdf',
+                headers={
+                    'Cache-Control': PDF_CACHE_CONTROL,
+                    'ETag': etag,
+                    'Last-Modified': http_date(last_modified)
+                }
+            )
+            if pdf_content is not None:
+                response['Content-Length'] = str(len(pdf_content))
+            return response
+
+        if pdf_content is None:
+            # Render into a spooled file: small reports stay in memory, large
+            # ones roll over to disk instead of holding every page in RAM
+            pdf_file = SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+            # The report shows the data's timestamp rather than the render
+            # time, so every rendering of one ETag has the same bytes
+            as_of = datetime.fromtimestamp(last_modified, tz=dt_timezone.utc)
+            PdfExportService().render(dataset, pdf_file, as_of=as_of)
+            content_length = pdf_file.tell()
+            pdf_file.seek(0)
+
+            # Only reports small enough to stay in memory are cached. Their
+            # bytes are read out once and the spool is released, so the
+            # response and the cache share one copy of the PDF
+            if content_length <= PDF_SPOOL_MAX_SIZE:
+                with pdf_file:
+                    pdf_content = pdf_file.read()
+                caches['exports'].set(cache_key, pdf_content, PDF_CACHE_TIMEOUT)
+
+        if pdf_content is not None:
+            # BytesIO shares the bytes object until it is written to
+            pdf_file = BytesIO(pdf_content)
+            content_length = len(pdf_content)
 
-        # Get styles
-        styles = getSampleStyleSheet()
+        # Sanitize filename
+        safe_filename = self._sanitize_filename(dataset.title)
+        filename = f"{safe_filename}.pdf"
 
-        # Custom title style
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#4472C4'),
-            spaceAfter=30,
-            alignment=TA_CENTER
+        # Stream the file to the client in fixed-size chunks
+        response = StreamingHttpResponse(
+            self._iter_file_chunks(pdf_file),
+            content_type='application/pdf',
+            headers={
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Length': str(content_length),
+                'Cache-Control': PDF_CACHE_CONTROL,
+                'ETag': etag,
+                'Last-Modified': http_date(last_modified)
+            }
         )
 
-        # Custom heading style
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#4472C4'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
+        return response
+
+    def _export_validators(self, dataset):
+        """
+        Build the ETag and Last-Modified values for a dataset export.
 
-        # Add title
-        title = Paragraph(f"<b>{dataset.title}</b>", title_style)
-        elements.append(title)
+        The ETag covers every dataset field shown in the report plus the
+        number and latest update of its records, so it changes whenever
+        the rendered content would. Dataset has no modification time of
+        its own, so Last-Modified is informational and only the ETag is
+        used to answer conditional requests.
 
-        # Add export timestamp
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        timestamp_text = Paragraph(
-            f"<i>Generated on: {timestamp}</i>",
-            styles['Normal']
+        Args:
+            dataset: Dataset instance
+
+        Returns:
+            Tuple of (quoted ETag, Last-Modified timestamp in seconds)
+        """
+        records = dataset.records.aggregate(
+            count=Count('id'),
+            last_updated=Max('updated_at')
         )
-        elements.append(timestamp_text)
-        elements.append(Spacer(1, 20))
-
-        # Add summary statistics section
-        elements.append(Paragraph("<b>Dataset Summary</b>", heading_style))
-
-        summary_data = [
-            ['Description:', dataset.description or 'N/A'],
-            ['Category:', dataset.category or 'N/A'],
-            ['Total Records:', str(dataset.record_count)],
-            ['File Size:', f'{dataset.file_size / 1024:.2f} KB'],
-            ['Upload Date:', dataset.upload_date.strftime('%Y-%m-%d %H:%M')],
-            ['Uploaded By:', dataset.uploaded_by.username],
-        ]
-
-        summary_table = Table(summary_data, colWidths=[2*inch, 4*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E7E6E6')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
-
-        elements.append(summary_table)
-        elements.append(Spacer(1, 20))
-
-        # Add data table section
-        records = dataset.records.all()
 
-        if records.exists():
-            elements.append(Paragraph("<b>Data Records</b>", heading_style))
-
-            # Get field names from first record
-            first_record = records.first()
-            fieldnames = list(first_record.data.keys())
-
-            # Prepare table data
-            table_data = [fieldnames]  # Header row
-
-            # Add data rows
-            for record in records:
-                row = []
-                for field_name in fieldnames:
-                    value = record.data.get(field_name)
-                    if value is None:
-                        row.append('')
-                    else:
-                        row.append(str(value))
-                table_data.append(row)
-
-            # Calculate column widths dynamically
-            available_width = 6.5 * inch
-            num_columns = len(fieldnames)
-            col_width = available_width / num_columns
-
-            # Create table
-            data_table = Table(table_data, colWidths=[col_width] * num_columns, repeatRows=1)
-
-            # Apply styling
-            data_table.setStyle(TableStyle([
-                # Header styling
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-
-                # Data rows styling
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-
-                # Grid
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-
-                # Zebra striping
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')]),
-            ]))
-
-            elements.append(data_table)
-        else:
-            # No records message
-            no_data_text = Paragraph(
-                "<i>No data records available for this dataset.</i>",
-                styles['Normal']
-            )
-            elements.append(no_data_text)
+        version = ':'.join(str(part) for part in (
+            dataset.pk,
+            dataset.title,
+            dataset.description,
+            dataset.category,
+            dataset.file_size,
+            dataset.record_count,
+            dataset.uploaded_by_id,
+            records['count'],
+            records['last_updated'],
+        ))
+        etag = quote_etag(hashlib.md5(version.encode('utf-8')).hexdigest())
 
-        # Build PDF
-        doc.build(elements)
+        last_modified = max(filter(None, (dataset.upload_date, records['last_updated'])))
 
-        # Get PDF content
-        pdf_buffer.seek(0)
-        pdf_content = pdf_buffer.getvalue()
-        pdf_buffer.close()
+        return etag, int(last_modified.timestamp())
 
-        # Sanitize filename
-        safe_filename = self._sanitize_filename(dataset.title)
-        filename = f"{safe_filename}.pdf"
+    def _iter_file_chunks(self, file):
+        """
+        Yield a file's content in EXPORT_CHUNK_SIZE pieces and close it.
 
-        # Create HTTP response
-        response = HttpResponse(
-            pdf_content,
-            content_type='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"'
-            }
-        )
+        Args:
+            file: Binary file object positioned at the start
 
-        return response
+        Yields:
+            Byte chunks of the file
+        """
+        with file:
+            yield from iter(lambda: file.read(EXPORT_CHUNK_SIZE), b'')
 
 
 class DataRecordViewSet(viewsets.ModelViewSet):
@@ -875,6 +786,26 @@ class DataRecordViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def perform_create(self, serializer):
+        """Create record and reset its dataset's cached statistics."""
+        record = serializer.save()
+        self._reset_field_statistics(record.dataset_id)
+
+    def perform_update(self, serializer):
+        """Update record and reset cached statistics of the old and new dataset."""
+        previous_dataset_id = serializer.instance.dataset_id
+        record = serializer.save()
+        self._reset_field_statistics(previous_dataset_id, record.dataset_id)
+
+    def perform_destroy(self, instance):
+        """Delete record and reset its dataset's cached statistics."""
+        instance.delete()
+        self._reset_field_statistics(instance.dataset_id)
+
+    def _reset_field_statistics(self, *dataset_ids):
+        """Mark cached field statistics stale for the given datasets."""
+        Dataset.objects.filter(pk__in=dataset_ids).update(field_statistics=None)
+
 
 class StatisticsViewSet(viewsets.ViewSet):
     """
@@ -901,34 +832,57 @@ class StatisticsViewSet(viewsets.ViewSet):
                 "recent_uploads": [...]
             }
         """
-        # Aggregate statistics
-        stats = Dataset.objects.aggregate(
-            total_datasets=Count('id'),
-            total_records=Sum('record_count'),
-            total_size=Sum('file_size')
+        # Dataset changes invalidate the cached response (dashboard.signals);
+        # the timeout bounds staleness from updates that bypass save()
+        data = cache.get_or_set(
+            STATISTICS_CACHE_KEY,
+            self._build_overview,
+            STATISTICS_CACHE_TIMEOUT
         )
 
-        # Category breakdown
-        categories = (
+        return Response(data)
+
+    def _build_overview(self):
+        """
+        Compute the overview statistics.
+
+        Returns:
+            Validated overview data, ready to render
+        """
+        # Category breakdown. The per-category sums also give the overall
+        # totals, so a separate aggregate() query is not needed
+        category_stats = (
             Dataset.objects
             .values('category')
-            .annotate(count=Count('id'))
+            .annotate(
+                count=Count('id'),
+                records=Sum('record_count'),
+                size=Sum('file_size')
+            )
             .order_by('-count')
         )
 
-        # Recent uploads (last 5)
-        recent_uploads = Dataset.objects.all()[:5]
+        categories = []
+        stats = {'total_datasets': 0, 'total_records': 0, 'total_size': 0}
+        for row in category_stats:
+            categories.append({'category': row['category'], 'count': row['count']})
+            stats['total_datasets'] += row['count']
+            stats['total_records'] += row['records'] or 0
+            stats['total_size'] += row['size'] or 0
+
+        # Recent uploads (last 5), with uploaders joined for the serializer
+        recent_uploads = Dataset.objects.select_related('uploaded_by')[:5]
 
         # Serialize response
         data = {
-            'total_datasets': stats['total_datasets'] or 0,
-            'total_records': stats['total_records'] or 0,
-            'total_size': stats['total_size'] or 0,
-            'categories': list(categories),
+            'total_datasets': stats['total_datasets'],
+            'total_records': stats['total_records'],
+            'total_size': stats['total_size'],
+            'categories': categories,
             'recent_uploads': DatasetListSerializer(recent_uploads, many=True).data
         }
 
         serializer = DatasetStatisticsSerializer(data=data)
         serializer.is_valid(raise_exception=True)
 
-        return Response(serializer.data)
+        return serializer.data
@@ -0,0 +1,142 @@
+"""
+AuthLogWriter - Background batch writer for authentication audit logs
+
+@SPEC:AUTH-001
+@CODE:AUTH-LOG-WRITER
+
+Every login and logout writes an AuthLog row, so writing them one at a
+time puts an INSERT on every auth request. The writer queues the rows of
+successful events instead and a daemon thread inserts them with
+bulk_create, one statement per batch.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import List
+
+from django.db import close_old_connections
+
+from users.models import AuthLog
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum rows per bulk_create
+AUTH_LOG_BATCH_SIZE = 500
+
+# Seconds the writer waits for more rows before inserting a partial batch
+AUTH_LOG_FLUSH_INTERVAL = 0.1
+
+
+class AuthLogWriter:
+    """
+    Queue AuthLog rows and insert them in batches from a daemon thread.
+
+    @CODE:AUTH-LOG-WRITER
+
+    Rows keep the created_at set when the AuthLog was built, so the time
+    of the event is recorded rather than the time of the insert. Rows
+    still queued when the process exits normally are written by an atexit
+    hook; they are lost if the process is killed (SIGKILL, a worker timeout
+    or recycle), which is why failed logins bypass the writer.
+
+    Methods:
+        write(log): Queue an unsaved AuthLog for insertion
+        flush(): Insert every queued row in the calling thread
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def write(self, log: AuthLog) -> None:
+        """
+        Queue an unsaved AuthLog for insertion.
+
+        Args:
+            log: AuthLog instance (not saved)
+        """
+        self._start()
+        self._queue.put(log)
+
+    def flush(self) -> None:
+        """Insert every queued row in the calling thread."""
+        batch = self._drain()
+        while batch:
+            self._insert(batch)
+            batch = self._drain()
+
+    def _start(self) -> None:
+        """Start the writer thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='auth-log-writer',
+                    daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Collect batches of rows and insert them, forever."""
+        while True:
+            batch = [self._queue.get()]
+
+            # Keep collecting until the batch is full or the interval ends
+            deadline = time.monotonic() + AUTH_LOG_FLUSH_INTERVAL
+            while len(batch) < AUTH_LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._insert(batch)
+
+            # The thread keeps its own connection; honour CONN_MAX_AGE and
+            # health checks the way request handling does
+            close_old_connections()
+
+    def _drain(self) -> List[AuthLog]:
+        """Take up to AUTH_LOG_BATCH_SIZE queued rows without waiting."""
+        batch = []
+        while len(batch) < AUTH_LOG_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _insert(self, batch: List[AuthLog]) -> None:
+        """
+        Insert a batch of rows, logging rather than raising on failure.
+
+        If the batch INSERT fails, the rows are saved one at a time, so a
+        single bad row or a transient error does not drop the whole batch.
+        """
+        try:
+            AuthLog.objects.bulk_create(batch, batch_size=AUTH_LOG_BATCH_SIZE)
+        except Exception:
+            logger.exception('Failed to write %d auth log rows, retrying one by one', len(batch))
+        else:
+            return
+
+        for log in batch:
+            try:
+                log.save()
+            except Exception:
+                logger.exception('Dropped auth log row: %s', log)
+
+
+# Shared by every LoginUseCase in the process
+auth_log_writer = AuthLogWriter()
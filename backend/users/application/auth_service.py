@@ -16,14 +16,25 @@ BR-008: 60-minute token lifetime (configured in settings)
 BR-009: 5-failure account lock (15 minutes)
 """
 
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils.crypto import get_random_string
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from typing import Dict, Any, Optional
 
 from users.models import BlacklistedToken, AuthLog
+from users.application.auth_log_writer import auth_log_writer
+from users.application.refresh_lock import refresh_token_lock
 
 
 User = get_user_model()
@@ -40,9 +51,47 @@ class AuthErrorCodes:
     TOKEN_REFRESH_FAILED = 'AUTH-006'
 
 
-@dataclass
+# Cache key prefix for the access token last issued for a refresh token,
+# followed by the refresh token digest
+REFRESHED_ACCESS_TOKEN_PREFIX = 'refreshed:'
+
+# Seconds an issued access token is returned to repeated refreshes
+REFRESH_REUSE_WINDOW = 10
+
+# Seconds of validity an access token presented to refresh must have left
+# to be returned instead of a new one
+ACCESS_TOKEN_MIN_REMAINING = 30
+
+
+# User columns read by login: the auth checks plus _serialize_user()
+LOGIN_USER_FIELDS = (
+    'id',
+    'username',
+    'password',
+    'is_active',
+    'role',
+    'failed_login_attempts',
+    'account_locked_until',
+    'email',
+    'full_name',
+    'department',
+)
+
+
+@lru_cache(maxsize=None)
+def _dummy_password_hash() -> str:
+    """
+    Return a password hash to verify against when the username is unknown.
+
+    Hashed once per process with the default hasher, so checking against it
+    costs as much as checking a real user's password.
+    """
+    return make_password(get_random_string(32))
+
+
+@dataclass(slots=True)
 class AuthEventData:
-    """Data structure for authentication event logging."""
+    """Data structure for authentication event logging (one per auth event)."""
     username: str
     event_type: str
     ip_address: str
@@ -96,11 +145,15 @@ class LoginUseCase:
             Success: {'success': True, 'access_token': str, 'refresh_token': str, 'user': dict}
             Failure: {'success': False, 'error_code': str, 'message': str}
         """
-        # BR-003: User lookup by username
+        # BR-003: User lookup by username. Only the columns used for the
+        # auth decision and the response are loaded
         try:
-            user = User.objects.get(username=username)
+            user = User.objects.only(*LOGIN_USER_FIELDS).get(username=username)
         except User.DoesNotExist:
-            # Don't reveal whether username exists (security best practice)
+            # Don't reveal whether username exists (security best practice).
+            # Run one password hash anyway, so unknown usernames take as
+            # long to reject as wrong passwords
+            check_password(password, _dummy_password_hash())
             self._log_auth_event(AuthEventData(
                 username=username,
                 event_type='login_failed',
@@ -175,30 +228,35 @@ class LoginUseCase:
 
         # Login successful!
 
-        # BR-009: Reset failed login attempts on success
-        user.reset_failed_attempts()
-
-        # Update last login info
-        user.last_login = timezone.now()
-        user.last_login_ip = ip_address
-        user.save(update_fields=['last_login', 'last_login_ip'])
-
         # BR-005: JWT token generation
-        refresh = RefreshToken.for_user(user)
+        refresh = self._create_refresh_token(user)
+
+        # BR-009: Reset failed login attempts and record the login in a
+        # single UPDATE, committed together with the success audit log.
+        # A queued log (AUTH_LOG_BACKGROUND_WRITES) needs no transaction.
+        now = timezone.now()
+        with nullcontext() if settings.AUTH_LOG_BACKGROUND_WRITES else transaction.atomic():
+            User.objects.filter(pk=user.pk).update(
+                failed_login_attempts=0,
+                account_locked_until=None,
+                last_login=now,
+                last_login_ip=ip_address
+            )
 
-        # Add custom claims to token
-        refresh['role'] = user.role
-        refresh['username'] = user.username
+            # Create success audit log
+            self._log_auth_event(AuthEventData(
+                user=user,
+                username=username,
+                event_type='login_success',
+                ip_address=ip_address,
+                user_agent=user_agent,
+                success=True
+            ))
 
-        # Create success audit log
-        self._log_auth_event(AuthEventData(
-            user=user,
-            username=username,
-            event_type='login_success',
-            ip_address=ip_address,
-            user_agent=user_agent,
-            success=True
-        ))
+        user.failed_login_attempts = 0
+        user.account_locked_until = None
+        user.last_login = now
+        user.last_login_ip = ip_address
 
         return self._success_response({
             'access_token': str(refresh.access_token),
@@ -220,6 +278,7 @@ class LoginUseCase:
 
         Business Rules:
         - BR-006: Token blacklisting to prevent reuse
+        - Logging out twice with the same token succeeds both times
 
         Args:
             user: User object
@@ -238,13 +297,20 @@ class LoginUseCase:
                 tz=timezone.get_current_timezone()
             )
 
-            # Add to blacklist
-            BlacklistedToken.objects.create(
-                token=refresh_token,
-                user=user,
-                reason='logout',
-                expires_at=expires_at
-            )
+            # Add to blacklist. ON CONFLICT DO NOTHING makes a repeated or
+            # concurrent logout with the same token succeed instead of
+            # failing on the unique token_hash
+            token_hash = BlacklistedToken.hash_token(refresh_token)
+            BlacklistedToken.objects.bulk_create([
+                BlacklistedToken(
+                    token_hash=token_hash,
+                    user=user,
+                    reason='logout',
+                    expires_at=expires_at
+                )
+            ], ignore_conflicts=True)
+            BlacklistedToken.cache_token(token_hash, expires_at)
+            cache.delete(REFRESHED_ACCESS_TOKEN_PREFIX + token_hash)
 
             # Create logout audit log
             self._log_auth_event(AuthEventData(
@@ -271,7 +337,8 @@ class LoginUseCase:
 
     def refresh_access_token(
         self,
-        refresh_token: str
+        refresh_token: str,
+        access_token: Optional[AccessToken] = None
     ) -> Dict[str, Any]:
         """
         Generate new access token from refresh token.
@@ -281,9 +348,15 @@ class LoginUseCase:
         Business Rules:
         - BR-006: Check if refresh token is blacklisted
         - BR-008: Generate new access token with 60-minute lifetime
+        - Refreshes with the same token within REFRESH_REUSE_WINDOW
+          seconds return the same access token
+        - A current access token of the same user with more than
+          ACCESS_TOKEN_MIN_REMAINING seconds left is returned unchanged
 
         Args:
             refresh_token: JWT refresh token
+            access_token: Verified access token the client authenticated
+                with, if any
 
         Returns:
             Dict with new access token or error
@@ -295,35 +368,82 @@ class LoginUseCase:
                 'Token has been revoked'
             )
 
-        try:
-            token_obj = RefreshToken(refresh_token)
-
-            # Generate new access token
-            new_access_token = str(token_obj.access_token)
+        # Refreshing early (a second tab, a proactive timer) gets the
+        # access token the client already holds
+        if access_token is not None and self._access_token_still_fresh(access_token, refresh_token):
+            raw_token = access_token.token
+            if isinstance(raw_token, bytes):
+                raw_token = raw_token.decode()
+            return self._success_response({'access_token': raw_token})
+
+        # Concurrent refreshes with the same token take turns; the ones
+        # that waited return the access token the first one issued
+        token_hash = BlacklistedToken.hash_token(refresh_token)
+        issued_key = REFRESHED_ACCESS_TOKEN_PREFIX + token_hash
+        with refresh_token_lock(token_hash):
+            issued = cache.get(issued_key)
+            if issued is not None:
+                return self._success_response({'access_token': issued})
+
+            try:
+                token_obj = RefreshToken(refresh_token)
+
+                # Generate new access token
+                new_access_token = str(token_obj.access_token)
+            except TokenError as e:
+                return self._error_response(
+                    AuthErrorCodes.TOKEN_REFRESH_FAILED,
+                    f'Invalid token: {str(e)}'
+                )
+            except Exception as e:
+                return self._error_response(
+                    AuthErrorCodes.TOKEN_REFRESH_FAILED,
+                    f'Token refresh failed: {str(e)}'
+                )
 
-            return self._success_response({'access_token': new_access_token})
+            cache.set(issued_key, new_access_token, REFRESH_REUSE_WINDOW)
 
-        except TokenError as e:
-            return self._error_response(
-                AuthErrorCodes.TOKEN_REFRESH_FAILED,
-                f'Invalid token: {str(e)}'
-            )
-        except Exception as e:
-            return self._error_response(
-                AuthErrorCodes.TOKEN_REFRESH_FAILED,
-                f'Token refresh failed: {str(e)}'
-            )
+        return self._success_response({'access_token': new_access_token})
 
     # Helper methods
 
+    def _access_token_still_fresh(self, access_token: AccessToken, refresh_token: str) -> bool:
+        """
+        Check whether access_token can be returned instead of a new one.
+
+        Args:
+            access_token: Verified, unexpired access token
+            refresh_token: JWT refresh token being refreshed
+
+        Returns:
+            bool: True if both tokens belong to the same user and the access
+            token has more than ACCESS_TOKEN_MIN_REMAINING seconds left
+        """
+        try:
+            refresh = RefreshToken(refresh_token)
+        except TokenError:
+            return False
+
+        user_id_claim = jwt_settings.USER_ID_CLAIM
+        if access_token.get(user_id_claim) != refresh.get(user_id_claim):
+            return False
+
+        return access_token['exp'] - time.time() > ACCESS_TOKEN_MIN_REMAINING
+
     def _log_auth_event(self, event_data: AuthEventData):
         """
         Create authentication audit log entry.
 
+        With AUTH_LOG_BACKGROUND_WRITES enabled, successful events are
+        queued and inserted in batches by the background auth log writer,
+        so the request does not wait for the INSERT. Failed events are
+        always saved at once, since a queued row is lost if the worker is
+        killed before the writer runs.
+
         Args:
             event_data: AuthEventData object with all required fields
         """
-        AuthLog.objects.create(
+        log = AuthLog(
             user=event_data.user,
             username_attempted=event_data.username,
             event_type=event_data.event_type,
@@ -333,6 +453,36 @@ class LoginUseCase:
             failure_reason=event_data.failure_reason
         )
 
+        if settings.AUTH_LOG_BACKGROUND_WRITES and event_data.success:
+            auth_log_writer.write(log)
+        else:
+            log.save()
+
+    def _create_refresh_token(self, user: User) -> RefreshToken:
+        """
+        Create a refresh token carrying the user id, role and username.
+
+        RefreshToken.for_user() is not used: with the simplejwt
+        token_blacklist app installed it also signs the token and inserts
+        an OutstandingToken row, which nothing here reads (revoked tokens
+        are tracked in users.BlacklistedToken). Each token is then signed
+        once, when it is serialized for the response.
+
+        Args:
+            user: Authenticated user
+
+        Returns:
+            Unsigned RefreshToken
+        """
+        refresh = RefreshToken()
+        refresh[jwt_settings.USER_ID_CLAIM] = str(getattr(user, jwt_settings.USER_ID_FIELD))
+
+        # Add custom claims to token
+        refresh['role'] = user.role
+        refresh['username'] = user.username
+
+        return refresh
+
     def _error_response(self, error_code: str, message: str) -> Dict[str, Any]:
         """
         Create standardized error response.
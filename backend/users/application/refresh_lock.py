@@ -0,0 +1,67 @@
+"""
+refresh_lock - Per-token lock around access token refresh
+
+@SPEC:AUTH-001
+@CODE:AUTH-REFRESH-LOCK
+
+Clients often refresh twice at once with the same refresh token (a
+proactive timer racing a 401 interceptor, or two tabs). The lock lives in
+the shared cache (Redis in production), so sibling requests are serialized
+across workers and the later ones can reuse the access token the first one
+issued. Nothing is kept per process: each lock is a cache key that expires
+after REFRESH_LOCK_TTL, so abandoned locks cannot accumulate in memory.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.core.cache import cache
+from django.utils.crypto import get_random_string
+
+
+# Cache key prefix for refresh locks, followed by the refresh token digest
+REFRESH_LOCK_PREFIX = 'refresh_lock:'
+
+# Seconds before a lock whose holder died is released
+REFRESH_LOCK_TTL = 10
+
+# Seconds a request waits for the lock before refreshing without it
+REFRESH_LOCK_BLOCKING_TIMEOUT = 5
+
+# Seconds between attempts to take a held lock
+REFRESH_LOCK_POLL_INTERVAL = 0.05
+
+
+@contextmanager
+def refresh_token_lock(token_hash: str) -> Iterator[bool]:
+    """
+    Hold the refresh lock for one refresh token.
+
+    cache.add only sets a key that does not exist, atomically on Redis,
+    Memcached and the local-memory cache, so exactly one request holds
+    the lock at a time. A request that waits longer than
+    REFRESH_LOCK_BLOCKING_TIMEOUT goes ahead without the lock; refreshing
+    twice only costs a second signature.
+
+    Args:
+        token_hash: Digest of the refresh token (see BlacklistedToken.hash_token)
+
+    Yields:
+        bool: True if the lock was acquired
+    """
+    key = REFRESH_LOCK_PREFIX + token_hash
+    owner = get_random_string(16)
+    deadline = time.monotonic() + REFRESH_LOCK_BLOCKING_TIMEOUT
+
+    acquired = cache.add(key, owner, REFRESH_LOCK_TTL)
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(REFRESH_LOCK_POLL_INTERVAL)
+        acquired = cache.add(key, owner, REFRESH_LOCK_TTL)
+
+    try:
+        yield acquired
+    finally:
+        # Leave the key alone if it expired and another request took it
+        if acquired and cache.get(key) == owner:
+            cache.delete(key)
@@ -4,6 +4,7 @@ Django management command to create test users
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 
 User = get_user_model()
 
@@ -45,22 +46,42 @@ class Command(BaseCommand):
 
         self.stdout.write('Creating test users...\n')
 
+        # Check which users already exist with one query
+        existing = set(
+            User.objects
+            .filter(username__in=[user_data['username'] for user_data in test_users])
+            .values_list('username', flat=True)
+        )
+
+        new_users = []
         for user_data in test_users:
             username = user_data['username']
 
-            # Check if user already exists
-            if User.objects.filter(username=username).exists():
+            if username in existing:
                 self.stdout.write(self.style.WARNING(f'User "{username}" already exists. Skipping.'))
                 continue
 
-            # Create user
+            # Hash the password up front so every user is inserted at once
             password = user_data.pop('password')
-            user = User.objects.create(**user_data)
-            user.set_password(password)
-            user.is_active = True
-            user.save()
+            new_users.append(User(password=make_password(password), is_active=True, **user_data))
+
+        # Create users in a single INSERT
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+
+        # Rows skipped as conflicts (e.g. created concurrently) are not
+        # reported. Each password hash has its own salt, so a stored hash
+        # identifies a row inserted above
+        created = set(
+            User.objects
+            .filter(password__in=[user.password for user in new_users])
+            .values_list('username', flat=True)
+        )
 
-            self.stdout.write(self.style.SUCCESS(f'Created user "{username}" with role "{user.role}"'))
+        for user in new_users:
+            if user.username in created:
+                self.stdout.write(self.style.SUCCESS(f'Created user "{user.username}" with role "{user.role}"'))
+            else:
+                self.stdout.write(self.style.WARNING(f'User "{user.username}" could not be created. Skipping.'))
 
         self.stdout.write(self.style.SUCCESS('\n=== Test Users Created Successfully ==='))
         self.stdout.write('You can now login with:')
@@ -0,0 +1,42 @@
+"""
+Django management command to delete expired blacklisted tokens
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from users.models import BlacklistedToken
+
+
+# Rows removed per DELETE statement
+DEFAULT_BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = 'Delete blacklisted tokens that have expired (run hourly)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Rows deleted per statement (default {DEFAULT_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        # Expired tokens are rejected by JWT validation anyway, so their
+        # blacklist rows are no longer needed. Removing them keeps the
+        # token_hash index small enough to stay in memory.
+        now = timezone.now()
+        expired = BlacklistedToken.objects.filter(expires_at__lte=now)
+
+        # Delete in short batches found through the expires_at index, so a
+        # large backlog never holds locks for one long statement
+        deleted = 0
+        while True:
+            pks = list(expired.order_by().values_list('pk', flat=True)[:options['batch_size']])
+            if not pks:
+                break
+            deleted += BlacklistedToken.objects.filter(pk__in=pks).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired blacklisted tokens'))
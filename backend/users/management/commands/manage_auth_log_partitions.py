@@ -0,0 +1,53 @@
+"""
+Django management command to maintain the monthly auth_logs partitions
+
+Logs written for a month without a partition go to the default partition.
+When the command later creates that month's partition, those rows are
+moved out of the default partition into it (see users.partitions); run it
+daily so partitions exist before their month starts.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from users.partitions import (
+    AUTH_LOG_PARTITION_MONTHS_AHEAD,
+    add_months,
+    create_monthly_partitions,
+    drop_partitions_before,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming auth_logs partitions and drop expired ones (run daily)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=AUTH_LOG_PARTITION_MONTHS_AHEAD,
+            help=f'Months of partitions to create after the current one (default {AUTH_LOG_PARTITION_MONTHS_AHEAD})'
+        )
+        parser.add_argument(
+            '--retention-months',
+            type=int,
+            default=None,
+            help='Drop partitions older than this many months (default: keep all)'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write('auth_logs is only partitioned on PostgreSQL; nothing to do')
+            return
+
+        now = timezone.now()
+        create_monthly_partitions(now, add_months(now, options['months_ahead']))
+        self.stdout.write(self.style.SUCCESS(
+            f"auth_logs partitions ready through {add_months(month_start(now), options['months_ahead']):%Y-%m}"
+        ))
+
+        if options['retention_months'] is not None:
+            dropped = drop_partitions_before(add_months(month_start(now), -options['retention_months']))
+            self.stdout.write(self.style.SUCCESS(f'Dropped {len(dropped)} auth_logs partitions'))
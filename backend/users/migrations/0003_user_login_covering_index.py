@@ -0,0 +1,50 @@
+from django.db import migrations, models
+
+# Covering index for the login lookup (LOGIN_USER_FIELDS in
+# users.application.auth_service): every selected column is stored in the
+# index, so PostgreSQL can answer User.objects.only(...).get(username=...)
+# with an index-only scan. INCLUDE columns only exist on PostgreSQL; SQLite
+# (local development and tests) skips this migration.
+LOGIN_COVERING_INDEX = models.Index(
+    fields=['username'],
+    include=[
+        'id',
+        'password',
+        'is_active',
+        'role',
+        'failed_login_attempts',
+        'account_locked_until',
+        'email',
+        'full_name',
+        'department',
+    ],
+    name='users_login_covering_idx',
+)
+
+
+def add_login_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    User = apps.get_model('users', 'User')
+    schema_editor.add_index(User, LOGIN_COVERING_INDEX, concurrently=True)
+
+
+def remove_login_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    User = apps.get_model('users', 'User')
+    schema_editor.remove_index(User, LOGIN_COVERING_INDEX, concurrently=True)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_authlog_details'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_login_covering_index, remove_login_covering_index),
+    ]
@@ -0,0 +1,42 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def hash_existing_tokens(apps, schema_editor):
+    BlacklistedToken = apps.get_model('users', 'BlacklistedToken')
+    blacklisted = list(BlacklistedToken.objects.only('id', 'token'))
+    for entry in blacklisted:
+        entry.token_hash = hashlib.sha256(entry.token.encode()).hexdigest()
+    BlacklistedToken.objects.bulk_update(blacklisted, ['token_hash'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_login_covering_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blacklistedtoken',
+            name='blacklisted_token_d070ae_idx',
+        ),
+        migrations.AddField(
+            model_name='blacklistedtoken',
+            name='token_hash',
+            field=models.CharField(max_length=64, null=True),
+        ),
+        # Raw tokens cannot be recovered from their digests, so this step
+        # is not reversible
+        migrations.RunPython(hash_existing_tokens),
+        migrations.RemoveField(
+            model_name='blacklistedtoken',
+            name='token',
+        ),
+        migrations.AlterField(
+            model_name='blacklistedtoken',
+            name='token_hash',
+            field=models.CharField(help_text='SHA-256 hex digest of the JWT refresh token', max_length=64, unique=True),
+        ),
+    ]
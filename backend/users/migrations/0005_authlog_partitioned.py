@@ -0,0 +1,116 @@
+from django.db import migrations
+from django.utils import timezone
+
+from users.partitions import (
+    AUTH_LOG_PARTITION_MONTHS_AHEAD,
+    add_months,
+    create_default_partition,
+    create_monthly_partitions,
+)
+
+
+# Rebuild auth_logs as a table partitioned by RANGE (created_at), one
+# partition per month (see users.partitions). A partitioned table's primary
+# key must contain the partition key, so it becomes (id, created_at); id is
+# still unique because it comes from a single sequence. Existing rows are
+# copied into the new table, which locks auth_logs for the duration.
+# Declarative partitioning only exists on PostgreSQL; SQLite (local
+# development and tests) keeps the plain table.
+
+
+def _rebuild_auth_logs(apps, schema_editor, partitioned):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    AuthLog = apps.get_model('users', 'AuthLog')
+    opts = AuthLog._meta
+    quote_name = schema_editor.quote_name
+    table = quote_name(opts.db_table)
+    old_table = quote_name(opts.db_table + '_old')
+    pk = quote_name(opts.pk.column)
+    created_at = quote_name(opts.get_field('created_at').column)
+
+    schema_editor.execute(f'ALTER TABLE {table} RENAME TO {old_table}')
+
+    # LIKE copies the columns in order with their NOT NULL constraints, but
+    # no keys, indexes or identity
+    if partitioned:
+        schema_editor.execute(
+            f'CREATE TABLE {table} (LIKE {old_table}) PARTITION BY RANGE ({created_at})'
+        )
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(f'SELECT min({created_at}) FROM {old_table}')
+            oldest = cursor.fetchone()[0]
+        now = timezone.now()
+        create_monthly_partitions(
+            oldest or now,
+            add_months(now, AUTH_LOG_PARTITION_MONTHS_AHEAD),
+            connection=schema_editor.connection,
+            table=opts.db_table
+        )
+        create_default_partition(schema_editor.connection, table=opts.db_table)
+    else:
+        schema_editor.execute(f'CREATE TABLE {table} (LIKE {old_table})')
+
+    schema_editor.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+    schema_editor.execute(f'DROP TABLE {old_table}')
+
+    # Identity columns on partitioned tables need PostgreSQL 17, so the
+    # partitioned table draws ids from a sequence owned by the column
+    if partitioned:
+        sequence = quote_name(f'{opts.db_table}_{opts.pk.column}_seq')
+        schema_editor.execute(f'CREATE SEQUENCE {sequence} OWNED BY {table}.{pk}')
+        schema_editor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {pk} SET DEFAULT nextval('{sequence}')"
+        )
+        schema_editor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY ({pk}, {created_at})')
+    else:
+        schema_editor.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {pk} ADD GENERATED BY DEFAULT AS IDENTITY'
+        )
+        schema_editor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY ({pk})')
+
+    # Continue numbering after the copied rows
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{opts.db_table}', '{opts.pk.column}'), "
+        f'coalesce(max({pk}), 1), max({pk}) IS NOT NULL) FROM {table}'
+    )
+
+    # Indexes on a partitioned table are created on every partition. The
+    # foreign key and its index are recreated with explicit SQL rather
+    # than schema editor internals
+    user = opts.get_field('user')
+    user_column = quote_name(user.column)
+    schema_editor.execute(
+        f'CREATE INDEX {quote_name(f"{opts.db_table}_{user.column}_idx")} '
+        f'ON {table} ({user_column})'
+    )
+    for index in opts.indexes:
+        schema_editor.add_index(AuthLog, index)
+    target = user.target_field
+    schema_editor.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT '
+        f'{quote_name(f"{opts.db_table}_{user.column}_fk_{target.model._meta.db_table}_{target.column}")} '
+        f'FOREIGN KEY ({user_column}) '
+        f'REFERENCES {quote_name(target.model._meta.db_table)} ({quote_name(target.column)}) '
+        f'DEFERRABLE INITIALLY DEFERRED'
+    )
+
+
+def partition_auth_logs(apps, schema_editor):
+    _rebuild_auth_logs(apps, schema_editor, partitioned=True)
+
+
+def unpartition_auth_logs(apps, schema_editor):
+    _rebuild_auth_logs(apps, schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_blacklistedtoken_token_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_auth_logs, unpartition_auth_logs),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-16 00:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_authlog_partitioned'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='authlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='생성 시각'),
+        ),
+    ]
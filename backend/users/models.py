@@ -10,13 +10,22 @@ Models:
 - AuthLog: Security audit log for authentication events
 """
 
+import hashlib
+from typing import Iterable, Set
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 from datetime import timedelta
 from core.base_models import AbstractTimestampModel
 
 
+# Cache key prefix for blacklisted refresh tokens
+BLACKLIST_CACHE_PREFIX = 'bl:'
+
+
 class User(AbstractUser):
     """
     Custom User model extending AbstractUser with RBAC and security features.
@@ -114,21 +123,17 @@ class User(AbstractUser):
         """
         Check if account is currently locked due to failed login attempts.
 
+        Reads the in-memory fields only. An expired lockout is cleared by
+        the next write to the counters instead: a successful login resets
+        them, and increment_failed_attempts() starts a new count.
+
         Returns:
             bool: True if account is locked and lockout period hasn't expired
         """
-        if self.account_locked_until is None:
-            return False
-
-        # Check if lockout period has expired
-        if timezone.now() >= self.account_locked_until:
-            # Lockout expired, reset fields
-            self.account_locked_until = None
-            self.failed_login_attempts = 0
-            self.save(update_fields=['account_locked_until', 'failed_login_attempts'])
-            return False
-
-        return True
+        return (
+            self.account_locked_until is not None
+            and timezone.now() < self.account_locked_until
+        )
 
     def reset_failed_attempts(self):
         """Reset failed login attempts counter (called on successful login)."""
@@ -142,6 +147,11 @@ class User(AbstractUser):
 
         BR-009: Lock account for 15 minutes after 5 consecutive failures.
         """
+        # An expired lockout starts a new count
+        if self.account_locked_until is not None and not self.is_account_locked():
+            self.failed_login_attempts = 0
+            self.account_locked_until = None
+
         self.failed_login_attempts += 1
 
         # Lock account for 15 minutes after 5 failures
@@ -161,7 +171,8 @@ class BlacklistedToken(AbstractTimestampModel):
     to prevent reuse even if the token hasn't expired yet.
 
     Fields:
-        token: The JWT refresh token string (hashed)
+        token_hash: SHA-256 hex digest of the JWT refresh token (the token
+            itself is never stored)
         user: Reference to the user who owns this token
         reason: Reason for blacklisting (e.g., 'logout', 'password_change')
         expires_at: Token expiration timestamp
@@ -174,10 +185,10 @@ class BlacklistedToken(AbstractTimestampModel):
         ('admin_revoke', 'Admin Revocation'),
     ]
 
-    token = models.CharField(
-        max_length=500,
+    token_hash = models.CharField(
+        max_length=64,
         unique=True,
-        help_text="JWT refresh token (hashed)"
+        help_text="SHA-256 hex digest of the JWT refresh token"
     )
     user = models.ForeignKey(
         'User',
@@ -199,7 +210,6 @@ class BlacklistedToken(AbstractTimestampModel):
         db_table = 'blacklisted_tokens'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['token']),
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['expires_at']),
         ]
@@ -207,28 +217,110 @@ class BlacklistedToken(AbstractTimestampModel):
     def __str__(self):
         return f"Blacklisted token for {self.user.username} ({self.reason})"
 
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Return the SHA-256 hex digest stored for a token."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def cache_token(cls, token_hash: str, expires_at) -> None:
+        """
+        Remember a blacklisted token in the cache until it expires.
+
+        Args:
+            token_hash: Digest of the token (see hash_token)
+            expires_at: Token expiration timestamp
+        """
+        timeout = int((expires_at - timezone.now()).total_seconds())
+        if timeout > 0:
+            cache.set(BLACKLIST_CACHE_PREFIX + token_hash, 1, timeout)
+
     @classmethod
     def is_blacklisted(cls, token: str) -> bool:
         """
         Check if a token is blacklisted.
 
+        The cache is checked first; on a miss the database is queried and
+        the answer is written back to the cache. Blacklisted entries expire
+        with the token. "Not blacklisted" entries are only cached for
+        BLACKLIST_NEGATIVE_CACHE_TIMEOUT seconds when the cache is shared,
+        and are added with cache.add so they never replace an entry written
+        by a concurrent logout. Expired rows are removed by the
+        delete_expired_tokens management command.
+
+        Timing: the token is never compared directly. Both lookups use its
+        SHA-256 digest, and an attacker cannot steer a digest prefix, so
+        the early exit of a key or index comparison reveals nothing about
+        the token. Token signatures are checked by PyJWT with
+        hmac.compare_digest and passwords by Django's check_password,
+        both constant-time.
+
         Args:
             token: JWT refresh token string
 
         Returns:
             bool: True if token is blacklisted and not expired
         """
-        try:
-            blacklisted = cls.objects.get(token=token)
-            # Check if token blacklist entry is still valid
-            if timezone.now() < blacklisted.expires_at:
-                return True
-            # Token expired, can be deleted
-            blacklisted.delete()
-            return False
-        except cls.DoesNotExist:
+        token_hash = cls.hash_token(token)
+        cached = cache.get(BLACKLIST_CACHE_PREFIX + token_hash)
+        if cached is not None:
+            return bool(cached)
+
+        expires_at = cls.objects.filter(
+            token_hash=token_hash,
+            expires_at__gt=timezone.now()
+        ).values_list('expires_at', flat=True).first()
+        if expires_at is None:
+            cls._cache_not_blacklisted(token_hash)
             return False
 
+        cls.cache_token(token_hash, expires_at)
+        return True
+
+    @classmethod
+    def filter_blacklisted(cls, tokens: Iterable[str]) -> Set[str]:
+        """
+        Return the tokens among tokens that are blacklisted.
+
+        Batch form of is_blacklisted for callers checking several tokens at
+        once: one cache round trip, and at most one database query for the
+        tokens the cache does not know.
+
+        Args:
+            tokens: JWT refresh token strings
+
+        Returns:
+            set: The blacklisted, unexpired tokens
+        """
+        hashes = {cls.hash_token(token): token for token in tokens}
+        if not hashes:
+            return set()
+
+        cached = cache.get_many([BLACKLIST_CACHE_PREFIX + token_hash for token_hash in hashes])
+        blacklisted = {hashes[key[len(BLACKLIST_CACHE_PREFIX):]] for key, value in cached.items() if value}
+
+        missing = [token_hash for token_hash in hashes if BLACKLIST_CACHE_PREFIX + token_hash not in cached]
+        if missing:
+            rows = dict(cls.objects.filter(
+                token_hash__in=missing,
+                expires_at__gt=timezone.now()
+            ).values_list('token_hash', 'expires_at'))
+            for token_hash in missing:
+                if token_hash in rows:
+                    cls.cache_token(token_hash, rows[token_hash])
+                    blacklisted.add(hashes[token_hash])
+                else:
+                    cls._cache_not_blacklisted(token_hash)
+
+        return blacklisted
+
+    @staticmethod
+    def _cache_not_blacklisted(token_hash: str) -> None:
+        """Remember briefly that a token is not blacklisted (shared caches only)."""
+        timeout = settings.BLACKLIST_NEGATIVE_CACHE_TIMEOUT
+        if timeout:
+            cache.add(BLACKLIST_CACHE_PREFIX + token_hash, 0, timeout)
+
 
 class AuthLog(AbstractTimestampModel):
     """
@@ -239,6 +331,10 @@ class AuthLog(AbstractTimestampModel):
     Tracks all authentication-related events for security monitoring
     and compliance purposes.
 
+    On PostgreSQL the table is partitioned by month on created_at
+    (migration 0005, see users.partitions), so its primary key there is
+    (id, created_at).
+
     Fields:
         user: Reference to the user (null for failed login attempts)
         username_attempted: Username used in login attempt
@@ -247,6 +343,8 @@ class AuthLog(AbstractTimestampModel):
         user_agent: Browser user agent string
         success: Whether the event was successful
         failure_reason: Reason for failure (if applicable)
+        created_at: Time of the event, set when the instance is built so
+            queued logs keep it (see AuthLogWriter)
     """
 
     EVENT_CHOICES = [
@@ -297,6 +395,11 @@ class AuthLog(AbstractTimestampModel):
         blank=True,
         help_text="Additional details about the auth event (JSON)"
     )
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        help_text="생성 시각"
+    )
 
     class Meta:
         db_table = 'auth_logs'
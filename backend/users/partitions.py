@@ -0,0 +1,151 @@
+"""
+Monthly range partitions for the auth_logs table.
+
+@SPEC:AUTH-001
+@CODE:AUTH-LOG-PARTITIONS
+
+On PostgreSQL, auth_logs is partitioned by RANGE (created_at) with one
+partition per calendar month (UTC), plus a default partition so inserts
+never fail when no partition covers their month. Inserts and index updates
+only touch the current month's partition, and old months are removed with
+DROP TABLE instead of a DELETE over the whole log.
+
+Partitions are created ahead of time by the manage_auth_log_partitions
+command; see DEPLOYMENT.md for the schedule. PostgreSQL refuses to create
+a partition while the default partition holds rows for its range, so when
+rows have already landed there (the command did not run in time) the
+month's partition is created as a plain table, the rows are moved into it
+and it is then attached.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+from typing import List
+
+from django.db import connection as default_connection, transaction
+
+
+AUTH_LOG_TABLE = 'auth_logs'
+
+# Column auth_logs is partitioned by
+AUTH_LOG_PARTITION_KEY = 'created_at'
+
+# Months of partitions kept ready beyond the current one
+AUTH_LOG_PARTITION_MONTHS_AHEAD = 3
+
+
+def month_start(value: datetime) -> datetime:
+    """Return midnight UTC on the first day of value's month."""
+    value = value.astimezone(dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """Return the first day of the month count months after month."""
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime, table: str = AUTH_LOG_TABLE) -> str:
+    """Return the name of the partition holding month, e.g. auth_logs_y2024m01."""
+    return f'{table}_y{month.year}m{month.month:02d}'
+
+
+def create_monthly_partitions(first: datetime, last: datetime, connection=None,
+                              table: str = AUTH_LOG_TABLE) -> None:
+    """
+    Create the monthly partitions from first to last, inclusive.
+
+    Existing partitions are left alone. Rows of a new month already
+    stored in the default partition are moved into the month's partition.
+
+    Args:
+        first: Any time in the first month
+        last: Any time in the last month
+        connection: Database connection (default connection if omitted)
+        table: Partitioned parent table
+    """
+    connection = connection or default_connection
+    quote_name = connection.ops.quote_name
+    parent = quote_name(table)
+    default = quote_name(table + '_default')
+    key = quote_name(AUTH_LOG_PARTITION_KEY)
+    month = month_start(first)
+    last = month_start(last)
+
+    with connection.cursor() as cursor:
+        while month <= last:
+            partition = quote_name(partition_name(month, table))
+            next_month = add_months(month, 1)
+            bounds = f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+
+            cursor.execute(
+                'SELECT to_regclass(%s) IS NOT NULL, to_regclass(%s) IS NOT NULL',
+                [partition, default]
+            )
+            exists, has_default = cursor.fetchone()
+
+            if not exists and has_default:
+                # Rows in the default partition would block CREATE ... PARTITION
+                # OF, so the partition is filled first and attached afterwards
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute(f'CREATE TABLE {partition} (LIKE {parent})')
+                    cursor.execute(
+                        f'WITH moved AS (DELETE FROM {default} '
+                        f'WHERE {key} >= %s AND {key} < %s RETURNING *) '
+                        f'INSERT INTO {partition} SELECT * FROM moved',
+                        [month, next_month]
+                    )
+                    cursor.execute(f'ALTER TABLE {parent} ATTACH PARTITION {partition} {bounds}')
+            elif not exists:
+                cursor.execute(f'CREATE TABLE {partition} PARTITION OF {parent} {bounds}')
+
+            month = next_month
+
+
+def create_default_partition(connection=None, table: str = AUTH_LOG_TABLE) -> None:
+    """Create the partition for rows outside every monthly partition."""
+    connection = connection or default_connection
+    quote_name = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {quote_name(table + "_default")} '
+            f'PARTITION OF {quote_name(table)} DEFAULT'
+        )
+
+
+def drop_partitions_before(month: datetime, connection=None,
+                           table: str = AUTH_LOG_TABLE) -> List[str]:
+    """
+    Drop the monthly partitions for months before month.
+
+    Args:
+        month: Any time in the oldest month to keep
+        connection: Database connection (default connection if omitted)
+        table: Partitioned parent table
+
+    Returns:
+        Names of the dropped partitions
+    """
+    connection = connection or default_connection
+    quote_name = connection.ops.quote_name
+    cutoff = partition_name(month_start(month), table)
+    prefix = f'{table}_y'
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+            'WHERE parent.relname = %s',
+            [table]
+        )
+        # Names sort by month: the year has four digits and the month two
+        dropped = sorted(
+            name for (name,) in cursor.fetchall()
+            if name.startswith(prefix) and name < cutoff
+        )
+        for name in dropped:
+            cursor.execute(f'DROP TABLE {quote_name(name)}')
+
+    return dropped
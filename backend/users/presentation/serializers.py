@@ -13,6 +13,13 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+# BR-001: ASCII letters, digits and underscore only. \Z (unlike $) does not
+# accept a trailing newline
+USERNAME_PATTERN = re.compile(r'\A[a-zA-Z0-9_]+\Z')
+
+# LoginSerializer fields defaulted from the request (see LoginSerializer.validate)
+CLIENT_INFO_FIELDS = ('ip_address', 'user_agent')
+
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -69,7 +76,7 @@ class LoginSerializer(serializers.Serializer):
             ValidationError: If username contains invalid characters
         """
         # Allow alphanumeric and underscore
-        if not re.match(r'^[a-zA-Z0-9_]+$', value):
+        if not USERNAME_PATTERN.match(value):
             raise serializers.ValidationError(
                 "Username must contain only alphanumeric characters and underscores"
             )
@@ -90,6 +97,29 @@ class LoginSerializer(serializers.Serializer):
         # Additional password complexity rules can be added here if needed
         return value
 
+    def validate(self, attrs):
+        """
+        Fill in client info the request body did not provide.
+
+        The view passes the detected ip_address and user_agent in the
+        serializer context; they are validated like submitted values.
+
+        Args:
+            attrs: Validated fields
+
+        Returns:
+            Validated fields with client info
+        """
+        for name in CLIENT_INFO_FIELDS:
+            if name in self.initial_data or name not in self.context:
+                continue
+            try:
+                attrs[name] = self.fields[name].run_validation(self.context[name])
+            except serializers.ValidationError as e:
+                raise serializers.ValidationError({name: e.detail})
+
+        return attrs
+
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -7,9 +7,13 @@ Authentication ViewSets
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.contrib.auth import get_user_model
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import never_cache
+from rest_framework_simplejwt.tokens import AccessToken
 
 from users.presentation.serializers import (
     LoginSerializer,
@@ -17,10 +21,34 @@ from users.presentation.serializers import (
     LogoutSerializer,
     TokenRefreshSerializer
 )
-from users.application.auth_service import LoginUseCase
+from users.application.auth_service import AuthErrorCodes, LoginUseCase
 
 User = get_user_model()
 
+# HTTP status for each LoginUseCase error code; other codes are 400
+ERROR_CODE_STATUS = {
+    AuthErrorCodes.INVALID_CREDENTIALS: status.HTTP_401_UNAUTHORIZED,
+    AuthErrorCodes.INACTIVE_ACCOUNT: status.HTTP_403_FORBIDDEN,
+    AuthErrorCodes.ACCOUNT_LOCKED: status.HTTP_403_FORBIDDEN,
+    AuthErrorCodes.TOKEN_REVOKED: status.HTTP_401_UNAUTHORIZED,
+    AuthErrorCodes.TOKEN_REFRESH_FAILED: status.HTTP_401_UNAUTHORIZED,
+}
+
+
+def error_status(error_code) -> int:
+    """Return the HTTP status for a LoginUseCase error code."""
+    return ERROR_CODE_STATUS.get(error_code, status.HTTP_400_BAD_REQUEST)
+
+
+# LoginUseCase keeps no state between calls, so one instance serves every
+# request
+_login_use_case = LoginUseCase()
+
+
+class UserPagination(PageNumberPagination):
+    """Page size for the user listing (50 users per page)."""
+    page_size = 50
+
 
 class AuthViewSet(viewsets.ViewSet):
     """
@@ -45,28 +73,8 @@ class AuthViewSet(viewsets.ViewSet):
             return [AllowAny()]
         return [IsAuthenticated()]
 
-    def get_client_info(self, request):
-        """
-        Extract client IP and user agent from request.
-
-        Args:
-            request: HTTP request object
-
-        Returns:
-            tuple: (ip_address, user_agent)
-        """
-        # Get real IP from X-Forwarded-For if behind proxy
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip_address = x_forwarded_for.split(',')[0].strip()
-        else:
-            ip_address = request.META.get('REMOTE_ADDR', '0.0.0.0')
-
-        user_agent = request.META.get('HTTP_USER_AGENT', '')
-
-        return ip_address, user_agent
-
     @action(detail=False, methods=['post'], url_path='login')
+    @method_decorator(never_cache)
     def login(self, request):
         """
         User login endpoint.
@@ -89,24 +97,19 @@ class AuthViewSet(viewsets.ViewSet):
             401: Invalid credentials
             403: Account locked or inactive
         """
-        # Get client info
-        ip_address, user_agent = self.get_client_info(request)
+        # Client info resolved by ClientInfoMiddleware
+        ip_address, user_agent = request.client_ip, request.client_user_agent
 
-        # Add client info to request data
-        data = request.data.copy()
-        if 'ip_address' not in data:
-            data['ip_address'] = ip_address
-        if 'user_agent' not in data:
-            data['user_agent'] = user_agent
-
-        # Validate request data
-        serializer = LoginSerializer(data=data)
+        # Validate request data; client info fills in fields the body omits
+        serializer = LoginSerializer(
+            data=request.data,
+            context={'ip_address': ip_address, 'user_agent': user_agent}
+        )
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         # Execute login use case
-        use_case = LoginUseCase()
-        result = use_case.login(
+        result = _login_use_case.login(
             username=serializer.validated_data['username'],
             password=serializer.validated_data['password'],
             ip_address=serializer.validated_data['ip_address'],
@@ -115,21 +118,13 @@ class AuthViewSet(viewsets.ViewSet):
 
         # Map error codes to HTTP status codes
         if not result['success']:
-            error_code = result.get('error_code')
-
-            if error_code in ['AUTH-001']:  # Invalid credentials
-                return Response(result, status=status.HTTP_401_UNAUTHORIZED)
-            elif error_code in ['AUTH-002']:  # Inactive account
-                return Response(result, status=status.HTTP_403_FORBIDDEN)
-            elif error_code in ['AUTH-003']:  # Account locked
-                return Response(result, status=status.HTTP_403_FORBIDDEN)
-            else:
-                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            return Response(result, status=error_status(result.get('error_code')))
 
         # Success response
         return Response(result, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['post'], url_path='logout', permission_classes=[IsAuthenticated])
+    @method_decorator(never_cache)
     def logout(self, request):
         """
         User logout endpoint.
@@ -148,8 +143,8 @@ class AuthViewSet(viewsets.ViewSet):
             400: Validation error
             401: Unauthorized (not authenticated)
         """
-        # Get client info
-        ip_address, user_agent = self.get_client_info(request)
+        # Client info resolved by ClientInfoMiddleware
+        ip_address, user_agent = request.client_ip, request.client_user_agent
 
         # Validate request data
         serializer = LogoutSerializer(data=request.data)
@@ -157,8 +152,7 @@ class AuthViewSet(viewsets.ViewSet):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         # Execute logout use case
-        use_case = LoginUseCase()
-        result = use_case.logout(
+        result = _login_use_case.logout(
             user=request.user,
             refresh_token=serializer.validated_data['refresh_token'],
             ip_address=ip_address,
@@ -171,6 +165,7 @@ class AuthViewSet(viewsets.ViewSet):
         return Response(result, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['post'], url_path='refresh')
+    @method_decorator(never_cache)
     def refresh(self, request):
         """
         Refresh access token endpoint.
@@ -184,6 +179,10 @@ class AuthViewSet(viewsets.ViewSet):
             "refresh_token": "string"
         }
 
+        Headers:
+            Authorization: Bearer <access token> (optional; returned as is
+            while it has more than 30 seconds left)
+
         Returns:
             200: New access token generated
             400: Validation error
@@ -194,19 +193,15 @@ class AuthViewSet(viewsets.ViewSet):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        # Execute token refresh use case
-        use_case = LoginUseCase()
-        result = use_case.refresh_access_token(
-            refresh_token=serializer.validated_data['refresh_token']
+        # Execute token refresh use case. request.auth is the access token
+        # JWTAuthentication verified from the Authorization header, if sent
+        result = _login_use_case.refresh_access_token(
+            refresh_token=serializer.validated_data['refresh_token'],
+            access_token=request.auth if isinstance(request.auth, AccessToken) else None
         )
 
         if not result['success']:
-            error_code = result.get('error_code')
-
-            if error_code in ['AUTH-005', 'AUTH-006']:  # Token revoked or invalid
-                return Response(result, status=status.HTTP_401_UNAUTHORIZED)
-            else:
-                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            return Response(result, status=error_status(result.get('error_code')))
 
         return Response(result, status=status.HTTP_200_OK)
 
@@ -225,6 +220,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = UserPagination
 
     def get_queryset(self):
         """
@@ -232,11 +228,38 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
 
         Admin: Can see all users
         Others: Can only see themselves
+
+        Only the serialized columns are loaded, so password hashes and
+        lockout fields are never read.
         """
         user = self.request.user
+        users = User.objects.only(*UserSerializer.Meta.fields)
 
         if user.is_admin():
-            return User.objects.all()
+            return users
 
         # Non-admin users can only see themselves
-        return User.objects.filter(id=user.id)
+        return users.filter(id=user.id)
+
+    def list(self, request, *args, **kwargs):
+        """
+        List users as plain rows.
+
+        The page is read with values() instead of as User instances, and
+        each column goes through its UserSerializer field, so the output
+        matches UserSerializer without building a model and serializer
+        per row.
+        """
+        fields = UserSerializer().fields
+        rows = self.paginate_queryset(
+            self.filter_queryset(self.get_queryset()).values(*fields)
+        )
+
+        data = [
+            {
+                name: None if row[name] is None else field.to_representation(row[name])
+                for name, field in fields.items()
+            }
+            for row in rows
+        ]
+        return self.get_paginated_response(data)
@@ -14,11 +14,14 @@ from users.presentation.views import AuthViewSet, UserViewSet
 router = DefaultRouter()
 
 # Register viewsets
-# Note: We use basename for ViewSet (non-ModelViewSet)
-router.register(r'auth', AuthViewSet, basename='auth')
 router.register(r'users', UserViewSet, basename='users')
 
-# URL patterns
+# URL patterns. The auth endpoints are plain path() entries ahead of the
+# router, so they resolve without the router's regex and format-suffix
+# patterns; the names match what the router generated
 urlpatterns = [
+    path('auth/login/', AuthViewSet.as_view({'post': 'login'}), name='auth-login'),
+    path('auth/logout/', AuthViewSet.as_view({'post': 'logout'}), name='auth-logout'),
+    path('auth/refresh/', AuthViewSet.as_view({'post': 'refresh'}), name='auth-refresh'),
     path('', include(router.urls)),
 ]